@@ -0,0 +1,77 @@
+"""Compare full json.loads parsing of an actionsdata file with the selective reader.
+
+Reports wall time and peak traced memory for each path on one large file. Both
+paths build the same ``ActionRecord`` list, so only the reading differs.
+
+Usage: python benchmarks/bench_actionsdata_parse.py [--actions N] [--entities N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from synthetic_actions import build_actionsdata_file
+
+from shortcuts_mcp.action_records import ActionRecord
+from shortcuts_mcp.actions import (
+    _parse_actionsdata_entries,  # pyright: ignore[reportPrivateUsage]
+    _scan_actionsdata_paths,  # pyright: ignore[reportPrivateUsage]
+)
+
+
+def _full_parse(path: Path) -> list[ActionRecord]:
+    """The previous path: read the whole text and build the full object tree."""
+    payload = json.loads(path.read_text())
+    return _parse_actionsdata_entries(payload["actions"].items(), source="apps")
+
+
+def _selective_parse(path: Path) -> list[ActionRecord]:
+    return _scan_actionsdata_paths([path], source="apps")
+
+
+def _measure(
+    label: str, parse: Callable[[Path], list[ActionRecord]], path: Path
+) -> list[ActionRecord]:
+    timings: list[float] = []
+    for _ in range(5):
+        start = time.perf_counter()
+        parse(path)
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    actions = parse(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<10} median={statistics.median(timings):8.1f}ms "
+        f"peak={peak / 1024 / 1024:7.1f}MiB actions={len(actions)}"
+    )
+    return actions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actions", type=int, default=1500)
+    parser.add_argument("--entities", type=int, default=3000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_actionsdata_file(
+            Path(tmp) / "extract.actionsdata",
+            "com.vendor.Big",
+            args.actions,
+            args.entities,
+        )
+        print(f"file size: {path.stat().st_size / 1024 / 1024:.1f}MiB")
+        full = _measure("full", _full_parse, path)
+        selective = _measure("selective", _selective_parse, path)
+        assert full == selective, "the two paths disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Report retained bytes per catalog action for pydantic models and compact records.
+
+The "models" form mirrors the previous catalog storage: one ActionInfo per
+action, built from freshly decoded JSON so every instance owns its strings.
+The "records" form is what ActionCatalog keeps now.
+
+Usage: python benchmarks/bench_catalog_memory.py [--frameworks N] [--apps N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from synthetic_actions import build_action_tree
+
+from shortcuts_mcp.actions import (
+    _scan_actionsdata_paths,  # pyright: ignore[reportPrivateUsage]
+)
+from shortcuts_mcp.models import ActionInfo
+
+_T = TypeVar("_T")
+
+
+def _retained(build: Callable[[], list[_T]]) -> tuple[list[_T], int]:
+    """Build a list and return it with the bytes still allocated afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    items = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return items, current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frameworks", type=int, default=150)
+    parser.add_argument("--apps", type=int, default=60)
+    parser.add_argument("--actions-per-file", type=int, default=40)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        system_root, apps_root = build_action_tree(
+            Path(tmp), args.frameworks, args.apps, args.actions_per_file
+        )
+        paths = sorted(system_root.rglob("extract.actionsdata")) + sorted(
+            apps_root.rglob("extract.actionsdata")
+        )
+
+        # Records first, so the shared pools are charged to them.
+        records, record_bytes = _retained(
+            lambda: _scan_actionsdata_paths(paths, source="system")
+        )
+        dumped = json.dumps([record.to_dict() for record in records])
+        models, model_bytes = _retained(
+            lambda: [ActionInfo.model_validate(item) for item in json.loads(dumped)]
+        )
+
+    count = len(records)
+    assert count == len(models)
+    print(f"actions: {count}")
+    print(f"models   {model_bytes / count:8.0f} B/action {model_bytes / 2**20:7.1f}MiB")
+    print(
+        f"records  {record_bytes / count:8.0f} B/action {record_bytes / 2**20:7.1f}MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measure full versus incremental ActionCatalog refreshes on a fake tree.
+
+Usage: python benchmarks/bench_catalog_refresh.py [--frameworks N] [--apps N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_actions import build_action_tree
+from synthetic_db import build_database
+
+from shortcuts_mcp import database
+from shortcuts_mcp.actions import ActionCatalog
+
+
+async def _timed_refresh(label: str, catalog: ActionCatalog) -> None:
+    start = time.perf_counter()
+    actions, _ = await catalog.get_all_actions(force_refresh=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(
+        f"{label:<22} {elapsed:9.1f}ms  {len(actions)} actions  {catalog.refresh_stats}"
+    )
+
+
+async def _run(frameworks: int, apps: int, per_file: int, shortcuts: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        system_root, apps_root = build_action_tree(root, frameworks, apps, per_file)
+        os.environ["SHORTCUTS_SYSTEM_ACTION_ROOTS"] = str(system_root)
+        os.environ["SHORTCUTS_APP_ACTION_ROOTS"] = str(apps_root)
+        os.environ["SHORTCUTS_CACHE_DIR"] = str(root / "cache")
+        os.environ["SHORTCUTS_DB_PATH"] = str(
+            build_database(root / "Shortcuts.sqlite", shortcuts)
+        )
+
+        catalog = ActionCatalog()
+        await _timed_refresh("cold refresh", catalog)
+        await _timed_refresh("unchanged refresh", catalog)
+
+        touched = sorted(system_root.glob("*/Metadata.appintents/*"))[:5]
+        for path in touched:
+            os.utime(path, ns=(path.stat().st_atime_ns, time.time_ns()))
+        await _timed_refresh(f"{len(touched)} files touched", catalog)
+        await database.close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frameworks", type=int, default=300)
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--actions-per-file", type=int, default=20)
+    parser.add_argument("--shortcuts", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.frameworks, args.apps, args.actions_per_file, args.shortcuts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure ActionCatalog cold-start time with and without the on-disk snapshot.
+
+Each measurement uses a fresh ActionCatalog, as after a server restart, and
+fetches one page the way ``get_available_actions`` does, so it is not
+dominated by converting every action to a model.
+
+Usage: python benchmarks/bench_catalog_snapshot.py [--frameworks N] [--apps N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_actions import build_action_tree
+from synthetic_db import build_database
+
+from shortcuts_mcp import database
+from shortcuts_mcp.actions import ActionCatalog
+from shortcuts_mcp.parser import actions_cache
+
+
+async def _cold_start_ms(snapshot: bool, repeats: int) -> list[float]:
+    os.environ["SHORTCUTS_CATALOG_SNAPSHOT"] = "1" if snapshot else "0"
+    samples: list[float] = []
+    for _ in range(repeats):
+        actions_cache.clear()
+        start = time.perf_counter()
+        await ActionCatalog().get_action_page(limit=100)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def _run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        system_root, apps_root = build_action_tree(
+            root, args.frameworks, args.apps, args.actions_per_file
+        )
+        os.environ["SHORTCUTS_SYSTEM_ACTION_ROOTS"] = str(system_root)
+        os.environ["SHORTCUTS_APP_ACTION_ROOTS"] = str(apps_root)
+        os.environ["SHORTCUTS_CACHE_DIR"] = str(root / "cache")
+        os.environ["SHORTCUTS_DB_PATH"] = str(
+            build_database(root / "Shortcuts.sqlite", args.shortcuts)
+        )
+
+        # Populate the snapshot once, as a previous server run would have.
+        os.environ["SHORTCUTS_CATALOG_SNAPSHOT"] = "1"
+        await ActionCatalog().get_all_actions()
+
+        medians: list[float] = []
+        for label, snapshot in [("no snapshot", False), ("snapshot", True)]:
+            samples = await _cold_start_ms(snapshot, args.repeats)
+            medians.append(statistics.median(samples))
+            print(f"{label:<12} median={medians[-1]:8.1f}ms min={min(samples):8.1f}ms")
+        print(f"speedup: {medians[0] / medians[1]:.1f}x")
+        size = sum(path.stat().st_size for path in (root / "cache").iterdir())
+        print(f"snapshot size: {size / 1024:.0f} KiB")
+        await database.close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frameworks", type=int, default=300)
+    parser.add_argument("--apps", type=int, default=100)
+    parser.add_argument("--actions-per-file", type=int, default=20)
+    parser.add_argument("--shortcuts", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare per-call latency of pooled connections against connect-per-call.
+
+Usage: python benchmarks/bench_db_pool.py [--shortcuts N] [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import aiosqlite
+from synthetic_db import build_database
+
+from shortcuts_mcp import database
+
+
+async def _unpooled_shortcut_by_name(name: str) -> object:
+    """The pre-pool behavior: a fresh connection for every query."""
+    uri = f"file:{database.get_db_path()}?mode=ro"
+    async with aiosqlite.connect(uri, uri=True) as conn:
+        conn.row_factory = aiosqlite.Row
+        cursor = await conn.execute(
+            "SELECT Z_PK, ZNAME FROM ZSHORTCUT WHERE ZNAME = ? LIMIT 1", [name]
+        )
+        return await cursor.fetchone()
+
+
+async def _pooled_shortcut_by_name(name: str) -> object:
+    return await database.get_shortcut_by_name(name)
+
+
+async def _measure(
+    label: str, call: Callable[[str], Awaitable[object]], name: str, iterations: int
+) -> None:
+    await call(name)  # warm-up
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call(name)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(
+        f"{label:<10} mean={statistics.fmean(samples):9.1f}us "
+        f"p50={statistics.median(samples):9.1f}us p95={p95:9.1f}us"
+    )
+
+
+async def _run(shortcut_count: int, iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_database(Path(tmp) / "Shortcuts.sqlite", shortcut_count)
+        os.environ["SHORTCUTS_DB_PATH"] = str(path)
+        rows = await database.get_all_shortcuts()
+        name = rows[len(rows) // 2].name
+        print(f"{shortcut_count} shortcuts, {iterations} lookups")
+        await _measure("unpooled", _unpooled_shortcut_by_name, name, iterations)
+        await _measure("pooled", _pooled_shortcut_by_name, name, iterations)
+        await database.close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shortcuts", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(_run(args.shortcuts, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
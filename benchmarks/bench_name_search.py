@@ -0,0 +1,78 @@
+"""Compare name search through SQL LIKE with the in-memory trigram index.
+
+Reports median latency per query on a synthetic library, plus how many
+results each path finds for exact, misspelled and reordered queries.
+
+Usage: python benchmarks/bench_name_search.py [--shortcuts N] [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_db import build_database
+
+from shortcuts_mcp import database
+from shortcuts_mcp.name_index import ShortcutNameIndex
+
+QUERIES = ["Weather Focus", "wether focsu", "focus weather", "Journal 1234"]
+
+
+async def _like_us(query: str, iterations: int) -> tuple[float, int]:
+    found = await database.search_shortcuts_by_name(query)
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await database.search_shortcuts_by_name(query)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples), len(found)
+
+
+def _index_us(index: ShortcutNameIndex, query: str, iterations: int) -> float:
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        index.search(query, limit=20)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+async def _run(shortcut_count: int, iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = build_database(Path(tmp) / "Shortcuts.sqlite", shortcut_count)
+        os.environ["SHORTCUTS_DB_PATH"] = str(path)
+        index = ShortcutNameIndex()
+        start = time.perf_counter()
+        await index.refresh()
+        print(
+            f"{shortcut_count} shortcuts, index built in "
+            f"{(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        for query in QUERIES:
+            like_us, like_found = await _like_us(query, iterations)
+            index_us = _index_us(index, query, iterations)
+            top = index.search(query, limit=1)
+            best = f"{top[0].name} ({top[0].score})" if top else "-"
+            print(
+                f"{query!r:<18} like={like_us:8.1f}us found={like_found:<5} "
+                f"index={index_us:8.1f}us top={best}"
+            )
+        await database.close_pool()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shortcuts", type=int, default=20_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args.shortcuts, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
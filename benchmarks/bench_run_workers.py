@@ -0,0 +1,95 @@
+"""Compare spawn-per-call shortcut runs with the persistent worker pool.
+
+A stand-in ``osascript`` (a Python script placed first on PATH) answers both
+the one-shot ``-e`` form and the worker protocol, so the numbers show the
+per-run process and compile overhead the pool removes, not Shortcuts itself.
+The stand-in can optionally pay a fixed startup cost to mimic script
+compilation.
+
+Usage: python benchmarks/bench_run_workers.py [--runs N] [--workers N]
+    [--startup-ms N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from shortcuts_mcp.executor import Execution, run_via_applescript
+from shortcuts_mcp.workers import OsascriptWorkerPool
+
+STAND_IN = """\
+import json, os, re, sys, time
+
+time.sleep(float(os.environ.get("BENCH_STARTUP_MS", "0")) / 1000)
+if sys.argv[1:3] == ["-l", "JavaScript"]:
+    for line in sys.stdin:
+        request = json.loads(line)
+        reply = {"id": request["id"], "ok": True}
+        if request["op"] == "run":
+            reply["output"] = request["name"]
+        print(json.dumps(reply), flush=True)
+else:
+    print(re.search(r'shortcut named "([^"]*)"', sys.argv[-1]).group(1))
+"""
+
+Runner = Callable[[str, str], Awaitable[Execution]]
+
+
+async def _measure(run: Runner, runs: int, parallel: int) -> tuple[float, float]:
+    """Median ms per run, and runs per second with ``parallel`` in flight."""
+    samples: list[float] = []
+    for index in range(runs):
+        start = time.perf_counter()
+        await run(f"Bench {index}", "input")
+        samples.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    for offset in range(0, runs, parallel):
+        count = min(parallel, runs - offset)
+        await asyncio.gather(*(run(f"Bench {i}", "input") for i in range(count)))
+    throughput = runs / (time.perf_counter() - start)
+    return statistics.median(samples), throughput
+
+
+async def _run(runs: int, workers: int) -> None:
+    pool = OsascriptWorkerPool(size=workers)
+    try:
+        # Warm the pool so process startup is not part of the steady state.
+        await asyncio.gather(*(pool.run("Warm") for _ in range(workers)))
+        for label, run in (("spawn per call", run_via_applescript), ("pool", pool.run)):
+            median_ms, throughput = await _measure(run, runs, workers)
+            print(
+                f"{label:>15}: {median_ms:7.2f}ms median, "
+                f"{throughput:8.1f} runs/s with {workers} in flight"
+            )
+        print(f"pool processes started: {pool.spawned}")
+    finally:
+        await pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--startup-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "osascript"
+        script.write_text(f"#!{sys.executable}\n{STAND_IN}")
+        script.chmod(0o755)
+        os.environ["PATH"] = f"{tmp}{os.pathsep}{os.environ.get('PATH', '')}"
+        os.environ["BENCH_STARTUP_MS"] = str(args.startup_ms)
+        asyncio.run(_run(args.runs, args.workers))
+
+
+if __name__ == "__main__":
+    main()
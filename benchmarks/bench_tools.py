@@ -0,0 +1,209 @@
+"""Time the read-only server tools end to end against a synthetic library.
+
+Builds a ``Shortcuts.sqlite`` (or uses ``--db``) plus a small actionsdata
+tree, points ``SHORTCUTS_DB_PATH`` and the action roots at them, and calls
+``list_shortcuts``, ``get_shortcut``, ``search_shortcuts`` and
+``get_available_actions`` the way an MCP client would. For each case it
+records the first (cold) call, the median and p95 of warm calls, and the
+tracemalloc peak of one warm call.
+
+Results can be saved as a baseline and compared against one later; cases
+whose median or peak memory grew by more than ``--tolerance`` (and whose
+median grew by at least ``--min-delta-ms``, to ignore timer noise on fast
+calls) are reported and make the script exit with status 1. Baselines are
+only comparable on the same machine with the same options.
+
+Usage: python benchmarks/bench_tools.py [--shortcuts N] [--iterations N]
+    [--max-actions N] [--text-words N] [--db PATH]
+    [--baseline PATH] [--save-baseline PATH] [--tolerance F] [--min-delta-ms F]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from synthetic_actions import build_action_tree
+from synthetic_db import build_database
+
+from shortcuts_mcp import database, server
+from shortcuts_mcp.search_index import action_index
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "tools.json"
+
+Case = tuple[str, Callable[[], Awaitable[object]]]
+
+
+def _cases(name: str) -> list[Case]:
+    word = name.split()[0].lower()
+    return [
+        ("list_shortcuts", lambda: server.list_shortcuts()),
+        ("list_shortcuts page", lambda: server.list_shortcuts(limit=50)),
+        (
+            "list_shortcuts actions",
+            lambda: server.list_shortcuts(include_actions=True),
+        ),
+        ("get_shortcut", lambda: server.get_shortcut(name)),
+        ("search_shortcuts name", lambda: server.search_shortcuts(word)),
+        (
+            "search_shortcuts actions",
+            lambda: server.search_shortcuts(word, search_in="actions"),
+        ),
+        ("get_available_actions", lambda: server.get_available_actions(limit=100)),
+        (
+            "get_available_actions search",
+            lambda: server.get_available_actions(search="performs", limit=20),
+        ),
+    ]
+
+
+async def _measure(
+    call: Callable[[], Awaitable[object]], iterations: int
+) -> dict[str, float]:
+    start = time.perf_counter()
+    await call()
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    samples: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+
+    # Traced separately: tracemalloc slows allocation-heavy calls several-fold.
+    tracemalloc.start()
+    try:
+        await call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cold_ms": round(cold_ms, 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)], 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+async def _run(args: argparse.Namespace, tmp: Path) -> dict[str, object]:
+    db_path: Path = args.db or build_database(
+        tmp / "Shortcuts.sqlite",
+        args.shortcuts,
+        max_actions=args.max_actions,
+        text_words=args.text_words,
+    )
+    system_root, apps_root = build_action_tree(
+        tmp / "actions", frameworks=20, apps=10, actions_per_file=25
+    )
+    os.environ["SHORTCUTS_DB_PATH"] = str(db_path)
+    os.environ["SHORTCUTS_CACHE_DIR"] = str(tmp / "cache")
+    os.environ["SHORTCUTS_SYSTEM_ACTION_ROOTS"] = str(system_root)
+    os.environ["SHORTCUTS_APP_ACTION_ROOTS"] = str(apps_root)
+
+    rows = await database.get_all_shortcuts()
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for label, call in _cases(rows[len(rows) // 2].name):
+            results[label] = await _measure(call, args.iterations)
+            print(
+                f"{label:<30} cold={results[label]['cold_ms']:9.2f}ms "
+                f"median={results[label]['median_ms']:9.2f}ms "
+                f"p95={results[label]['p95_ms']:9.2f}ms "
+                f"peak={results[label]['peak_kib']:10.1f}KiB"
+            )
+    finally:
+        await action_index.close()
+        await database.close_pool()
+
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss //= 1024
+    print(f"max RSS: {max_rss / 1024:.1f} MiB")
+    return {
+        "config": {
+            "shortcuts": len(rows),
+            "iterations": args.iterations,
+            "max_actions": args.max_actions,
+            "text_words": args.text_words,
+            "db": str(args.db) if args.db else None,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "max_rss_kib": max_rss,
+        "results": results,
+    }
+
+
+def _compare(
+    current: dict[str, object],
+    baseline: dict[str, object],
+    tolerance: float,
+    min_delta_ms: float,
+) -> bool:
+    """Print changes against ``baseline``; returns whether anything regressed."""
+    if current["config"] != baseline["config"]:
+        print("warning: baseline was recorded with different options")
+    now = current["results"]
+    before = baseline["results"]
+    assert isinstance(now, dict) and isinstance(before, dict)
+    regressed = False
+    print(f"\ncompared with baseline (tolerance {tolerance:.0%}):")
+    for label, old in before.items():
+        new = now.get(label)
+        if new is None:
+            print(f"{label:<30} missing")
+            continue
+        notes: list[str] = []
+        for key in ("median_ms", "peak_kib"):
+            ratio = new[key] / old[key] if old[key] else 1.0
+            flag = ratio > 1 + tolerance
+            if key == "median_ms":
+                flag &= new[key] - old[key] >= min_delta_ms
+            regressed |= flag
+            notes.append(f"{key}={ratio:5.2f}x{' REGRESSION' if flag else ''}")
+        print(f"{label:<30} {'  '.join(notes)}")
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shortcuts", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--max-actions", type=int, default=30)
+    parser.add_argument("--text-words", type=int, default=8)
+    parser.add_argument("--db", type=Path, help="use an existing database")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        current = asyncio.run(_run(args, Path(tmp)))
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"baseline saved to {args.save_baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        if _compare(current, baseline, args.tolerance, args.min_delta_ms):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
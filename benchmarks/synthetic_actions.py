@@ -0,0 +1,92 @@
+"""Build fake ``extract.actionsdata`` trees for catalog benchmarks."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+
+def _action_entry(rng: random.Random, identifier: str) -> dict[str, object]:
+    return {
+        "identifier": identifier,
+        "fullyQualifiedTypeName": identifier.rsplit(".", 1)[-1],
+        "title": {"key": identifier.rsplit(".", 1)[-1]},
+        "descriptionMetadata": {
+            "descriptionText": {"key": f"Performs {identifier}"},
+            "searchKeywords": [{"key": f"keyword {n}"} for n in range(8)],
+        },
+        "parameters": [
+            {
+                "name": f"param{n}",
+                "title": {"key": f"Parameter {n}"},
+                "valueType": {"primitiveType": rng.choice(["String", "Int", "Bool"])},
+                "isOptional": bool(n % 2),
+            }
+            for n in range(rng.randint(0, 6))
+        ],
+        "availabilityAnnotations": {
+            "LNPlatformNameMACOS": {"introducedVersion": "14.0"},
+            "LNPlatformNameIOS": {"introducedVersion": "17.0"},
+        },
+        # Sections the catalog never reads, present to mimic real file sizes.
+        "outputType": {"wrapper": {"typeIdentifier": 1}},
+        "requiredCapabilities": [],
+        "presentationStyle": 0,
+        "authenticationPolicy": 0,
+        "typeSpecificMetadata": ["LNActionMetadataKey" + str(n) for n in range(24)],
+    }
+
+
+def build_actionsdata_file(
+    path: Path, prefix: str, actions: int, entities: int = 0, seed: int = 0
+) -> Path:
+    """Write one actionsdata file, optionally padded with unread entity metadata."""
+    rng = random.Random(seed)
+    payload = {
+        "version": 1,
+        "actions": {
+            f"Action{n}": _action_entry(rng, f"{prefix}.Action{n}")
+            for n in range(actions)
+        },
+        "entities": {
+            f"Entity{n}": {
+                "typeName": f"{prefix}.Entity{n}",
+                "properties": [
+                    {"identifier": f"property{m}", "title": {"key": f"Property {m}"}}
+                    for m in range(12)
+                ],
+            }
+            for n in range(entities)
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload))
+    return path
+
+
+def build_action_tree(
+    root: Path, frameworks: int, apps: int, actions_per_file: int, seed: int = 0
+) -> tuple[Path, Path]:
+    """Create system and app roots laid out like macOS; returns both roots."""
+    rng = random.Random(seed)
+    system_root = root / "PrivateFrameworks"
+    apps_root = root / "Applications"
+    targets = [
+        (system_root / f"Framework{n}.framework", f"com.apple.Framework{n}")
+        for n in range(frameworks)
+    ] + [
+        (apps_root / f"App{n}.app/Contents/Resources", f"com.vendor.App{n}")
+        for n in range(apps)
+    ]
+    for directory, prefix in targets:
+        path = directory / "Metadata.appintents" / "extract.actionsdata"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        actions = {
+            f"Action{n}": _action_entry(rng, f"{prefix}.Action{n}")
+            for n in range(actions_per_file)
+        }
+        path.write_text(json.dumps({"version": 1, "actions": actions}))
+    system_root.mkdir(parents=True, exist_ok=True)
+    apps_root.mkdir(parents=True, exist_ok=True)
+    return system_root, apps_root
@@ -0,0 +1,177 @@
+"""Build synthetic ``Shortcuts.sqlite`` files for benchmarks.
+
+The layout follows the Core Data store macOS ships: shortcuts in
+``ZSHORTCUT``, one binary-plist actions blob per shortcut in
+``ZSHORTCUTACTIONS`` and folders in ``ZCOLLECTION``. Modification dates are
+seconds since the Cocoa epoch (2001-01-01 UTC). Output is deterministic for a
+given seed.
+
+Usage: python benchmarks/synthetic_db.py OUTPUT [--shortcuts N]
+    [--max-actions N] [--text-words N] [--folders N] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import plistlib
+import random
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+SCHEMA = """
+    CREATE TABLE ZSHORTCUT (
+        Z_PK INTEGER PRIMARY KEY,
+        ZNAME VARCHAR,
+        ZACTIONCOUNT INTEGER,
+        ZMODIFICATIONDATE TIMESTAMP,
+        ZWORKFLOWID BLOB
+    );
+    CREATE TABLE ZSHORTCUTACTIONS (
+        Z_PK INTEGER PRIMARY KEY,
+        ZSHORTCUT INTEGER,
+        ZDATA BLOB
+    );
+    CREATE INDEX ZSHORTCUTACTIONS_ZSHORTCUT_INDEX ON ZSHORTCUTACTIONS (ZSHORTCUT);
+    CREATE TABLE ZCOLLECTION (
+        Z_PK INTEGER PRIMARY KEY,
+        ZIDENTIFIER VARCHAR,
+        ZTEMPORARYSYNCFOLDERNAME VARCHAR
+    );
+"""
+
+ACTION_IDENTIFIERS = [
+    "is.workflow.actions.gettext",
+    "is.workflow.actions.comment",
+    "is.workflow.actions.delay",
+    "is.workflow.actions.sendemail",
+    "is.workflow.actions.getvariable",
+    "is.workflow.actions.setvariable",
+    "is.workflow.actions.conditional",
+    "is.workflow.actions.repeat.each",
+    "com.apple.ShortcutsActions.CreateNoteAction",
+    "com.apple.mobiletimer-framework.MobileTimerIntents.MTCreateAlarmIntent",
+]
+
+WORDS = [
+    "morning", "evening", "email", "note", "timer", "photo", "music", "home",
+    "work", "backup", "weather", "calendar", "reminder", "journal", "focus",
+]  # fmt: skip
+
+# 2019-01-05 to 2025-09-20 in seconds since 2001-01-01.
+MODIFIED_RANGE = (568_000_000.0, 780_000_000.0)
+
+_BATCH_SIZE = 1000
+
+
+def _action(rng: random.Random, text_words: int) -> dict[str, object]:
+    identifier = rng.choice(ACTION_IDENTIFIERS)
+    parameters: dict[str, object] = {
+        "UUID": str(uuid.UUID(int=rng.getrandbits(128))).upper(),
+        "WFTextActionText": " ".join(rng.choices(WORDS, k=text_words)),
+    }
+    if identifier.endswith(("getvariable", "setvariable")):
+        # Variable references are nested dictionaries in real shortcuts.
+        parameters["WFVariable"] = {
+            "Value": {"Type": "Variable", "VariableName": rng.choice(WORDS)},
+            "WFSerializationType": "WFTextTokenAttachment",
+        }
+    elif identifier.endswith(("conditional", "repeat.each")):
+        parameters["GroupingIdentifier"] = str(uuid.UUID(int=rng.getrandbits(128)))
+        parameters["WFControlFlowMode"] = rng.randint(0, 2)
+    return {
+        "WFWorkflowActionIdentifier": identifier,
+        "WFWorkflowActionParameters": parameters,
+    }
+
+
+def _actions_blob(rng: random.Random, action_count: int, text_words: int = 8) -> bytes:
+    actions = [_action(rng, text_words) for _ in range(action_count)]
+    return plistlib.dumps(actions, fmt=plistlib.FMT_BINARY)
+
+
+def _rows(
+    rng: random.Random, shortcut_count: int, max_actions: int, text_words: int
+) -> Iterator[tuple[tuple[object, ...], tuple[object, ...]]]:
+    for pk in range(1, shortcut_count + 1):
+        action_count = rng.randint(1, max_actions)
+        name = " ".join(rng.choices(WORDS, k=3)).title() + f" {pk}"
+        shortcut = (
+            pk,
+            name,
+            action_count,
+            rng.uniform(*MODIFIED_RANGE),
+            uuid.UUID(int=rng.getrandbits(128)).bytes,
+        )
+        yield shortcut, (pk, _actions_blob(rng, action_count, text_words))
+
+
+def build_database(
+    path: Path,
+    shortcut_count: int,
+    seed: int = 0,
+    *,
+    max_actions: int = 30,
+    text_words: int = 8,
+    folders: int = 2,
+) -> Path:
+    """Create a database with ``shortcut_count`` shortcuts at ``path``.
+
+    Each shortcut gets 1 to ``max_actions`` actions; ``text_words`` sets the
+    length of each action's text parameter and so the blob sizes. ``folders``
+    counts the system collections, Root and ShareSheet, first.
+    """
+    rng = random.Random(seed)
+    path.unlink(missing_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        rows = _rows(rng, shortcut_count, max_actions, text_words)
+        while batch := [row for _, row in zip(range(_BATCH_SIZE), rows)]:
+            conn.executemany(
+                "INSERT INTO ZSHORTCUT VALUES (?, ?, ?, ?, ?)",
+                [shortcut for shortcut, _ in batch],
+            )
+            conn.executemany(
+                "INSERT INTO ZSHORTCUTACTIONS (ZSHORTCUT, ZDATA) VALUES (?, ?)",
+                [actions for _, actions in batch],
+            )
+        collections = [("Root", None), ("ShareSheet", None)] + [
+            (str(uuid.UUID(int=rng.getrandbits(128))).upper(), f"Folder {n}")
+            for n in range(1, folders - 1)
+        ]
+        conn.executemany(
+            "INSERT INTO ZCOLLECTION (ZIDENTIFIER, ZTEMPORARYSYNCFOLDERNAME) "
+            "VALUES (?, ?)",
+            collections[: max(folders, 0)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--shortcuts", type=int, default=2000)
+    parser.add_argument("--max-actions", type=int, default=30)
+    parser.add_argument("--text-words", type=int, default=8)
+    parser.add_argument("--folders", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    path = build_database(
+        args.output,
+        args.shortcuts,
+        args.seed,
+        max_actions=args.max_actions,
+        text_words=args.text_words,
+        folders=args.folders,
+    )
+    print(f"{path}: {args.shortcuts} shortcuts, {path.stat().st_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
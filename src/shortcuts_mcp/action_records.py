@@ -0,0 +1,304 @@
+"""Compact in-memory form of action catalog entries.
+
+The catalog holds thousands of actions for the lifetime of the server, and
+most of their strings repeat: categories, sources, parameter value types,
+platform keys and versions, and often whole parameter lists. ``ActionRecord``
+and ``ParameterRecord`` are slotted, immutable records whose strings are
+interned and whose parameter tuples and availability pairs are shared between
+actions. They are converted to the pydantic models only at the API boundary.
+
+``RecordEncoder`` and ``RecordDecoder`` turn records into JSON-ready rows and
+back, keeping that sharing: parameter lists and availabilities are written
+once to tables that the rows refer to by index.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, cast
+
+from .models import ActionInfo, ActionParameter, ActionSource
+
+# Platform name -> introduced version, as pairs so it can be shared.
+Availability = tuple[tuple[str, str], ...]
+
+# Pools of shared values. Entries are few (distinct parameter shapes and
+# availability sets), so they are kept for the life of the process.
+_parameters: dict[ParameterRecord, ParameterRecord] = {}
+_parameter_lists: dict[tuple[ParameterRecord, ...], tuple[ParameterRecord, ...]] = {}
+_availabilities: dict[Availability, Availability] = {}
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+@dataclass(frozen=True, slots=True)
+class ParameterRecord:
+    name: str
+    title: str | None
+    value_type: str
+    is_optional: bool
+    description: str | None
+
+    def to_model(self) -> ActionParameter:
+        return ActionParameter(
+            name=self.name,
+            title=self.title,
+            value_type=self.value_type,
+            is_optional=self.is_optional,
+            description=self.description,
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "title": self.title,
+            "value_type": self.value_type,
+            "is_optional": self.is_optional,
+            "description": self.description,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ActionRecord:
+    identifier: str
+    source: ActionSource
+    title: str | None
+    description: str | None
+    category: str
+    parameters: tuple[ParameterRecord, ...]
+    platform_availability: Availability | None
+    usage_count: int
+    example_params: dict[str, object] | None
+
+    @classmethod
+    def from_model(cls, action: ActionInfo) -> ActionRecord:
+        return action_record(
+            identifier=action.identifier,
+            source=action.source,
+            title=action.title,
+            description=action.description,
+            category=action.category,
+            parameters=[
+                parameter_record(
+                    name=parameter.name,
+                    title=parameter.title,
+                    value_type=parameter.value_type,
+                    is_optional=parameter.is_optional,
+                    description=parameter.description,
+                )
+                for parameter in action.parameters
+            ],
+            platform_availability=action.platform_availability,
+            usage_count=action.usage_count,
+            example_params=action.example_params,
+        )
+
+    def to_model(self) -> ActionInfo:
+        return ActionInfo(
+            identifier=self.identifier,
+            source=self.source,
+            title=self.title,
+            description=self.description,
+            category=self.category,
+            parameters=[parameter.to_model() for parameter in self.parameters],
+            platform_availability=self._availability_dict(),
+            usage_count=self.usage_count,
+            example_params=(
+                dict(self.example_params) if self.example_params is not None else None
+            ),
+        )
+
+    def to_dict(
+        self, include_parameters: bool = True, include_examples: bool = True
+    ) -> dict[str, object]:
+        """Same shape as ``ActionInfo.model_dump()``, optionally trimmed."""
+        return {
+            "identifier": self.identifier,
+            "source": self.source,
+            "title": self.title,
+            "description": self.description,
+            "category": self.category,
+            "parameters": (
+                [parameter.to_dict() for parameter in self.parameters]
+                if include_parameters
+                else []
+            ),
+            "platform_availability": self._availability_dict(),
+            "usage_count": self.usage_count,
+            "example_params": (
+                dict(self.example_params)
+                if include_examples and self.example_params is not None
+                else None
+            ),
+        }
+
+    def _availability_dict(self) -> dict[str, str] | None:
+        if self.platform_availability is None:
+            return None
+        return dict(self.platform_availability)
+
+
+def parameter_record(
+    name: str,
+    title: str | None,
+    value_type: str,
+    is_optional: bool,
+    description: str | None,
+) -> ParameterRecord:
+    """Return the shared record for a parameter with these values."""
+    record = ParameterRecord(
+        name=sys.intern(name),
+        title=_intern(title),
+        value_type=sys.intern(value_type),
+        is_optional=is_optional,
+        description=_intern(description),
+    )
+    return _parameters.setdefault(record, record)
+
+
+def action_record(
+    identifier: str,
+    source: ActionSource,
+    title: str | None,
+    description: str | None,
+    category: str,
+    parameters: Iterable[ParameterRecord] = (),
+    platform_availability: Mapping[str, str] | None = None,
+    usage_count: int = 0,
+    example_params: dict[str, object] | None = None,
+) -> ActionRecord:
+    """Build a record, interning its strings and sharing repeated parts.
+
+    Identifiers and descriptions are nearly always unique, so they are stored
+    as given rather than interned.
+    """
+    return ActionRecord(
+        identifier=identifier,
+        source=source,
+        title=_intern(title),
+        description=description,
+        category=sys.intern(category),
+        parameters=_shared_parameters(parameters),
+        platform_availability=_shared_availability(platform_availability),
+        usage_count=usage_count,
+        example_params=example_params,
+    )
+
+
+def _shared_parameters(
+    parameters: Iterable[ParameterRecord],
+) -> tuple[ParameterRecord, ...]:
+    parameter_list = tuple(parameters)
+    return _parameter_lists.setdefault(parameter_list, parameter_list)
+
+
+def _shared_availability(
+    platform_availability: Mapping[str, str] | None,
+) -> Availability | None:
+    if platform_availability is None:
+        return None
+    pairs = tuple(
+        (sys.intern(platform), sys.intern(version))
+        for platform, version in platform_availability.items()
+    )
+    return _availabilities.setdefault(pairs, pairs)
+
+
+class RecordEncoder:
+    """Encodes records as rows for ``RecordDecoder``.
+
+    A row is ``[identifier, source, title, description, category, parameters,
+    availability, usage_count, example_params]`` where ``parameters`` and
+    ``availability`` index the lists returned by ``tables()``.
+    """
+
+    def __init__(self) -> None:
+        self._parameter_lists: dict[tuple[ParameterRecord, ...], int] = {}
+        self._availabilities: dict[Availability | None, int] = {}
+
+    def row(self, record: ActionRecord) -> list[object]:
+        parameters = self._parameter_lists.setdefault(
+            record.parameters, len(self._parameter_lists)
+        )
+        availability = self._availabilities.setdefault(
+            record.platform_availability, len(self._availabilities)
+        )
+        return [
+            record.identifier,
+            record.source,
+            record.title,
+            record.description,
+            record.category,
+            parameters,
+            availability,
+            record.usage_count,
+            record.example_params,
+        ]
+
+    def tables(self) -> dict[str, list[object]]:
+        """The shared tables for the rows encoded so far."""
+        return {
+            "parameter_lists": [
+                [
+                    [
+                        parameter.name,
+                        parameter.title,
+                        parameter.value_type,
+                        parameter.is_optional,
+                        parameter.description,
+                    ]
+                    for parameter in parameters
+                ]
+                for parameters in self._parameter_lists
+            ],
+            "availabilities": [
+                None if availability is None else dict(availability)
+                for availability in self._availabilities
+            ],
+        }
+
+
+class RecordDecoder:
+    """Rebuilds records from ``RecordEncoder`` rows and tables.
+
+    The input is trusted rather than validated; rows or tables of the wrong
+    shape raise ``KeyError``, ``IndexError``, ``TypeError`` or ``ValueError``.
+    """
+
+    def __init__(self, tables: Mapping[str, Any]) -> None:
+        self._parameter_lists: list[tuple[ParameterRecord, ...]] = [
+            _shared_parameters(parameter_record(*item) for item in parameters)
+            for parameters in tables["parameter_lists"]
+        ]
+        self._availabilities: list[Availability | None] = [
+            _shared_availability(availability)
+            for availability in tables["availabilities"]
+        ]
+
+    def record(self, row: Sequence[Any]) -> ActionRecord:
+        (
+            identifier,
+            source,
+            title,
+            description,
+            category,
+            parameters,
+            availability,
+            usage_count,
+            example_params,
+        ) = row
+        return ActionRecord(
+            identifier=identifier,
+            source=cast(ActionSource, sys.intern(source)),
+            title=_intern(title),
+            description=description,
+            category=sys.intern(category),
+            parameters=self._parameter_lists[cast(int, parameters)],
+            platform_availability=self._availabilities[cast(int, availability)],
+            usage_count=usage_count,
+            example_params=example_params,
+        )
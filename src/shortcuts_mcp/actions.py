@@ -1,22 +1,165 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
+import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Iterable, Mapping, cast
-
-from .database import get_all_shortcuts, get_shortcut_actions
-from .models import ActionInfo, ActionParameter, ActionSource
-from .parser import parse_actions
+from typing import Callable, Iterable, Mapping, ParamSpec, TypeVar, cast
+
+from . import __version__
+from .action_records import (
+    ActionRecord,
+    ParameterRecord,
+    RecordDecoder,
+    RecordEncoder,
+    action_record,
+    parameter_record,
+)
+from .actionsdata import iter_action_entries, read_actionsdata_text
+from .catalog_index import ActionPage, CatalogIndex
+from .config import (
+    get_app_action_roots,
+    get_cache_dir,
+    get_catalog_snapshot_enabled,
+    get_db_path,
+    get_scan_workers,
+    get_system_action_roots,
+)
+from .database import get_shortcut_versions, iter_actions_by_pks, library_changes
+from .metrics import metrics
+from .models import ActionInfo, ActionSource, ShortcutAction
+from .parser import actions_cache
 from .types import JsonValue
 
+SYSTEM_ACTIONSDATA_PATTERNS = ("*/Metadata.appintents/extract.actionsdata",)
+APP_ACTIONSDATA_PATTERNS = (
+    "*.app/Contents/Resources/Metadata.appintents/extract.actionsdata",
+    "*.app/Resources/Metadata.appintents/extract.actionsdata",
+)
 
-class ActionCatalog:
-    """Manages action discovery and caching."""
+# (st_mtime_ns, st_size) of an actionsdata file when it was last parsed.
+FileFingerprint = tuple[int, int]
+
+# Refresh counters that mean the on-disk snapshot no longer matches.
+_SNAPSHOT_CHANGE_KEYS = (
+    "roots_changed",
+    "files_parsed",
+    "files_removed",
+    "shortcuts_parsed",
+    "shortcuts_removed",
+)
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# Bump when the snapshot layout or the actionsdata parsing changes.
+SNAPSHOT_FORMAT = 2
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _scan_executor() -> ThreadPoolExecutor:
+    """Bounded pool for blocking filesystem and parsing work during refreshes."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_scan_workers(), thread_name_prefix="shortcuts-scan"
+        )
+    return _executor
+
+
+async def _run_blocking(
+    func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _scan_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+@dataclass
+class _SourceFile:
+    source: ActionSource
+    fingerprint: FileFingerprint
+    actions: list[ActionRecord]
+
+
+@dataclass
+class _LibraryShortcut:
+    modified_at: str | None
+    usage_counts: dict[str, int] = field(default_factory=dict[str, int])
+    example_params: dict[str, dict[str, object]] = field(
+        default_factory=dict[str, dict[str, object]]
+    )
+
+
+@dataclass
+class _RootListing:
+    mtime_ns: int
+    paths: list[Path]
+
+
+@dataclass
+class _Snapshot:
+    """Per-source state as read back from a catalog snapshot."""
+
+    listings: dict[tuple[ActionSource, Path], _RootListing]
+    files: dict[Path, _SourceFile]
+    library: dict[int, _LibraryShortcut]
 
-    _cache: dict[str, ActionInfo] | None = None
-    _cache_time: float = 0.0
+
+class ActionCatalog:
+    """Manages action discovery and caching.
+
+    Refreshes are incremental: actionsdata files are re-parsed only when their
+    mtime or size changes, and library shortcuts only when their modification
+    date does. Sources that disappeared are dropped.
+
+    After each refresh the per-source results and their fingerprints are saved
+    to a snapshot in the cache directory. A cold start loads that snapshot and
+    re-validates it by stat-ing the recorded roots and files, so nothing is
+    re-globbed or re-parsed unless it changed.
+
+    Globbing, stat calls and parsing run in a bounded thread pool so a refresh
+    never blocks the event loop; changed files are parsed concurrently.
+
+    Queries go through a CatalogIndex rebuilt lazily whenever ``version``
+    changes, i.e. once per refresh. Once loaded, the catalog is served from
+    memory and refreshed only when ``library_changes`` reports that the
+    Shortcuts library changed, or on ``force_refresh``.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[str, ActionRecord] | None = None
+        self._cache_time = 0.0
+        self._source_files: dict[Path, _SourceFile] = {}
+        self._seen_paths: set[Path] = set()
+        self._library: dict[int, _LibraryShortcut] = {}
+        self._root_listings: dict[tuple[ActionSource, Path], _RootListing] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._index: CatalogIndex | None = None
+        self._index_version = -1
+        self.version = 0
+        self.refresh_stats: dict[str, int] = {}
+        self._library_stale = False
+        library_changes.subscribe(self._mark_library_stale)
+
+    def _mark_library_stale(self) -> None:
+        self._library_stale = True
+
+    @property
+    def size(self) -> int:
+        """Number of actions currently loaded."""
+        return len(self._cache) if self._cache else 0
 
     async def get_all_actions(
         self,
@@ -24,53 +167,126 @@ class ActionCatalog:
         category: str | None = None,
         search: str | None = None,
         force_refresh: bool = False,
+        limit: int | None = None,
     ) -> tuple[list[ActionInfo], bool]:
-        cached = False
-        if self._cache is None or force_refresh:
-            await self._refresh_cache()
-        else:
-            cached = True
-
-        actions = list(self._cache.values()) if self._cache else []
-
-        if source is not None:
-            actions = [item for item in actions if item.source == source]
-
-        if category is not None:
-            category_lower = category.lower()
-            actions = [
-                item
-                for item in actions
-                if item.category.lower() == category_lower
-                or item.identifier.lower().startswith(category_lower)
-            ]
-
+        """Filter the catalog; with ``search``, results are ranked best first."""
+        cached = await self._ensure_cache(force_refresh)
+        index = self._current_index()
+        mask = index.filter_mask(source=source, category=category)
         if search:
-            query = search.lower()
-
-            def matches(action: ActionInfo) -> bool:
-                haystack = " ".join(
-                    part
-                    for part in [
-                        action.identifier,
-                        action.title or "",
-                        action.description or "",
-                    ]
-                    if part
-                ).lower()
-                return query in haystack
-
-            actions = [item for item in actions if matches(item)]
-
-        return actions, cached
-
-    async def _refresh_cache(self) -> None:
-        system_actions = await self._scan_system_actions()
-        app_actions = await self._scan_app_actions()
+            ranked = index.search(search, mask=mask, limit=limit)
+            return [record.to_model() for record, _ in ranked], cached
+        records = index.select(mask)
+        if limit is not None:
+            records = records[:limit]
+        return [record.to_model() for record in records], cached
+
+    async def get_action_page(
+        self,
+        source: ActionSource | None = None,
+        category: str | None = None,
+        search: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        include_parameters: bool = True,
+        include_examples: bool = False,
+        force_refresh: bool = False,
+    ) -> tuple[ActionPage, bool]:
+        """Like ``get_all_actions`` but returns one page of serialized actions."""
+        cached = await self._ensure_cache(force_refresh)
+        index = self._current_index()
+        page = index.page(
+            index.filter_mask(source=source, category=category),
+            search=search,
+            offset=offset,
+            limit=limit,
+            include_parameters=include_parameters,
+            include_examples=include_examples,
+        )
+        return page, cached
+
+    async def search(
+        self,
+        query: str,
+        source: ActionSource | None = None,
+        category: str | None = None,
+        limit: int | None = 20,
+    ) -> list[tuple[ActionInfo, float]]:
+        """Return the ``limit`` best matches for ``query`` with their BM25 scores."""
+        await self.get_all_actions()
+        index = self._current_index()
+        mask = index.filter_mask(source=source, category=category)
+        ranked = index.search(query, mask=mask, limit=limit)
+        return [(record.to_model(), score) for record, score in ranked]
+
+    async def _ensure_cache(self, force_refresh: bool) -> bool:
+        """Load or refresh the catalog; returns whether it was already cached."""
+        if force_refresh:
+            async with self._refresh_lock:
+                await self._refresh_cache()
+            return False
+        if self._cache is not None:
+            await library_changes.check()
+            if not self._library_stale:
+                metrics.increment("catalog.cache_hits")
+                return True
+        async with self._refresh_lock:
+            # Another caller may have finished the cold start meanwhile.
+            if self._cache is not None and not self._library_stale:
+                metrics.increment("catalog.cache_hits")
+                return True
+            if self._cache is not None:
+                # Shortcuts changed; unchanged files and roots are reused.
+                await self._refresh_cache(rescan=False)
+                return False
+            # Trust unchanged root directories from the snapshot instead of
+            # globbing them again; force_refresh always re-globs.
+            await self._load_snapshot()
+            await self._refresh_cache(rescan=False)
+        return False
+
+    def _current_index(self) -> CatalogIndex:
+        if self._index is None or self._index_version != self.version:
+            self._index = CatalogIndex(
+                list(self._cache.values()) if self._cache else []
+            )
+            self._index_version = self.version
+        return self._index
+
+    async def _refresh_cache(self, rescan: bool = True) -> None:
+        with metrics.timer("catalog.refresh"):
+            await self._rebuild_cache(rescan)
+        for key, value in self.refresh_stats.items():
+            metrics.increment(f"catalog.{key}", value)
+
+    async def _rebuild_cache(self, rescan: bool) -> None:
+        # Changes seen from here on are not covered by this refresh.
+        await library_changes.check()
+        self._library_stale = False
+        self.refresh_stats = dict.fromkeys(
+            (
+                "roots_listed",
+                "roots_changed",
+                "files_parsed",
+                "files_reused",
+                "files_removed",
+                "shortcuts_parsed",
+                "shortcuts_removed",
+            ),
+            0,
+        )
+        self._seen_paths = set()
+        system_actions, app_actions = await asyncio.gather(
+            self._scan_system_actions(rescan), self._scan_app_actions(rescan)
+        )
+        for path in list(self._source_files):
+            if path not in self._seen_paths:
+                del self._source_files[path]
+                self.refresh_stats["files_removed"] += 1
         library_actions = await self._scan_library_actions()
         curated_actions = self._get_curated_actions()
 
-        merged: dict[str, ActionInfo] = {}
+        merged: dict[str, ActionRecord] = {}
         for action in system_actions + app_actions + curated_actions:
             merged[action.identifier] = action
 
@@ -83,53 +299,144 @@ class ActionCatalog:
 
         self._cache = merged
         self._cache_time = time.time()
+        self.version += 1
 
-    async def _scan_system_actions(self) -> list[ActionInfo]:
-        root = Path("/System/Library/PrivateFrameworks")
-        paths = root.glob("*/Metadata.appintents/extract.actionsdata")
-        return _scan_actionsdata_paths(paths, source="system")
+        if any(self.refresh_stats[key] for key in _SNAPSHOT_CHANGE_KEYS):
+            await self._save_snapshot()
 
-    async def _scan_app_actions(self) -> list[ActionInfo]:
-        root = Path("/Applications")
-        paths = list(
-            root.glob(
-                "*.app/Contents/Resources/Metadata.appintents/extract.actionsdata"
-            )
-        )
-        paths += list(
-            root.glob("*.app/Resources/Metadata.appintents/extract.actionsdata")
+    async def _scan_system_actions(self, rescan: bool = True) -> list[ActionRecord]:
+        paths = await self._list_actionsdata(
+            "system", get_system_action_roots(), SYSTEM_ACTIONSDATA_PATTERNS, rescan
         )
-        return _scan_actionsdata_paths(paths, source="apps")
+        return await self._load_actionsdata(paths, source="system")
 
-    async def _scan_library_actions(self) -> list[ActionInfo]:
-        rows = await get_all_shortcuts()
-        usage_counts: dict[str, int] = {}
-        example_params: dict[str, dict[str, object]] = {}
+    async def _scan_app_actions(self, rescan: bool = True) -> list[ActionRecord]:
+        paths = await self._list_actionsdata(
+            "apps", get_app_action_roots(), APP_ACTIONSDATA_PATTERNS, rescan
+        )
+        return await self._load_actionsdata(paths, source="apps")
 
-        for row in rows:
-            data = await get_shortcut_actions(row.pk)
-            if not data:
+    async def _list_actionsdata(
+        self,
+        source: ActionSource,
+        roots: Iterable[Path],
+        patterns: Iterable[str],
+        rescan: bool,
+    ) -> list[Path]:
+        """Glob each root, reusing the previous listing if its mtime is unchanged.
+
+        Installing or replacing an app bundle changes the root's mtime; changes
+        nested deeper are only picked up when ``rescan`` is set.
+        """
+        paths: list[Path] = []
+        live_keys: set[tuple[ActionSource, Path]] = set()
+        for root in roots:
+            mtime_ns = await _run_blocking(_dir_mtime, root)
+            if mtime_ns is None:
+                continue
+            key = (source, root)
+            live_keys.add(key)
+            listing = self._root_listings.get(key)
+            if rescan or listing is None or listing.mtime_ns != mtime_ns:
+                listed = await _run_blocking(_glob_roots, [root], list(patterns))
+                self.refresh_stats["roots_listed"] += 1
+                if listing is None or listing != _RootListing(mtime_ns, listed):
+                    self.refresh_stats["roots_changed"] += 1
+                listing = _RootListing(mtime_ns, listed)
+                self._root_listings[key] = listing
+            paths.extend(listing.paths)
+        for key in list(self._root_listings):
+            if key[0] == source and key not in live_keys:
+                del self._root_listings[key]
+                self.refresh_stats["roots_changed"] += 1
+        return paths
+
+    async def _load_actionsdata(
+        self, paths: list[Path], source: ActionSource
+    ) -> list[ActionRecord]:
+        """Parse changed actionsdata files, reusing results for unchanged ones.
+
+        Changed files are parsed concurrently in the scan pool and stored as each
+        one finishes; the result keeps the order of ``paths``.
+        """
+        fingerprints = await _run_blocking(_file_fingerprints, paths)
+        pending: dict[asyncio.Future[list[ActionRecord]], tuple[Path, FileFingerprint]]
+        pending = {}
+        live: list[Path] = []
+        loop = asyncio.get_running_loop()
+        for path, fingerprint in zip(paths, fingerprints):
+            if fingerprint is None:
                 continue
-            for action in parse_actions(data):
-                usage_counts[action.identifier] = (
-                    usage_counts.get(action.identifier, 0) + 1
+            live.append(path)
+            self._seen_paths.add(path)
+            entry = self._source_files.get(path)
+            if (
+                entry is None
+                or entry.fingerprint != fingerprint
+                or entry.source != source
+            ):
+                future = loop.run_in_executor(
+                    _scan_executor(), _scan_actionsdata_paths, [path], source
                 )
-                if action.identifier not in example_params and action.parameters:
-                    example_params[action.identifier] = _coerce_json_mapping(
-                        action.parameters
+                pending[future] = (path, fingerprint)
+            else:
+                self.refresh_stats["files_reused"] += 1
+
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    path, fingerprint = pending.pop(future)
+                    self._source_files[path] = _SourceFile(
+                        source=source, fingerprint=fingerprint, actions=future.result()
                     )
+                    self.refresh_stats["files_parsed"] += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return [action for path in live for action in self._source_files[path].actions]
+
+    async def _scan_library_actions(self) -> list[ActionRecord]:
+        versions = await get_shortcut_versions()
+        for pk in list(self._library):
+            if pk not in versions:
+                del self._library[pk]
+                self.refresh_stats["shortcuts_removed"] += 1
+
+        changed = [
+            pk
+            for pk, modified_at in versions.items()
+            if pk not in self._library or self._library[pk].modified_at != modified_at
+        ]
+        async for batch, blobs in iter_actions_by_pks(changed):
+            summaries = await _run_blocking(
+                _summarize_library_batch,
+                [(pk, versions[pk], blobs.get(pk)) for pk in batch],
+            )
+            self._library.update(summaries)
+            self.refresh_stats["shortcuts_parsed"] += len(batch)
 
-        actions: list[ActionInfo] = []
+        usage_counts: dict[str, int] = {}
+        example_params: dict[str, dict[str, object]] = {}
+        for pk in versions:
+            summary = self._library[pk]
+            for identifier, count in summary.usage_counts.items():
+                usage_counts[identifier] = usage_counts.get(identifier, 0) + count
+            for identifier, params in summary.example_params.items():
+                example_params.setdefault(identifier, params)
+
+        actions: list[ActionRecord] = []
         for identifier, count in usage_counts.items():
             actions.append(
-                ActionInfo(
+                action_record(
                     identifier=identifier,
                     source="library",
                     title=None,
                     description=None,
                     category=_derive_category(identifier, None),
-                    parameters=[],
-                    platform_availability=None,
                     usage_count=count,
                     example_params=example_params.get(identifier),
                 )
@@ -137,7 +444,58 @@ class ActionCatalog:
 
         return actions
 
-    def _get_curated_actions(self) -> list[ActionInfo]:
+    async def _load_snapshot(self) -> bool:
+        """Seed per-source state from the on-disk snapshot, if it is usable."""
+        if not get_catalog_snapshot_enabled():
+            return False
+        snapshot = await _run_blocking(_read_snapshot, _snapshot_path())
+        if snapshot is None:
+            return False
+        self._root_listings = snapshot.listings
+        self._source_files = snapshot.files
+        self._library = snapshot.library
+        return True
+
+    async def _save_snapshot(self) -> None:
+        if not get_catalog_snapshot_enabled():
+            return
+        # Plain JSON rows rather than models, so loading needs no validation.
+        encoder = RecordEncoder()
+        payload: dict[str, object] = {
+            "format": SNAPSHOT_FORMAT,
+            "package_version": __version__,
+            "listings": [
+                {
+                    "source": source,
+                    "root": str(root),
+                    "mtime_ns": listing.mtime_ns,
+                    "paths": [str(path) for path in listing.paths],
+                }
+                for (source, root), listing in self._root_listings.items()
+            ],
+            "files": [
+                {
+                    "path": str(path),
+                    "source": entry.source,
+                    "fingerprint": list(entry.fingerprint),
+                    "actions": [encoder.row(action) for action in entry.actions],
+                }
+                for path, entry in self._source_files.items()
+            ],
+            "library": [
+                {
+                    "pk": pk,
+                    "modified_at": entry.modified_at,
+                    "usage_counts": entry.usage_counts,
+                    "example_params": entry.example_params,
+                }
+                for pk, entry in self._library.items()
+            ],
+        }
+        payload.update(encoder.tables())
+        await _run_blocking(_write_snapshot, _snapshot_path(), payload)
+
+    def _get_curated_actions(self) -> list[ActionRecord]:
         curated_path = Path(__file__).resolve().parent / "data" / "curated_actions.json"
         if not curated_path.exists():
             return []
@@ -151,7 +509,124 @@ class ActionCatalog:
         if payload_map is None:
             return []
 
-        return parse_curated_payload(payload_map)
+        return _parse_curated_records(payload_map)
+
+
+def _glob_roots(roots: Iterable[Path], patterns: Iterable[str]) -> list[Path]:
+    return [
+        path for root in roots for pattern in patterns for path in root.glob(pattern)
+    ]
+
+
+def _dir_mtime(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _snapshot_path() -> Path:
+    """One snapshot per database and scan-root configuration."""
+    key = "\0".join(
+        [str(get_db_path())]
+        + [str(root) for root in get_system_action_roots()]
+        + ["apps"]
+        + [str(root) for root in get_app_action_roots()]
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / f"catalog-{digest}.json"
+
+
+def _read_snapshot(path: Path) -> _Snapshot | None:
+    """Load a snapshot written by this format and package version.
+
+    The file is our own output, so only its header is checked; a file that
+    is not the expected shape is logged and ignored.
+    """
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        data = json.loads(raw)
+        if data["format"] != SNAPSHOT_FORMAT or data["package_version"] != __version__:
+            return None
+        decoder = RecordDecoder(data)
+        return _Snapshot(
+            listings={
+                (item["source"], Path(item["root"])): _RootListing(
+                    item["mtime_ns"], [Path(entry) for entry in item["paths"]]
+                )
+                for item in data["listings"]
+            },
+            files={
+                Path(item["path"]): _SourceFile(
+                    source=item["source"],
+                    fingerprint=(item["fingerprint"][0], item["fingerprint"][1]),
+                    actions=[decoder.record(action) for action in item["actions"]],
+                )
+                for item in data["files"]
+            },
+            library={
+                item["pk"]: _LibraryShortcut(
+                    modified_at=item["modified_at"],
+                    usage_counts=item["usage_counts"],
+                    example_params=item["example_params"],
+                )
+                for item in data["library"]
+            },
+        )
+    except (KeyError, IndexError, TypeError, ValueError):
+        logger.warning("Ignoring unreadable catalog snapshot %s", path)
+        return None
+
+
+def _write_snapshot(path: Path, payload: dict[str, object]) -> None:
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Could not write catalog snapshot %s: %s", path, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _file_fingerprint(path: Path) -> FileFingerprint | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_fingerprints(paths: Iterable[Path]) -> list[FileFingerprint | None]:
+    return [_file_fingerprint(path) for path in paths]
+
+
+def _summarize_library_batch(
+    items: Iterable[tuple[int, str | None, bytes | None]],
+) -> dict[int, _LibraryShortcut]:
+    summaries: dict[int, _LibraryShortcut] = {}
+    for pk, modified_at, data in items:
+        parsed = actions_cache.get_or_parse(pk, modified_at, data) if data else []
+        summaries[pk] = _summarize_library_shortcut(modified_at, parsed)
+    return summaries
+
+
+def _summarize_library_shortcut(
+    modified_at: str | None, actions: list[ShortcutAction]
+) -> _LibraryShortcut:
+    summary = _LibraryShortcut(modified_at=modified_at)
+    for action in actions:
+        summary.usage_counts[action.identifier] = (
+            summary.usage_counts.get(action.identifier, 0) + 1
+        )
+        if action.identifier not in summary.example_params and action.parameters:
+            summary.example_params[action.identifier] = _coerce_json_mapping(
+                action.parameters
+            )
+    return summary
 
 
 def _as_mapping(value: object) -> dict[str, object] | None:
@@ -184,10 +659,14 @@ def _coerce_json_mapping(value: Mapping[str, object]) -> dict[str, object]:
 
 
 def parse_curated_payload(payload: Mapping[str, object]) -> list[ActionInfo]:
+    return [record.to_model() for record in _parse_curated_records(payload)]
+
+
+def _parse_curated_records(payload: Mapping[str, object]) -> list[ActionRecord]:
     actions_data = _as_mapping(payload.get("actions"))
     curated_actions: Mapping[str, object] = actions_data or payload
 
-    actions: list[ActionInfo] = []
+    actions: list[ActionRecord] = []
     for identifier, entry in curated_actions.items():
         entry_map = _as_mapping(entry)
         if entry_map is None:
@@ -197,16 +676,13 @@ def parse_curated_payload(payload: Mapping[str, object]) -> list[ActionInfo]:
             identifier, None
         )
         actions.append(
-            ActionInfo(
+            action_record(
                 identifier=identifier,
                 source="curated",
                 title=_safe_text(entry_map.get("title")),
                 description=_safe_text(entry_map.get("description")),
                 category=category,
                 parameters=parameters,
-                platform_availability=None,
-                usage_count=0,
-                example_params=None,
             )
         )
     return actions
@@ -214,18 +690,17 @@ def parse_curated_payload(payload: Mapping[str, object]) -> list[ActionInfo]:
 
 def _scan_actionsdata_paths(
     paths: Iterable[Path], source: ActionSource
-) -> list[ActionInfo]:
-    actions: list[ActionInfo] = []
+) -> list[ActionRecord]:
+    actions: list[ActionRecord] = []
 
     for path in paths:
         try:
-            payload = json.loads(path.read_text())
-        except (OSError, json.JSONDecodeError):
+            text = read_actionsdata_text(path)
+            # Collect per file so a malformed file contributes nothing.
+            parsed = _parse_actionsdata_entries(iter_action_entries(text), source)
+        except (OSError, ValueError):
             continue
-        payload_map = _as_mapping(payload)
-        if payload_map is None:
-            continue
-        actions.extend(parse_actionsdata_payload(payload_map, source=source))
+        actions.extend(parsed)
     return actions
 
 
@@ -235,9 +710,15 @@ def parse_actionsdata_payload(
     actions_data = _as_mapping(payload.get("actions"))
     if actions_data is None:
         return []
+    records = _parse_actionsdata_entries(actions_data.items(), source)
+    return [record.to_model() for record in records]
+
 
-    parsed: list[ActionInfo] = []
-    for identifier, entry in actions_data.items():
+def _parse_actionsdata_entries(
+    entries: Iterable[tuple[str, object]], source: ActionSource
+) -> list[ActionRecord]:
+    parsed: list[ActionRecord] = []
+    for identifier, entry in entries:
         entry_map = _as_mapping(entry)
         if entry_map is None:
             continue
@@ -249,7 +730,7 @@ def parse_actionsdata_payload(
 
 def _parse_actionsdata_entry(
     fallback_identifier: str, entry: Mapping[str, object], source: ActionSource
-) -> ActionInfo | None:
+) -> ActionRecord | None:
     identifier = _safe_text(entry.get("identifier")) or fallback_identifier
     title = _extract_localized_text(entry.get("title"))
     description = None
@@ -262,7 +743,7 @@ def _parse_actionsdata_entry(
     fqtn = _safe_text(entry.get("fullyQualifiedTypeName"))
     category = _derive_category(identifier, fqtn)
 
-    return ActionInfo(
+    return action_record(
         identifier=identifier,
         source=source,
         title=title,
@@ -270,15 +751,13 @@ def _parse_actionsdata_entry(
         category=category,
         parameters=parameters,
         platform_availability=availability,
-        usage_count=0,
-        example_params=None,
     )
 
 
-def _parse_actionsdata_parameters(value: object) -> list[ActionParameter]:
+def _parse_actionsdata_parameters(value: object) -> list[ParameterRecord]:
     if not isinstance(value, list):
         return []
-    parameters: list[ActionParameter] = []
+    parameters: list[ParameterRecord] = []
     for item in cast(list[object], value):
         item_map = _as_mapping(item)
         if item_map is None:
@@ -290,7 +769,7 @@ def _parse_actionsdata_parameters(value: object) -> list[ActionParameter]:
         value_type = _parse_value_type(item_map.get("valueType"))
         is_optional = bool(item_map.get("isOptional", False))
         parameters.append(
-            ActionParameter(
+            parameter_record(
                 name=name,
                 title=title,
                 value_type=value_type,
@@ -301,10 +780,10 @@ def _parse_actionsdata_parameters(value: object) -> list[ActionParameter]:
     return parameters
 
 
-def _parse_curated_parameters(value: object) -> list[ActionParameter]:
+def _parse_curated_parameters(value: object) -> list[ParameterRecord]:
     if not isinstance(value, list):
         return []
-    parameters: list[ActionParameter] = []
+    parameters: list[ParameterRecord] = []
     for item in cast(list[object], value):
         item_map = _as_mapping(item)
         if item_map is None:
@@ -313,7 +792,7 @@ def _parse_curated_parameters(value: object) -> list[ActionParameter]:
         if not name:
             continue
         parameters.append(
-            ActionParameter(
+            parameter_record(
                 name=name,
                 title=_safe_text(item_map.get("title")),
                 value_type=_safe_text(item_map.get("value_type")) or "unknown",
@@ -399,8 +878,8 @@ def _derive_category(identifier: str, fqtn: str | None) -> str:
     return "third-party"
 
 
-def _merge_action(base: ActionInfo, incoming: ActionInfo) -> ActionInfo:
-    return ActionInfo(
+def _merge_action(base: ActionRecord, incoming: ActionRecord) -> ActionRecord:
+    return ActionRecord(
         identifier=base.identifier,
         source=base.source if base.source != "library" else incoming.source,
         title=base.title or incoming.title,
@@ -415,3 +894,4 @@ def _merge_action(base: ActionInfo, incoming: ActionInfo) -> ActionInfo:
 
 
 catalog = ActionCatalog()
+metrics.gauge("catalog.actions", lambda: catalog.size)
@@ -0,0 +1,141 @@
+"""Selective reader for ``extract.actionsdata`` files.
+
+App Intents metadata files can be several megabytes, and most of their content
+(entities, queries, enums, per-action sections the catalog ignores) is never
+read. Instead of materializing the whole document, the reader walks the top
+level of the JSON text, decodes one action entry at a time, keeps only the
+fields the catalog uses and drops the rest before moving on.
+"""
+
+from __future__ import annotations
+
+import json
+import json.decoder
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import cast
+
+# Fields of an action entry that ActionCatalog reads.
+ACTION_FIELDS = frozenset(
+    {
+        "identifier",
+        "title",
+        "descriptionMetadata",
+        "parameters",
+        "availabilityAnnotations",
+        "fullyQualifiedTypeName",
+    }
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+# The C string scanner used by json itself; typeshed does not declare it.
+_scanstring = cast(
+    Callable[[str, int], tuple[str, int]],
+    json.decoder.scanstring,  # pyright: ignore[reportAttributeAccessIssue]
+)
+
+
+def read_actionsdata_text(path: Path) -> str:
+    """Decode a file through a read-only memory map, skipping a bytes copy."""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8")
+
+
+def iter_action_entries(
+    text: str, fields: frozenset[str] = ACTION_FIELDS
+) -> Iterator[tuple[str, dict[str, object]]]:
+    """Yield ``(key, entry)`` for each member of the top-level ``actions`` object.
+
+    Each entry only contains ``fields``. Other top-level sections are decoded
+    and discarded one child at a time. Raises ``json.JSONDecodeError`` on malformed
+    input, like ``json.loads``.
+    """
+    pos = _expect(text, _skip(text, 0), "{")
+    if text.startswith("}", pos):
+        return
+    while True:
+        key, pos = _member_key(text, pos)
+        if key == "actions" and text.startswith("{", pos):
+            pos = _skip(text, pos + 1)
+            if text.startswith("}", pos):
+                pos += 1
+            else:
+                while True:
+                    entry_key, pos = _member_key(text, pos)
+                    value, pos = _decoder.raw_decode(text, pos)
+                    if isinstance(value, dict):
+                        entry = cast(dict[str, object], value)
+                        yield (
+                            entry_key,
+                            {name: entry[name] for name in fields if name in entry},
+                        )
+                    pos, more = _next_member(text, pos)
+                    if not more:
+                        break
+        else:
+            pos = _discard_value(text, pos)
+        pos, more = _next_member(text, pos)
+        if not more:
+            return
+
+
+def _discard_value(text: str, pos: int) -> int:
+    """Step over a value, decoding a container one child at a time."""
+    if text.startswith("{", pos):
+        pos = _skip(text, pos + 1)
+        if text.startswith("}", pos):
+            return pos + 1
+        more = True
+        while more:
+            _, pos = _member_key(text, pos)
+            _, pos = _decoder.raw_decode(text, pos)
+            pos, more = _next_member(text, pos)
+        return pos
+    if text.startswith("[", pos):
+        pos = _skip(text, pos + 1)
+        if text.startswith("]", pos):
+            return pos + 1
+        while True:
+            _, pos = _decoder.raw_decode(text, pos)
+            pos = _skip(text, pos)
+            if text.startswith(",", pos):
+                pos = _skip(text, pos + 1)
+                continue
+            return _expect(text, pos, "]")
+    _, pos = _decoder.raw_decode(text, pos)
+    return pos
+
+
+def _skip(text: str, pos: int) -> int:
+    match = _WHITESPACE.match(text, pos)
+    return match.end() if match else pos
+
+
+def _expect(text: str, pos: int, char: str) -> int:
+    if not text.startswith(char, pos):
+        raise json.JSONDecodeError(f"Expecting {char!r}", text, pos)
+    return _skip(text, pos + 1)
+
+
+def _member_key(text: str, pos: int) -> tuple[str, int]:
+    """Read ``"key":`` at ``pos``; returns the key and the start of the value."""
+    if not text.startswith('"', pos):
+        raise json.JSONDecodeError("Expecting property name", text, pos)
+    key, pos = _scanstring(text, pos + 1)
+    pos = _expect(text, _skip(text, pos), ":")
+    return key, pos
+
+
+def _next_member(text: str, pos: int) -> tuple[int, bool]:
+    """Consume a separator; returns the next position and whether more follow."""
+    pos = _skip(text, pos)
+    if text.startswith(",", pos):
+        return _skip(text, pos + 1), True
+    return _expect(text, pos, "}"), False
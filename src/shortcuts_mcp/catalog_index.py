@@ -0,0 +1,320 @@
+"""Precomputed filter and search structures over a catalog snapshot.
+
+A ``CatalogIndex`` is built once per catalog version and answers
+``get_available_actions`` queries without touching every action:
+
+- one bitmap per source (bit ``i`` set when action ``i`` has that source),
+- one bitmap per lowercased category,
+- identifiers sorted case-insensitively, so an identifier prefix maps to one
+  contiguous range found by bisection (a prefix trie flattened into an array),
+- an inverted index from tokens of identifier, title and description to
+  postings with field-weighted term frequencies, ranked with BM25; queries
+  the tokens cannot match fall back to a plain substring scan,
+- serialized projections of each action, built on first use, so a page of
+  results is a slice of ready-made dicts rather than a copy and dump per call.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .action_records import ActionRecord
+from .models import ActionSource
+
+# Field weights for BM25F-style scoring: titles are the most descriptive,
+# identifiers carry the vendor and action name, descriptions are noisy.
+_IDENTIFIER_WEIGHT = 2.0
+_TITLE_WEIGHT = 3.0
+_DESCRIPTION_WEIGHT = 1.0
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# Filter results (positions plus category/source summary) kept per version.
+_MAX_FILTERED = 64
+
+_SOURCES: tuple[ActionSource, ...] = ("system", "apps", "library", "curated")
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words, plus their camel-case parts (``CreateNote`` -> create, note)."""
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text):
+        tokens.append(word.lower())
+        parts = _CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+def _query_tokens(text: str) -> list[str]:
+    return list(dict.fromkeys(word.lower() for word in _WORD_RE.findall(text)))
+
+
+def _bit_positions(mask: int) -> list[int]:
+    """Indexes of the set bits of ``mask``, lowest first."""
+    bits = bin(mask)[:1:-1]
+    positions: list[int] = []
+    index = bits.find("1")
+    while index != -1:
+        positions.append(index)
+        index = bits.find("1", index + 1)
+    return positions
+
+
+@dataclass(slots=True)
+class ActionPage:
+    """One page of filtered actions, already serialized."""
+
+    actions: list[dict[str, object]]
+    total: int
+    categories: list[str]
+    sources: dict[str, int]
+    next_offset: int | None
+
+
+class CatalogIndex:
+    """Immutable index over one version of the action catalog."""
+
+    def __init__(self, actions: Sequence[ActionRecord]) -> None:
+        self.actions = list(actions)
+        self.all_mask = (1 << len(self.actions)) - 1
+
+        self._source_masks: dict[str, int] = {}
+        self._category_masks: dict[str, int] = {}
+        for position, action in enumerate(self.actions):
+            bit = 1 << position
+            self._source_masks[action.source] = (
+                self._source_masks.get(action.source, 0) | bit
+            )
+            category = action.category.lower()
+            self._category_masks[category] = self._category_masks.get(category, 0) | bit
+
+        order = sorted(
+            range(len(self.actions)),
+            key=lambda position: self.actions[position].identifier.lower(),
+        )
+        self._sorted_positions = order
+        self._sorted_identifiers = [
+            self.actions[position].identifier.lower() for position in order
+        ]
+
+        postings: dict[str, dict[int, float]] = {}
+        self._lengths: list[float] = []
+        for position, action in enumerate(self.actions):
+            length = 0.0
+            fields = (
+                (action.identifier, _IDENTIFIER_WEIGHT),
+                (action.title, _TITLE_WEIGHT),
+                (action.description, _DESCRIPTION_WEIGHT),
+            )
+            for value, weight in fields:
+                if not value:
+                    continue
+                for token in tokenize(value):
+                    doc_postings = postings.setdefault(token, {})
+                    doc_postings[position] = doc_postings.get(position, 0.0) + weight
+                    length += weight
+            self._lengths.append(length)
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._average_length = (
+            sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+        )
+        # (include_parameters, include_examples) -> position -> serialized action.
+        self._projections: dict[tuple[bool, bool], list[dict[str, object] | None]] = {}
+        self._filtered: dict[int, tuple[list[int], list[str], dict[str, int]]] = {}
+        # Lowercased "identifier title description", built on first fallback.
+        self._haystacks: list[str] | None = None
+
+    def source_mask(self, source: ActionSource) -> int:
+        return self._source_masks.get(source, 0)
+
+    def category_mask(self, category: str) -> int:
+        """Actions in ``category`` or whose identifier starts with it."""
+        prefix = category.lower()
+        mask = self._category_masks.get(prefix, 0)
+        start = bisect_left(self._sorted_identifiers, prefix)
+        # Every identifier with this prefix sorts before prefix + U+10FFFF.
+        end = bisect_right(self._sorted_identifiers, prefix + "\U0010ffff", lo=start)
+        for position in self._sorted_positions[start:end]:
+            mask |= 1 << position
+        return mask
+
+    def filter_mask(
+        self, source: ActionSource | None = None, category: str | None = None
+    ) -> int:
+        mask = self.all_mask
+        if source is not None:
+            mask &= self.source_mask(source)
+        if category is not None:
+            mask &= self.category_mask(category)
+        return mask
+
+    def select(self, mask: int) -> list[ActionRecord]:
+        """Actions in ``mask``, in catalog order."""
+        return [self.actions[position] for position in _bit_positions(mask)]
+
+    def search(
+        self, query: str, mask: int | None = None, limit: int | None = None
+    ) -> list[tuple[ActionRecord, float]]:
+        """Rank actions in ``mask`` matching every word of ``query`` by BM25.
+
+        Each query word matches any indexed token it is a prefix of, so
+        ``note`` finds ``Notes`` and ``createnote`` finds ``CreateNoteAction``.
+        When no action matches that way, actions whose identifier, title or
+        description contain ``query`` as a substring are returned instead, in
+        catalog order with a score of 0, so ``ettex`` still finds ``gettext``.
+        """
+        scores = self._scores(query, mask)
+        ranked = self._rank(query, scores, limit)
+        return [(self.actions[position], scores[position]) for position in ranked]
+
+    def _scores(self, query: str, mask: int | None) -> dict[int, float]:
+        """Positions in ``mask`` matching ``query``, with their scores."""
+        return self._token_scores(query, mask) or self._substring_scores(query, mask)
+
+    def _token_scores(self, query: str, mask: int | None) -> dict[int, float]:
+        """BM25 score of every position in ``mask`` matching all query words."""
+        words = _query_tokens(query)
+        if not words:
+            return {}
+        total = len(self.actions)
+        # Positions still in the running; narrows as each word must match.
+        candidates: set[int] | None = None
+        if mask is not None and mask != self.all_mask:
+            candidates = set(_bit_positions(mask))
+
+        scores: dict[int, float] = {}
+        for word in words:
+            frequencies: dict[int, float] = {}
+            start = bisect_left(self._vocabulary, word)
+            end = bisect_right(self._vocabulary, word + "\U0010ffff", lo=start)
+            for token in self._vocabulary[start:end]:
+                for position, frequency in self._postings[token].items():
+                    if candidates is None or position in candidates:
+                        frequencies[position] = (
+                            frequencies.get(position, 0.0) + frequency
+                        )
+            if not frequencies:
+                return {}
+
+            matched = len(frequencies)
+            idf = math.log(1 + (total - matched + 0.5) / (matched + 0.5))
+            for position, frequency in frequencies.items():
+                length_ratio = self._lengths[position] / (self._average_length or 1.0)
+                norm = 1 - _BM25_B + _BM25_B * length_ratio
+                scores[position] = scores.get(position, 0.0) + (
+                    idf * frequency * (_BM25_K1 + 1) / (frequency + _BM25_K1 * norm)
+                )
+            candidates = set(frequencies)
+
+        # Positions that matched an earlier word but not a later one drop out.
+        return {position: scores[position] for position in candidates or ()}
+
+    def _substring_scores(self, query: str, mask: int | None) -> dict[int, float]:
+        """Positions in ``mask`` whose text contains ``query``, scored 0."""
+        needle = query.lower()
+        if not needle:
+            return {}
+        if self._haystacks is None:
+            self._haystacks = [
+                " ".join(
+                    part
+                    for part in (action.identifier, action.title, action.description)
+                    if part
+                ).lower()
+                for action in self.actions
+            ]
+        haystacks = self._haystacks
+        positions = range(len(haystacks)) if mask is None else _bit_positions(mask)
+        return {
+            position: 0.0 for position in positions if needle in haystacks[position]
+        }
+
+    def _rank(
+        self, query: str, scores: dict[int, float], limit: int | None
+    ) -> list[int]:
+        query_lower = query.strip().lower()
+
+        def rank_key(position: int) -> tuple[bool, float, int]:
+            # An exact identifier match always comes first.
+            exact = self.actions[position].identifier.lower() == query_lower
+            return (not exact, -scores[position], position)
+
+        if limit is None:
+            return sorted(scores, key=rank_key)
+        return heapq.nsmallest(limit, scores, key=rank_key)
+
+    def page(
+        self,
+        mask: int,
+        search: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        include_parameters: bool = True,
+        include_examples: bool = False,
+    ) -> ActionPage:
+        """Serialize ``limit`` actions from ``offset`` of the filtered result.
+
+        The returned dicts are shared between calls for this catalog version
+        and must not be mutated.
+        """
+        offset = max(offset, 0)
+        end = None if limit is None else offset + max(limit, 0)
+        if search:
+            scores = self._scores(search, mask)
+            positions = self._rank(search, scores, end)[offset:]
+            total = len(scores)
+            categories, sources = self._summarize(sorted(scores))
+        else:
+            filtered = self._filtered.get(mask)
+            if filtered is None:
+                if len(self._filtered) >= _MAX_FILTERED:
+                    self._filtered.clear()
+                matched = _bit_positions(mask)
+                filtered = (matched, *self._summarize(matched))
+                self._filtered[mask] = filtered
+            matched, categories, sources = filtered
+            positions = matched[offset:end]
+            total = len(matched)
+
+        variant = (include_parameters, include_examples)
+        projections = self._projections.get(variant)
+        if projections is None:
+            projections = self._projections[variant] = [None] * len(self.actions)
+        page: list[dict[str, object]] = []
+        for position in positions:
+            projection = projections[position]
+            if projection is None:
+                projection = self.actions[position].to_dict(
+                    include_parameters, include_examples
+                )
+                projections[position] = projection
+            page.append(projection)
+
+        # An empty page never advances, so it must not point to a next one.
+        next_offset = offset + len(page)
+        return ActionPage(
+            actions=page,
+            total=total,
+            categories=categories,
+            sources=dict(sources),
+            next_offset=next_offset if page and next_offset < total else None,
+        )
+
+    def _summarize(self, positions: list[int]) -> tuple[list[str], dict[str, int]]:
+        sources: dict[str, int] = dict.fromkeys(_SOURCES, 0)
+        categories: set[str] = set()
+        for position in positions:
+            action = self.actions[position]
+            sources[action.source] += 1
+            categories.add(action.category)
+        return sorted(categories), sources
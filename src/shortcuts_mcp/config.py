@@ -4,21 +4,205 @@ import os
 from pathlib import Path
 
 DEFAULT_DB_PATH = str(Path.home() / "Library/Shortcuts/Shortcuts.sqlite")
+DEFAULT_CACHE_DIR = str(Path.home() / "Library/Caches/shortcuts-mcp")
+DEFAULT_SYSTEM_ACTION_ROOTS = "/System/Library/PrivateFrameworks"
+DEFAULT_APP_ACTION_ROOTS = "/Applications"
 DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_DB_POOL_SIZE = 4
+DEFAULT_DB_MMAP_BYTES = 64 * 1024 * 1024
+DEFAULT_DB_CACHE_KIB = 8 * 1024
+DEFAULT_PARSE_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+DEFAULT_MAX_QUEUED_RUNS = 32
+DEFAULT_RUN_JOB_LIMIT = 256
+DEFAULT_RUN_JOB_TTL_SECONDS = 600
+DEFAULT_RUN_WORKERS = 0
+DEFAULT_TERMINATE_GRACE_MS = 2000
+DEFAULT_RUN_CACHE_TTL_SECONDS = 300
+DEFAULT_RUN_CACHE_SIZE = 256
+DEFAULT_INPUT_FILE_THRESHOLD = 64 * 1024
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+DEFAULT_OUTPUT_SPOOL_FILES = 16
+DEFAULT_METRICS_INTERVAL_SECONDS = 15
+DEFAULT_PROFILE_MODE = "cpu"
+DEFAULT_PROFILE_THRESHOLD_MS = 1000
+DEFAULT_PROFILE_SAMPLE_RATE = 1.0
+DEFAULT_PROFILE_KEEP = 20
+DEFAULT_SLOW_QUERY_MS = 100
+
+
+def _get_int(name: str, default: int) -> int:
+    value = os.environ.get(name, str(default))
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _get_float(name: str, default: float) -> float:
+    value = os.environ.get(name, str(default))
+    try:
+        return float(value)
+    except ValueError:
+        return default
+
+
+def _get_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _get_paths(name: str, default: str) -> list[Path]:
+    value = os.environ.get(name, default)
+    return [Path(item).expanduser() for item in value.split(os.pathsep) if item]
 
 
 def get_db_path() -> Path:
     return Path(os.environ.get("SHORTCUTS_DB_PATH", DEFAULT_DB_PATH)).expanduser()
 
 
+def get_cache_dir() -> Path:
+    return Path(os.environ.get("SHORTCUTS_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+
+
+def get_catalog_snapshot_enabled() -> bool:
+    return _get_bool("SHORTCUTS_CATALOG_SNAPSHOT", True)
+
+
 def get_default_timeout() -> int:
-    value = os.environ.get("SHORTCUTS_DEFAULT_TIMEOUT", str(DEFAULT_TIMEOUT_SECONDS))
-    try:
-        return int(value)
-    except ValueError:
-        return DEFAULT_TIMEOUT_SECONDS
+    return _get_int("SHORTCUTS_DEFAULT_TIMEOUT", DEFAULT_TIMEOUT_SECONDS)
 
 
 def get_log_level() -> str:
     return os.environ.get("SHORTCUTS_LOG_LEVEL", DEFAULT_LOG_LEVEL)
+
+
+def get_db_pool_size() -> int:
+    return max(1, _get_int("SHORTCUTS_DB_POOL_SIZE", DEFAULT_DB_POOL_SIZE))
+
+
+def get_db_mmap_bytes() -> int:
+    return max(0, _get_int("SHORTCUTS_DB_MMAP_BYTES", DEFAULT_DB_MMAP_BYTES))
+
+
+def get_db_cache_kib() -> int:
+    return max(0, _get_int("SHORTCUTS_DB_CACHE_KIB", DEFAULT_DB_CACHE_KIB))
+
+
+def get_parse_cache_bytes() -> int:
+    return max(0, _get_int("SHORTCUTS_PARSE_CACHE_BYTES", DEFAULT_PARSE_CACHE_BYTES))
+
+
+def get_system_action_roots() -> list[Path]:
+    return _get_paths("SHORTCUTS_SYSTEM_ACTION_ROOTS", DEFAULT_SYSTEM_ACTION_ROOTS)
+
+
+def get_app_action_roots() -> list[Path]:
+    return _get_paths("SHORTCUTS_APP_ACTION_ROOTS", DEFAULT_APP_ACTION_ROOTS)
+
+
+def get_scan_workers() -> int:
+    return max(1, _get_int("SHORTCUTS_SCAN_WORKERS", DEFAULT_SCAN_WORKERS))
+
+
+def get_max_concurrent_runs() -> int:
+    return max(
+        1, _get_int("SHORTCUTS_MAX_CONCURRENT_RUNS", DEFAULT_MAX_CONCURRENT_RUNS)
+    )
+
+
+def get_max_queued_runs() -> int:
+    return max(0, _get_int("SHORTCUTS_MAX_QUEUED_RUNS", DEFAULT_MAX_QUEUED_RUNS))
+
+
+def get_serialize_runs() -> bool:
+    return _get_bool("SHORTCUTS_SERIALIZE_RUNS", False)
+
+
+def get_run_job_limit() -> int:
+    return max(1, _get_int("SHORTCUTS_RUN_JOB_LIMIT", DEFAULT_RUN_JOB_LIMIT))
+
+
+def get_run_job_ttl() -> int:
+    return max(0, _get_int("SHORTCUTS_RUN_JOB_TTL", DEFAULT_RUN_JOB_TTL_SECONDS))
+
+
+def get_run_workers() -> int:
+    return max(0, _get_int("SHORTCUTS_RUN_WORKERS", DEFAULT_RUN_WORKERS))
+
+
+def get_terminate_grace_ms() -> int:
+    return max(0, _get_int("SHORTCUTS_TERMINATE_GRACE_MS", DEFAULT_TERMINATE_GRACE_MS))
+
+
+def get_run_cache_patterns() -> str:
+    return os.environ.get("SHORTCUTS_RUN_CACHE", "")
+
+
+def get_run_cache_ttl() -> int:
+    return max(0, _get_int("SHORTCUTS_RUN_CACHE_TTL", DEFAULT_RUN_CACHE_TTL_SECONDS))
+
+
+def get_run_cache_size() -> int:
+    return max(0, _get_int("SHORTCUTS_RUN_CACHE_SIZE", DEFAULT_RUN_CACHE_SIZE))
+
+
+def get_input_file_threshold() -> int:
+    return max(
+        0, _get_int("SHORTCUTS_INPUT_FILE_THRESHOLD", DEFAULT_INPUT_FILE_THRESHOLD)
+    )
+
+
+def get_max_output_bytes() -> int:
+    return max(1, _get_int("SHORTCUTS_MAX_OUTPUT_BYTES", DEFAULT_MAX_OUTPUT_BYTES))
+
+
+def get_output_spool_files() -> int:
+    return max(0, _get_int("SHORTCUTS_OUTPUT_SPOOL_FILES", DEFAULT_OUTPUT_SPOOL_FILES))
+
+
+def get_metrics_file() -> Path | None:
+    value = os.environ.get("SHORTCUTS_METRICS_FILE", "")
+    return Path(value).expanduser() if value else None
+
+
+def get_metrics_interval() -> int:
+    return max(
+        0, _get_int("SHORTCUTS_METRICS_INTERVAL", DEFAULT_METRICS_INTERVAL_SECONDS)
+    )
+
+
+def get_profile_tools() -> str:
+    return os.environ.get("SHORTCUTS_PROFILE", "")
+
+
+def get_profile_mode() -> str:
+    return os.environ.get("SHORTCUTS_PROFILE_MODE", DEFAULT_PROFILE_MODE)
+
+
+def get_profile_threshold_ms() -> int:
+    return max(
+        0, _get_int("SHORTCUTS_PROFILE_THRESHOLD_MS", DEFAULT_PROFILE_THRESHOLD_MS)
+    )
+
+
+def get_profile_sample_rate() -> float:
+    rate = _get_float("SHORTCUTS_PROFILE_SAMPLE_RATE", DEFAULT_PROFILE_SAMPLE_RATE)
+    return min(1.0, max(0.0, rate))
+
+
+def get_profile_dir() -> Path:
+    value = os.environ.get("SHORTCUTS_PROFILE_DIR")
+    return Path(value).expanduser() if value else get_cache_dir() / "profiles"
+
+
+def get_profile_keep() -> int:
+    return max(1, _get_int("SHORTCUTS_PROFILE_KEEP", DEFAULT_PROFILE_KEEP))
+
+
+def get_slow_query_ms() -> int:
+    return max(0, _get_int("SHORTCUTS_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS))
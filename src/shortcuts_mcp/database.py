@@ -1,15 +1,129 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import functools
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
 import uuid
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import cast
 
 import aiosqlite
 
-from .config import get_db_path
+from .config import (
+    get_db_cache_kib,
+    get_db_mmap_bytes,
+    get_db_path,
+    get_db_pool_size,
+    get_slow_query_ms,
+)
+from .metrics import metrics
+from .models import ShortcutSort
 
 COCOA_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
 
+logger = logging.getLogger(__name__)
+
+# sqlite3 keeps compiled statements per connection keyed by SQL text, so the
+# fixed queries below are only prepared once for the lifetime of a pooled
+# connection.
+STATEMENT_CACHE_SIZE = 64
+
+# Shortcuts whose actions blobs iter_actions_by_pks reads per query.
+ACTIONS_BATCH_SIZE = 500
+
+_SHORTCUT_COLUMNS = """
+            Z_PK AS pk,
+            ZNAME AS name,
+            ZACTIONCOUNT AS action_count,
+            ZMODIFICATIONDATE AS modified_at,
+            ZWORKFLOWID AS workflow_id
+"""
+
+# ShortcutRow fields that listings may leave out, and the column behind each.
+SHORTCUT_OPTIONAL_COLUMNS = {
+    "action_count": "ZACTIONCOUNT",
+    "modified_at": "ZMODIFICATIONDATE",
+    "workflow_id": "ZWORKFLOWID",
+}
+
+# Sort key expression and direction per listing order; Z_PK breaks ties so
+# every row has a unique position for keyset cursors.
+_SHORTCUT_SORTS: dict[ShortcutSort, tuple[str, str]] = {
+    "name": ("ZNAME COLLATE NOCASE", "ASC"),
+    "modified": ("IFNULL(ZMODIFICATIONDATE, -1e308)", "DESC"),
+    "action_count": ("IFNULL(ZACTIONCOUNT, 0)", "DESC"),
+}
+
+_SHORTCUT_BY_NAME_SQL = f"""
+        SELECT {_SHORTCUT_COLUMNS}
+        FROM ZSHORTCUT
+        WHERE ZNAME = ?
+        LIMIT 1
+"""
+
+_SHORTCUT_ACTIONS_SQL = """
+        SELECT ZDATA AS data
+        FROM ZSHORTCUTACTIONS
+        WHERE ZSHORTCUT = ?
+        LIMIT 1
+"""
+
+_SHORTCUT_VERSIONS_SQL = """
+        SELECT Z_PK AS pk, ZMODIFICATIONDATE AS modified_at
+        FROM ZSHORTCUT
+        WHERE ZNAME IS NOT NULL
+        ORDER BY ZNAME COLLATE NOCASE, Z_PK
+"""
+
+# json_each keeps the statement text fixed regardless of how many PKs are
+# requested, so it stays in the statement cache.
+_SHORTCUTS_BY_PKS_SQL = f"""
+        SELECT {_SHORTCUT_COLUMNS}
+        FROM ZSHORTCUT
+        WHERE Z_PK IN (SELECT value FROM json_each(?))
+"""
+
+_ACTIONS_BY_PKS_SQL = """
+        SELECT ZSHORTCUT AS pk, ZDATA AS data
+        FROM ZSHORTCUTACTIONS
+        WHERE ZSHORTCUT IN (SELECT value FROM json_each(?))
+        ORDER BY Z_PK
+"""
+
+_LIBRARY_PROBE_SQL = """
+        SELECT
+            count(*),
+            max(Z_PK),
+            max(ZMODIFICATIONDATE),
+            total(ZMODIFICATIONDATE)
+        FROM ZSHORTCUT
+"""
+
+_FOLDERS_SQL = """
+        SELECT
+            COALESCE(ZTEMPORARYSYNCFOLDERNAME, ZIDENTIFIER) AS name
+        FROM ZCOLLECTION
+        WHERE ZIDENTIFIER IS NOT NULL
+        ORDER BY name COLLATE NOCASE
+"""
+
+_SEARCH_BY_NAME_SQL = f"""
+        SELECT {_SHORTCUT_COLUMNS}
+        FROM ZSHORTCUT
+        WHERE ZNAME LIKE ?
+        ORDER BY ZNAME COLLATE NOCASE
+"""
+
 
 @dataclass
 class ShortcutRow:
@@ -21,11 +135,433 @@ class ShortcutRow:
     folder: str | None
 
 
-def _connect() -> aiosqlite.Connection:
-    """Create a read-only connection to the Shortcuts database."""
-    db_path = get_db_path()
+@dataclass
+class ShortcutPage:
+    rows: list[ShortcutRow]
+    next_cursor: str | None
+
+
+_FileIdentity = tuple[str, int, int]
+
+
+def _file_identity(db_path: Path) -> _FileIdentity:
+    """Identify the database file so a replaced file forces a reconnect."""
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return (str(db_path), -1, -1)
+    return (str(db_path), stat.st_dev, stat.st_ino)
+
+
+async def _open_connection(db_path: Path) -> aiosqlite.Connection:
+    """Open a read-only connection tuned for repeated reads."""
     uri = f"file:{db_path}?mode=ro"
-    return aiosqlite.connect(uri, uri=True)
+    conn = await aiosqlite.connect(
+        uri, uri=True, cached_statements=STATEMENT_CACHE_SIZE
+    )
+    try:
+        conn.row_factory = aiosqlite.Row
+        await conn.execute("PRAGMA query_only = ON")
+        await conn.execute(f"PRAGMA mmap_size = {get_db_mmap_bytes()}")
+        await conn.execute(f"PRAGMA cache_size = -{get_db_cache_kib()}")
+    except BaseException:
+        await conn.close()
+        raise
+    return conn
+
+
+class ConnectionPool:
+    """A small pool of persistent read-only connections to the Shortcuts database.
+
+    Connections are opened lazily up to ``size`` and reused across calls. When the
+    configured database path changes, or the file at that path is replaced, idle
+    connections are closed and in-flight ones are discarded on release.
+    """
+
+    def __init__(self, size: int | None = None) -> None:
+        self._size = size
+        self._idle: list[aiosqlite.Connection] = []
+        self._open = 0
+        self._generation = 0
+        self._identity: _FileIdentity | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._available: asyncio.Condition | None = None
+
+    @property
+    def size(self) -> int:
+        return self._size if self._size is not None else get_db_pool_size()
+
+    @property
+    def open_connections(self) -> int:
+        return self._open
+
+    def _condition(self) -> asyncio.Condition:
+        # aiosqlite connections are not tied to an event loop, but asyncio
+        # primitives are; rebuild them if the pool is used from a new loop.
+        loop = asyncio.get_running_loop()
+        if self._available is None or self._loop is not loop:
+            self._loop = loop
+            self._available = asyncio.Condition()
+        return self._available
+
+    def _invalidate(self) -> list[aiosqlite.Connection]:
+        stale = self._idle
+        self._idle = []
+        self._open -= len(stale)
+        self._generation += 1
+        return stale
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        available = self._condition()
+        db_path = get_db_path()
+        identity = _file_identity(db_path)
+
+        stale: list[aiosqlite.Connection] = []
+        conn: aiosqlite.Connection | None = None
+        async with available:
+            if identity != self._identity:
+                stale = self._invalidate()
+                self._identity = identity
+                available.notify_all()
+            while not self._idle and self._open >= self.size:
+                await available.wait()
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                self._open += 1
+            generation = self._generation
+
+        await _close_all(stale)
+
+        if conn is None:
+            try:
+                conn = await _open_connection(db_path)
+            except BaseException:
+                async with available:
+                    self._open -= 1
+                    available.notify()
+                raise
+
+        healthy = False
+        try:
+            yield conn
+            healthy = True
+        except (sqlite3.DatabaseError, ValueError):
+            # The connection may be unusable (e.g. the file vanished underneath
+            # it); drop it rather than handing it to the next caller.
+            raise
+        except BaseException:
+            healthy = True
+            raise
+        finally:
+            keep = False
+            async with available:
+                if healthy and generation == self._generation:
+                    self._idle.append(conn)
+                    keep = True
+                else:
+                    self._open -= 1
+                available.notify()
+            if not keep:
+                await conn.close()
+
+    async def close(self) -> None:
+        """Close every idle connection and reset the pool."""
+        stale = self._idle
+        self._idle = []
+        self._open -= len(stale)
+        self._generation += 1
+        self._identity = None
+        await _close_all(stale)
+
+
+async def _close_all(connections: Iterable[aiosqlite.Connection]) -> None:
+    for conn in connections:
+        try:
+            await conn.close()
+        except (sqlite3.Error, ValueError):
+            continue
+
+
+# (path, st_ino, st_mtime_ns, st_size) of the database and of its WAL file.
+_LibraryStat = tuple[tuple[str, int, int, int] | None, ...]
+
+
+def _library_stat(db_path: Path) -> _LibraryStat:
+    stats: list[tuple[str, int, int, int] | None] = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats.append(None)
+            continue
+        stats.append((str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(stats)
+
+
+class LibraryChangeDetector:
+    """Cheaply tells whether the Shortcuts library changed since the last check.
+
+    Each check escalates only as far as needed:
+
+    1. stat the database and its WAL (inode, mtime, size); if nothing moved,
+       no SQL runs at all;
+    2. read ``PRAGMA data_version`` on a connection held for this purpose; it
+       only changes when another connection commits;
+    3. probe ZSHORTCUT (row count, max Z_PK, max and sum of
+       ZMODIFICATIONDATE), so commits that only touch other tables, and
+       checkpoints, do not count as changes.
+
+    Caches subscribe a callback and call ``check()`` before serving from
+    memory; callbacks run when the probe differs or the database file itself
+    is replaced (or reopened). The first check only records a baseline.
+    """
+
+    def __init__(self) -> None:
+        self._conn: aiosqlite.Connection | None = None
+        self._identity: _FileIdentity | None = None
+        self._stat: _LibraryStat | None = None
+        self._data_version: int | None = None
+        self._probe: tuple[object, ...] | None = None
+        self._subscribers: list[Callable[[], None]] = []
+        self._lock = asyncio.Lock()
+        self.generation = 0
+
+    def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call ``callback`` on every detected change; returns an unsubscriber."""
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    async def check(self) -> bool:
+        """Look for changes, notifying subscribers; returns whether one was seen."""
+        async with self._lock:
+            db_path = get_db_path()
+            stat = _library_stat(db_path)
+            if self._conn is not None and stat == self._stat:
+                return False
+
+            identity = _file_identity(db_path)
+            if self._conn is None or identity != self._identity:
+                await self._close_connection()
+                self._conn = await _open_connection(db_path)
+                self._identity = identity
+                self._stat = stat
+                self._data_version = await self._read_data_version(self._conn)
+                changed = self._probe is not None
+                self._probe = await self._read_probe(self._conn)
+            else:
+                self._stat = stat
+                data_version = await self._read_data_version(self._conn)
+                if data_version == self._data_version:
+                    return False
+                self._data_version = data_version
+                probe = await self._read_probe(self._conn)
+                changed = probe != self._probe
+                self._probe = probe
+
+            if changed:
+                self.generation += 1
+                for callback in list(self._subscribers):
+                    callback()
+            return changed
+
+    @staticmethod
+    async def _read_data_version(conn: aiosqlite.Connection) -> int:
+        cursor = await conn.execute("PRAGMA data_version")
+        try:
+            row = await cursor.fetchone()
+        finally:
+            await cursor.close()
+        return int(row[0]) if row is not None else 0
+
+    @staticmethod
+    async def _read_probe(conn: aiosqlite.Connection) -> tuple[object, ...]:
+        cursor = await conn.execute(_LIBRARY_PROBE_SQL)
+        try:
+            row = await cursor.fetchone()
+        finally:
+            await cursor.close()
+        return tuple(row) if row is not None else ()
+
+    async def _close_connection(self) -> None:
+        if self._conn is not None:
+            await _close_all([self._conn])
+        self._conn = None
+        self._identity = None
+
+    async def close(self) -> None:
+        """Close the held connection; the next check reports a change."""
+        async with self._lock:
+            await self._close_connection()
+
+
+@dataclass
+class QueryStats:
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow: int = 0
+
+
+def _plan_is_full_scan(plan: list[str]) -> bool:
+    # "SCAN t" reads every row of a table; "SCAN t USING ... INDEX" walks an
+    # index instead, and table-valued functions such as json_each are cheap.
+    return any(
+        line.startswith("SCAN ") and "USING" not in line and "VIRTUAL TABLE" not in line
+        for line in plan
+    )
+
+
+class QueryLog:
+    """Per-statement timings and row counts, with a log of slow statements.
+
+    Statements taking at least the threshold (``SHORTCUTS_SLOW_QUERY_MS``
+    unless given; 0 disables the log) are logged as JSON together with their
+    ``EXPLAIN QUERY PLAN``, which is captured once per distinct statement.
+    Parameter values are never logged.
+    """
+
+    def __init__(self, threshold_ms: int | None = None) -> None:
+        self._threshold_ms = threshold_ms
+        self.statements: dict[str, QueryStats] = {}
+        self._plans: dict[str, list[str]] = {}
+
+    @property
+    def threshold_ms(self) -> int:
+        if self._threshold_ms is not None:
+            return self._threshold_ms
+        return get_slow_query_ms()
+
+    async def record(
+        self,
+        conn: aiosqlite.Connection,
+        sql: str,
+        parameters: tuple[object, ...],
+        rows: int,
+        elapsed_ms: float,
+    ) -> None:
+        metrics.observe("db.query", elapsed_ms)
+        metrics.increment("db.rows", rows)
+        statement = _normalize_sql(sql)
+        stats = self.statements.get(statement)
+        if stats is None:
+            stats = self.statements[statement] = QueryStats()
+        stats.calls += 1
+        stats.rows += rows
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+        threshold = self.threshold_ms
+        if not threshold or elapsed_ms < threshold:
+            return
+        stats.slow += 1
+        metrics.increment("db.slow_queries")
+        plan = self._plans.get(statement)
+        if plan is None:
+            plan = self._plans[statement] = await _explain(conn, sql, parameters)
+        entry = {
+            "event": "slow_query",
+            "statement": statement,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "threshold_ms": threshold,
+            "rows": rows,
+            "parameters": len(parameters),
+            "plan": plan,
+            "full_scan": _plan_is_full_scan(plan),
+        }
+        logger.warning("Slow query: %s", json.dumps(entry), extra={"query": entry})
+
+    def summary(self, limit: int = 10) -> list[dict[str, object]]:
+        """The statements with the most total time, slowest first."""
+        ranked = sorted(
+            self.statements.items(), key=lambda item: item[1].total_ms, reverse=True
+        )
+        return [
+            {
+                "statement": statement,
+                "calls": stats.calls,
+                "rows": stats.rows,
+                "total_ms": round(stats.total_ms, 3),
+                "mean_ms": round(stats.total_ms / stats.calls, 3),
+                "max_ms": round(stats.max_ms, 3),
+                "slow": stats.slow,
+                "plan": self._plans.get(statement),
+            }
+            for statement, stats in ranked[:limit]
+        ]
+
+    def clear(self) -> None:
+        self.statements.clear()
+        self._plans.clear()
+
+
+# Statement texts are fixed or built from a few variants, so this stays small.
+@functools.lru_cache(maxsize=256)
+def _normalize_sql(sql: str) -> str:
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+async def _explain(
+    conn: aiosqlite.Connection, sql: str, parameters: tuple[object, ...]
+) -> list[str]:
+    try:
+        cursor = await conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)
+        try:
+            return [str(row[3]) for row in await cursor.fetchall()]
+        finally:
+            await cursor.close()
+    except sqlite3.Error as exc:
+        return [f"EXPLAIN failed: {exc}"]
+
+
+pool = ConnectionPool()
+library_changes = LibraryChangeDetector()
+query_log = QueryLog()
+
+# Results kept until the library changes, keyed by query.
+_library_cache: dict[str, object] = {}
+library_changes.subscribe(_library_cache.clear)
+
+
+async def close_pool() -> None:
+    """Close pooled connections; call before shutting the server down."""
+    await pool.close()
+    await library_changes.close()
+
+
+async def _fetchall(sql: str, parameters: Iterable[object] = ()) -> list[sqlite3.Row]:
+    values = tuple(parameters)
+    async with pool.acquire() as conn:
+        start = time.perf_counter()
+        cursor = await conn.execute(sql, values)
+        try:
+            rows = list(await cursor.fetchall())
+        finally:
+            await cursor.close()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        await query_log.record(conn, sql, values, len(rows), elapsed_ms)
+    return rows
+
+
+async def _fetchone(sql: str, parameters: Iterable[object] = ()) -> sqlite3.Row | None:
+    values = tuple(parameters)
+    async with pool.acquire() as conn:
+        start = time.perf_counter()
+        cursor = await conn.execute(sql, values)
+        try:
+            row = await cursor.fetchone()
+        finally:
+            await cursor.close()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        await query_log.record(conn, sql, values, int(row is not None), elapsed_ms)
+    return row
 
 
 def _normalize_uuid(value: str | bytes | int | None) -> str | None:
@@ -53,82 +589,166 @@ def _convert_cocoa_date(value: float | int | str | bytes | None) -> str | None:
     return (COCOA_EPOCH + timedelta(seconds=seconds)).isoformat()
 
 
+def _shortcut_from_row(row: sqlite3.Row) -> ShortcutRow:
+    return ShortcutRow(
+        pk=row["pk"],
+        name=row["name"],
+        action_count=row["action_count"],
+        modified_at=_convert_cocoa_date(row["modified_at"]),
+        workflow_id=_normalize_uuid(row["workflow_id"]),
+        folder=None,  # Folder relationship not available in schema
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _shortcuts_page_sql(
+    sort: ShortcutSort, columns: frozenset[str], after: bool, limited: bool
+) -> str:
+    key, direction = _SHORTCUT_SORTS[sort]
+    selected = ",\n".join(
+        f"{column if field in columns else 'NULL'} AS {field}"
+        for field, column in SHORTCUT_OPTIONAL_COLUMNS.items()
+    )
+    where = "ZNAME IS NOT NULL"
+    if after:
+        operator = ">" if direction == "ASC" else "<"
+        where += f" AND ({key} {operator} ? OR ({key} = ? AND Z_PK > ?))"
+    return f"""
+        SELECT Z_PK AS pk, ZNAME AS name, {key} AS sort_key,
+            {selected}
+        FROM ZSHORTCUT
+        WHERE {where}
+        ORDER BY {key} {direction}, Z_PK
+        {"LIMIT ?" if limited else ""}
+    """
+
+
+def _encode_cursor(sort: ShortcutSort, key: object, pk: int) -> str:
+    payload = json.dumps([sort, key, pk], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, sort: ShortcutSort) -> tuple[object, int]:
+    try:
+        decoded: object = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except ValueError as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(decoded, list) or len(cast(list[object], decoded)) != 3:
+        raise ValueError("Invalid cursor")
+    cursor_sort, key, pk = cast(list[object], decoded)
+    if cursor_sort != sort or not isinstance(pk, int):
+        raise ValueError("Cursor does not match the requested sort")
+    return key, pk
+
+
+async def get_shortcuts_page(
+    sort: ShortcutSort = "name",
+    limit: int | None = None,
+    cursor: str | None = None,
+    columns: Iterable[str] | None = None,
+) -> ShortcutPage:
+    """Fetch one page of shortcuts with ordering and paging done in SQL.
+
+    ``cursor`` is the ``next_cursor`` of the previous page. ``columns`` limits
+    the optional ShortcutRow fields that are read (see
+    SHORTCUT_OPTIONAL_COLUMNS); the others are None.
+    """
+    if sort not in _SHORTCUT_SORTS:
+        raise ValueError(f"Unknown sort: {sort}")
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    selected = frozenset(SHORTCUT_OPTIONAL_COLUMNS if columns is None else columns)
+    unknown = selected - SHORTCUT_OPTIONAL_COLUMNS.keys()
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+    parameters: list[object] = []
+    if cursor is not None:
+        key, pk = _decode_cursor(cursor, sort)
+        parameters += [key, key, pk]
+    if limit is not None:
+        # One extra row tells whether another page follows.
+        parameters.append(limit + 1)
+    sql = _shortcuts_page_sql(sort, selected, cursor is not None, limit is not None)
+    rows = await _fetchall(sql, parameters)
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(sort, rows[-1]["sort_key"], rows[-1]["pk"])
+    return ShortcutPage([_shortcut_from_row(row) for row in rows], next_cursor)
+
+
 async def get_all_shortcuts(folder: str | None = None) -> list[ShortcutRow]:
     """Get all shortcuts from the database.
 
     Note: folder filtering is not supported in current macOS schema.
     """
-    query = """
-        SELECT
-            Z_PK AS pk,
-            ZNAME AS name,
-            ZACTIONCOUNT AS action_count,
-            ZMODIFICATIONDATE AS modified_at,
-            ZWORKFLOWID AS workflow_id
-        FROM ZSHORTCUT
-        WHERE ZNAME IS NOT NULL
-        ORDER BY ZNAME COLLATE NOCASE
-    """
-    async with _connect() as conn:
-        conn.row_factory = aiosqlite.Row
-        rows = await (await conn.execute(query)).fetchall()
-
-    return [
-        ShortcutRow(
-            pk=row["pk"],
-            name=row["name"],
-            action_count=row["action_count"],
-            modified_at=_convert_cocoa_date(row["modified_at"]),
-            workflow_id=_normalize_uuid(row["workflow_id"]),
-            folder=None,  # Folder relationship not available in schema
-        )
-        for row in rows
-    ]
+    page = await get_shortcuts_page()
+    return page.rows
 
 
 async def get_shortcut_by_name(name: str) -> ShortcutRow | None:
     """Get a shortcut by its name."""
-    query = """
-        SELECT
-            Z_PK AS pk,
-            ZNAME AS name,
-            ZACTIONCOUNT AS action_count,
-            ZMODIFICATIONDATE AS modified_at,
-            ZWORKFLOWID AS workflow_id
-        FROM ZSHORTCUT
-        WHERE ZNAME = ?
-        LIMIT 1
-    """
-    async with _connect() as conn:
-        conn.row_factory = aiosqlite.Row
-        row = await (await conn.execute(query, [name])).fetchone()
+    row = await _fetchone(_SHORTCUT_BY_NAME_SQL, [name])
     if not row:
         return None
-    return ShortcutRow(
-        pk=row["pk"],
-        name=row["name"],
-        action_count=row["action_count"],
-        modified_at=_convert_cocoa_date(row["modified_at"]),
-        workflow_id=_normalize_uuid(row["workflow_id"]),
-        folder=None,
-    )
+    return _shortcut_from_row(row)
 
 
 async def get_shortcut_actions(shortcut_pk: int) -> bytes | None:
-    query = """
-        SELECT ZDATA AS data
-        FROM ZSHORTCUTACTIONS
-        WHERE ZSHORTCUT = ?
-        LIMIT 1
-    """
-    async with _connect() as conn:
-        conn.row_factory = aiosqlite.Row
-        row = await (await conn.execute(query, [shortcut_pk])).fetchone()
+    row = await _fetchone(_SHORTCUT_ACTIONS_SQL, [shortcut_pk])
     if not row:
         return None
     return row["data"]
 
 
+async def get_shortcut_versions() -> dict[int, str | None]:
+    """Map each shortcut PK to its modification date without reading blobs.
+
+    Keys are in name order, matching get_all_shortcuts. The result is served
+    from memory until ``library_changes`` sees the library change.
+    """
+    await library_changes.check()
+    versions = cast(dict[int, str | None] | None, _library_cache.get("versions"))
+    if versions is None:
+        rows = await _fetchall(_SHORTCUT_VERSIONS_SQL)
+        versions = {row["pk"]: _convert_cocoa_date(row["modified_at"]) for row in rows}
+        _library_cache["versions"] = versions
+    return dict(versions)
+
+
+async def get_shortcuts_by_pks(shortcut_pks: Iterable[int]) -> dict[int, ShortcutRow]:
+    rows = await _fetchall(_SHORTCUTS_BY_PKS_SQL, [json.dumps(list(shortcut_pks))])
+    shortcuts = (_shortcut_from_row(row) for row in rows)
+    return {shortcut.pk: shortcut for shortcut in shortcuts}
+
+
+async def _actions_by_pks(shortcut_pks: Iterable[int]) -> dict[int, bytes]:
+    """Fetch the actions blob for several shortcuts in one query."""
+    rows = await _fetchall(_ACTIONS_BY_PKS_SQL, [json.dumps(list(shortcut_pks))])
+    blobs: dict[int, bytes] = {}
+    for row in rows:
+        if row["data"] is not None:
+            blobs.setdefault(row["pk"], row["data"])
+    return blobs
+
+
+async def iter_actions_by_pks(
+    shortcut_pks: Sequence[int], batch_size: int = ACTIONS_BATCH_SIZE
+) -> AsyncGenerator[tuple[list[int], dict[int, bytes]], None]:
+    """Stream the actions blobs of ``shortcut_pks``, one query per batch.
+
+    This is the bulk read behind every scan of shortcut actions. Each batch is
+    read only once the previous one has been consumed, so memory stays bounded
+    by ``batch_size``. Yields each batch of PKs with the blobs found for them;
+    shortcuts without actions are missing from the map.
+    """
+    for start in range(0, len(shortcut_pks), batch_size):
+        batch = list(shortcut_pks[start : start + batch_size])
+        yield batch, await _actions_by_pks(batch)
+
+
 async def get_folders() -> list[dict[str, str | int]]:
     """Get all collections/folders.
 
@@ -136,16 +756,7 @@ async def get_folders() -> list[dict[str, str | int]]:
     etc.)
     rather than user-defined folders. Returns collection identifiers or display names.
     """
-    query = """
-        SELECT
-            COALESCE(ZTEMPORARYSYNCFOLDERNAME, ZIDENTIFIER) AS name
-        FROM ZCOLLECTION
-        WHERE ZIDENTIFIER IS NOT NULL
-        ORDER BY name COLLATE NOCASE
-    """
-    async with _connect() as conn:
-        conn.row_factory = aiosqlite.Row
-        rows = await (await conn.execute(query)).fetchall()
+    rows = await _fetchall(_FOLDERS_SQL)
     return [
         {"name": row["name"], "shortcut_count": 0}  # Count not available without FK
         for row in rows
@@ -155,29 +766,6 @@ async def get_folders() -> list[dict[str, str | int]]:
 
 async def search_shortcuts_by_name(query: str) -> list[ShortcutRow]:
     """Search shortcuts by name pattern."""
-    sql = """
-        SELECT
-            Z_PK AS pk,
-            ZNAME AS name,
-            ZACTIONCOUNT AS action_count,
-            ZMODIFICATIONDATE AS modified_at,
-            ZWORKFLOWID AS workflow_id
-        FROM ZSHORTCUT
-        WHERE ZNAME LIKE ?
-        ORDER BY ZNAME COLLATE NOCASE
-    """
     like = f"%{query}%"
-    async with _connect() as conn:
-        conn.row_factory = aiosqlite.Row
-        rows = await (await conn.execute(sql, [like])).fetchall()
-    return [
-        ShortcutRow(
-            pk=row["pk"],
-            name=row["name"],
-            action_count=row["action_count"],
-            modified_at=_convert_cocoa_date(row["modified_at"]),
-            workflow_id=_normalize_uuid(row["workflow_id"]),
-            folder=None,
-        )
-        for row in rows
-    ]
+    rows = await _fetchall(_SEARCH_BY_NAME_SQL, [like])
+    return [_shortcut_from_row(row) for row in rows]
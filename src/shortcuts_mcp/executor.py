@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import json
-import subprocess
+import os
+import tempfile
 import time
+from dataclasses import dataclass
+from pathlib import Path
 from urllib.parse import quote
 
+from .config import get_input_file_threshold, get_max_output_bytes
+from .output import OutputCapture, output_spool
+from .processes import process_manager
 from .types import JsonValue
 
 
-def _stringify_input(value: JsonValue) -> str:
+def stringify_input(value: JsonValue) -> str:
     if value is None:
         return ""
     if isinstance(value, str):
@@ -21,48 +27,83 @@ def _applescript_literal(value: str) -> str:
     return json.dumps(value)
 
 
-def _open_url(url: str, timeout: int | None) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        ["open", url],
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        check=False,
-    )
+@dataclass(frozen=True, slots=True)
+class Execution:
+    """Outcome of one shortcut run through AppleScript."""
+
+    output: str
+    elapsed_ms: int
+    returncode: int
+    # Size of the full standard output, and whether ``output`` was cut short.
+    output_bytes: int = 0
+    truncated: bool = False
+    # Spool ID for reading the full output, when it was truncated.
+    output_id: str | None = None
+
+
+def output_capture() -> OutputCapture:
+    """Capture bounded by the configured limit, spooling overflow."""
+    return OutputCapture(get_max_output_bytes(), output_spool)
+
+
+def _write_input_file(text: str) -> Path:
+    handle, name = tempfile.mkstemp(prefix="shortcuts-mcp-input-", suffix=".txt")
+    with os.fdopen(handle, "w", encoding="utf-8") as file:
+        file.write(text)
+    return Path(name)
 
 
 async def run_via_applescript(
     name: str, input_value: JsonValue | None = None
-) -> tuple[str, int, int]:
+) -> Execution:
+    """Run a shortcut through Shortcuts Events and wait for its output.
+
+    Inputs larger than the configured threshold are written to a temporary
+    file that the script reads, rather than embedded in the ``-e`` argument.
+    """
     start = time.perf_counter()
     name_literal = _applescript_literal(name)
-    script = [
-        'tell application "Shortcuts Events"',
-    ]
-    if input_value is None:
-        script.append(f"    run the shortcut named {name_literal}")
-    else:
-        input_literal = _applescript_literal(_stringify_input(input_value))
-        script.append(
-            f"    run the shortcut named {name_literal} with input {input_literal}"
-        )
-    script.append("end tell")
-
-    process = await asyncio.create_subprocess_exec(
-        "osascript",
-        "-e",
-        "\n".join(script),
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+    script: list[str] = []
+    run_command = f"run the shortcut named {name_literal}"
+    input_path: Path | None = None
+    if input_value is not None:
+        text = stringify_input(input_value)
+        if len(text.encode()) > get_input_file_threshold():
+            input_path = await asyncio.to_thread(_write_input_file, text)
+            path_literal = _applescript_literal(str(input_path))
+            script.append(
+                f"set shortcutInput to read (POSIX file {path_literal}) as «class utf8»"
+            )
+            run_command += " with input shortcutInput"
+        else:
+            run_command += f" with input {_applescript_literal(text)}"
+    script.extend(
+        ['tell application "Shortcuts Events"', f"    {run_command}", "end tell"]
     )
-    stdout, stderr = await process.communicate()
-    output = stdout.decode().strip()
-    stderr_text = stderr.decode().strip() if stderr else ""
+
+    try:
+        stdout, stderr, returncode = await process_manager.run(
+            "osascript",
+            "-e",
+            "\n".join(script),
+            stdout=output_capture(),
+            stderr=OutputCapture(get_max_output_bytes()),
+        )
+    finally:
+        if input_path is not None:
+            input_path.unlink(missing_ok=True)
+    output = stdout.summary().strip()
+    stderr_text = stderr.summary().strip()
     if stderr_text:
         output = f"{output}\n{stderr_text}".strip()
-    elapsed_ms = int((time.perf_counter() - start) * 1000)
-    returncode = process.returncode if process.returncode is not None else 1
-    return output, elapsed_ms, returncode
+    return Execution(
+        output=output,
+        elapsed_ms=int((time.perf_counter() - start) * 1000),
+        returncode=returncode,
+        output_bytes=stdout.total,
+        truncated=stdout.truncated,
+        output_id=stdout.output_id,
+    )
 
 
 async def run_via_url_scheme(
@@ -70,12 +111,24 @@ async def run_via_url_scheme(
 ) -> None:
     url = f"shortcuts://run-shortcut?name={quote(name)}"
     if input_value is not None:
-        url += f"&input={quote(_stringify_input(input_value))}"
-
-    loop = asyncio.get_running_loop()
-    completed = await loop.run_in_executor(None, _open_url, url, timeout)
-    if completed.returncode != 0:
-        stderr = (completed.stderr or "").strip()
-        stdout = (completed.stdout or "").strip()
-        message = stderr or stdout or f"open returned {completed.returncode}"
+        text = stringify_input(input_value)
+        size = len(text.encode())
+        if size > get_input_file_threshold():
+            # A URL cannot point at a file; oversized URLs fail inside `open`.
+            raise RuntimeError(
+                f"Input of {size} bytes is too large for the URL scheme; "
+                "wait for the result or run in the background instead"
+            )
+        url += f"&input={quote(text)}"
+
+    try:
+        stdout, stderr, returncode = await process_manager.run(
+            "open", url, timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"open timed out after {timeout}s") from None
+    if returncode != 0:
+        message = (
+            stderr.text.strip() or stdout.text.strip() or f"open returned {returncode}"
+        )
         raise RuntimeError(message)
@@ -0,0 +1,154 @@
+"""Background shortcut runs addressed by job ID.
+
+A job wraps one scheduled run in an asyncio task so the tool call that
+started it can return at once. Finished jobs keep their result until their
+TTL passes or room is needed for new jobs; jobs still queued or running are
+never evicted, so the store rejects new jobs when all of its slots are busy.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from .config import get_run_job_limit, get_run_job_ttl
+from .metrics import metrics
+from .models import RunJobInfo, RunJobStatus, RunResult
+from .scheduler import RunTicket
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(slots=True)
+class RunJob:
+    job_id: str
+    ticket: RunTicket
+    task: asyncio.Task[RunResult]
+    submitted_at: str
+    finished_at: str | None = None
+
+    @property
+    def status(self) -> RunJobStatus:
+        if not self.task.done():
+            return "queued" if self.ticket.queue_wait_ms is None else "running"
+        if self.task.cancelled():
+            return "cancelled"
+        return "succeeded" if self.task.result().success else "failed"
+
+    def info(self, include_result: bool = True) -> RunJobInfo:
+        status = self.status
+        result = None
+        if include_result and status in {"succeeded", "failed"}:
+            result = self.task.result()
+        return RunJobInfo(
+            job_id=self.job_id,
+            name=self.ticket.name,
+            status=status,
+            submitted_at=self.submitted_at,
+            finished_at=self.finished_at,
+            result=result,
+        )
+
+
+class RunJobStore:
+    """Bounded registry of background runs with TTL eviction of finished ones.
+
+    Limits left as None follow the configuration.
+    """
+
+    def __init__(
+        self, max_jobs: int | None = None, ttl_seconds: float | None = None
+    ) -> None:
+        self._max_jobs = max_jobs
+        self._ttl_seconds = ttl_seconds
+        self._jobs: dict[str, RunJob] = {}
+        # Finished job IDs -> monotonic expiry, oldest finish first.
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def max_jobs(self) -> int:
+        return self._max_jobs if self._max_jobs is not None else get_run_job_limit()
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return get_run_job_ttl()
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._jobs)
+
+    def submit(
+        self,
+        ticket: RunTicket,
+        run: Callable[[], Coroutine[Any, Any, RunResult]],
+    ) -> RunJob:
+        """Start ``run()`` in the background under a new job ID.
+
+        Raises ``RuntimeError`` when every slot holds an unfinished job.
+        """
+        self._expire()
+        while len(self._jobs) >= self.max_jobs and self._expiry:
+            job_id, _ = self._expiry.popitem(last=False)
+            del self._jobs[job_id]
+        if len(self._jobs) >= self.max_jobs:
+            raise RuntimeError(f"Too many unfinished run jobs ({len(self._jobs)})")
+
+        job = RunJob(
+            job_id=uuid.uuid4().hex,
+            ticket=ticket,
+            task=asyncio.create_task(run()),
+            submitted_at=_now(),
+        )
+        self._jobs[job.job_id] = job
+        job.task.add_done_callback(lambda _: self._finish(job))
+        return job
+
+    def get(self, job_id: str) -> RunJob:
+        self._expire()
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"Unknown or expired run job: {job_id}")
+        return job
+
+    async def wait(self, job_id: str, timeout: float | None = None) -> RunJob:
+        """Return the job once it finishes or ``timeout`` seconds pass."""
+        job = self.get(job_id)
+        if timeout is None or timeout > 0:
+            # asyncio.wait leaves the job running when the timeout passes.
+            await asyncio.wait({job.task}, timeout=timeout)
+        return job
+
+    async def cancel(self, job_id: str) -> RunJob:
+        """Cancel a queued or running job and wait for it to stop."""
+        job = self.get(job_id)
+        if job.task.cancel():
+            await asyncio.wait({job.task})
+        return job
+
+    def _finish(self, job: RunJob) -> None:
+        job.finished_at = _now()
+        if self._jobs.get(job.job_id) is job:
+            self._expiry[job.job_id] = time.monotonic() + self.ttl_seconds
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        while self._expiry:
+            job_id, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            del self._expiry[job_id]
+            del self._jobs[job_id]
+
+
+run_jobs = RunJobStore()
+metrics.gauge("runs.jobs", lambda: len(run_jobs))
@@ -0,0 +1,254 @@
+"""In-process counters, gauges and latency histograms.
+
+Everything is recorded into the module-level ``metrics`` registry. Counters
+and histograms are plain in-memory updates; gauges are callables read only
+when a snapshot is taken, so state that other modules already track (queue
+depth, cache sizes) costs nothing on the hot path. ``get_server_stats``
+returns a snapshot, and when ``SHORTCUTS_METRICS_FILE`` is set the registry
+also writes a Prometheus text dump there, at most every
+``SHORTCUTS_METRICS_INTERVAL`` seconds.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import os
+import re
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from .config import get_metrics_file, get_metrics_interval
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Upper bounds in milliseconds; anything slower lands in the overflow bucket.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
+_PROMETHEUS_PREFIX = "shortcuts_mcp_"
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+class Histogram:
+    """Fixed-bucket histogram; quantiles are interpolated within a bucket."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS_MS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count or seen + bucket_count < rank:
+                seen += bucket_count
+                continue
+            if index == len(self.bounds):
+                return self.max
+            lower = self.bounds[index - 1] if index else 0.0
+            upper = self.bounds[index]
+            estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+            return min(estimate, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int | None]:
+        def rounded(value: float | None) -> float | None:
+            return None if value is None else round(value, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": rounded(self.total / self.count if self.count else None),
+            "p50_ms": rounded(self.quantile(0.5)),
+            "p95_ms": rounded(self.quantile(0.95)),
+            "p99_ms": rounded(self.quantile(0.99)),
+            "max_ms": rounded(self.max if self.count else None),
+        }
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms shared by the whole server."""
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self._gauges: dict[str, Callable[[], float | int]] = {}
+        # Parsing and catalog scans also run on worker threads.
+        self._lock = threading.Lock()
+        self._last_dump = 0.0
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value_ms: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def gauge(self, name: str, read: Callable[[], float | int]) -> None:
+        """Register ``read`` to be sampled whenever metrics are reported."""
+        self._gauges[name] = read
+
+    @contextmanager
+    def timer(self, name: str) -> Generator[None, None, None]:
+        """Observe the time spent in the block, in milliseconds, as ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - start) * 1000)
+
+    def instrument(
+        self, prefix: str
+    ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Coroutine[Any, Any, R]]]:
+        """Count calls and errors of an async function and time it.
+
+        Records ``<prefix>.<name>.calls``, ``.errors`` and the ``<prefix>.<name>``
+        latency histogram. The wrapper keeps the function's signature, so it
+        can sit under ``@mcp.tool()``.
+        """
+
+        def decorate(
+            func: Callable[P, Awaitable[R]],
+        ) -> Callable[P, Coroutine[Any, Any, R]]:
+            name = f"{prefix}.{getattr(func, '__name__', 'call')}"
+
+            @functools.wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                except BaseException:
+                    self.increment(f"{name}.errors")
+                    raise
+                finally:
+                    self.increment(f"{name}.calls")
+                    self.observe(name, (time.perf_counter() - start) * 1000)
+                    self.maybe_dump()
+
+            return wrapper
+
+        return decorate
+
+    def snapshot(self) -> dict[str, object]:
+        gauges: dict[str, float | int | None] = {}
+        for name, read in sorted(self._gauges.items()):
+            try:
+                gauges[name] = read()
+            except Exception:  # noqa: BLE001
+                gauges[name] = None
+        with self._lock:
+            counters = dict(sorted(self.counters.items()))
+            latency = {
+                name: histogram.summary()
+                for name, histogram in sorted(self.histograms.items())
+            }
+        return {"counters": counters, "gauges": gauges, "latency": latency}
+
+    def prometheus(self) -> str:
+        """The registry in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                metric = f"{_metric_name(name)}_total"
+                lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f"{_metric_name(name)}_ms"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound:g}"}} {cumulative}')
+                lines += [
+                    f'{metric}_bucket{{le="+Inf"}} {histogram.count}',
+                    f"{metric}_sum {histogram.total:.3f}",
+                    f"{metric}_count {histogram.count}",
+                ]
+        for name, read in sorted(self._gauges.items()):
+            try:
+                value = read()
+            except Exception:  # noqa: BLE001
+                continue
+            metric = _metric_name(name)
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def maybe_dump(self) -> None:
+        """Write the Prometheus dump if a file is configured and it is due."""
+        path = get_metrics_file()
+        if path is None:
+            return
+        now = time.monotonic()
+        if self._last_dump and now - self._last_dump < get_metrics_interval():
+            return
+        self._last_dump = now
+        try:
+            self.write_prometheus(path)
+        except OSError:
+            pass
+
+    def write_prometheus(self, path: Path) -> None:
+        """Replace ``path`` atomically so scrapers never see a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(self.prometheus())
+            os.replace(temp_name, path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    def reset(self) -> None:
+        """Drop counters and histograms; registered gauges are kept."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+        self._last_dump = 0.0
+
+
+def _metric_name(name: str) -> str:
+    return _PROMETHEUS_PREFIX + _INVALID_NAME_CHARS.sub("_", name)
+
+
+metrics = MetricsRegistry()
@@ -19,6 +19,10 @@ class ShortcutMetadata(BaseModel):
     action_types: list[str] | None = None
 
 
+class ShortcutMatch(ShortcutMetadata):
+    score: float | None = None
+
+
 class ShortcutDetail(BaseModel):
     name: str
     id: str | None = None
@@ -38,10 +42,56 @@ class RunResult(BaseModel):
     success: bool
     output: str | None = None
     execution_time_ms: int | None = None
+    queue_wait_ms: int | None = None
+    cached: bool = False
+    # Full size of the output; when truncated, read it all via output_id.
+    output_bytes: int | None = None
+    output_truncated: bool = False
+    output_id: str | None = None
+
+
+class BatchRunItem(BaseModel):
+    name: str
+    input: object = None
+    # Overrides the batch timeout for this item.
+    timeout: int | None = None
+
+
+class BatchRunResult(RunResult):
+    name: str
+
+
+RunJobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class RunJobInfo(BaseModel):
+    job_id: str
+    name: str
+    status: RunJobStatus
+    submitted_at: str
+    finished_at: str | None = None
+    result: RunResult | None = None
+
+
+ProfileMode = Literal["cpu", "memory", "both"]
+
+
+class ProfileSettings(BaseModel):
+    # fnmatch patterns of tool names to profile; empty disables profiling.
+    tools: list[str]
+    mode: ProfileMode
+    threshold_ms: int
+    sample_rate: float
 
 
 SearchIn = Literal["name", "actions", "both"]
 
+ShortcutSort = Literal["name", "modified", "action_count"]
+
+ShortcutField = Literal[
+    "name", "id", "folder", "action_count", "last_modified", "action_types"
+]
+
 ActionSource = Literal["system", "apps", "library", "curated"]
 
 
@@ -0,0 +1,202 @@
+"""In-memory fuzzy index over shortcut names.
+
+Names are split into lowercase words and each word into padded trigrams
+(``"  m", " ma", "mai", "ail", "il "``), so matching tolerates typos and
+ignores word order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import islice
+
+from .database import get_all_shortcuts, library_changes
+
+# Matches scoring below this are dropped.
+DEFAULT_MIN_SCORE = 0.3
+
+# Trigrams in at least 1 of this many names keep a cached bitmap.
+_DENSE_POSTINGS = 64
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Padded trigrams of each lowercase word in ``text``."""
+    grams: set[str] = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+@dataclass(frozen=True, slots=True)
+class NameMatch:
+    pk: int
+    name: str
+    score: float
+
+
+class ShortcutNameIndex:
+    """Trigram index of shortcut names, rebuilt when the library changes.
+
+    The score of a name is the average of two overlaps: the share of query
+    trigrams found in the name (so a short query contained in a long name
+    still scores well) and the Jaccard similarity of both trigram sets (so
+    closer-length names rank first).
+
+    Postings are integer bitmaps over names sorted case-insensitively. A query
+    adds the bitmaps of its trigrams into bit-sliced counters, which gives the
+    number of shared trigrams for every name in a few big-integer operations.
+    Since the score only depends on that count and the name's trigram count,
+    names are taken from (count, size) buckets in descending score order until
+    ``limit`` are found; only those positions are ever materialized.
+    """
+
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        self._pks: list[int] = []
+        self._postings: dict[str, list[int]] = {}
+        self._bitmaps: dict[str, int] = {}
+        self._size_masks: dict[int, int] = {}
+        self._sizes: list[int] = []
+        self._stale = True
+        self._lock = asyncio.Lock()
+        library_changes.subscribe(self._mark_stale)
+
+    def _mark_stale(self) -> None:
+        self._stale = True
+
+    def build(self, names: list[tuple[int, str]]) -> None:
+        """Replace the indexed ``(pk, name)`` pairs."""
+        ordered = sorted(names, key=lambda item: (item[1].lower(), item[0]))
+        self._names = [name for _, name in ordered]
+        self._pks = [pk for pk, _ in ordered]
+        postings: dict[str, list[int]] = {}
+        by_size: dict[int, list[int]] = {}
+        for position, name in enumerate(self._names):
+            grams = trigrams(name)
+            by_size.setdefault(len(grams), []).append(position)
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        self._postings = postings
+        self._bitmaps = {}
+        self._size_masks = {
+            size: self._to_bitmap(positions) for size, positions in by_size.items()
+        }
+        self._sizes = sorted(self._size_masks)
+
+    async def refresh(self) -> bool:
+        """Rebuild from the database if it changed; returns whether it did."""
+        async with self._lock:
+            await library_changes.check()
+            if not self._stale:
+                return False
+            # Cleared first so a change during the rebuild marks it stale again.
+            self._stale = False
+            try:
+                rows = await get_all_shortcuts()
+            except BaseException:
+                self._stale = True
+                raise
+            self.build([(row.pk, row.name) for row in rows])
+            return True
+
+    def search(
+        self,
+        query: str,
+        limit: int | None = 20,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> list[NameMatch]:
+        """Return up to ``limit`` names similar to ``query``, best first.
+
+        A blank query matches every name, in name order with a score of 1, as
+        the ``LIKE '%%'`` search this index replaced did.
+        """
+        if not query.strip():
+            names = zip(self._pks, self._names)
+            if limit is not None:
+                names = islice(names, limit)
+            return [NameMatch(pk, name, 1.0) for pk, name in names]
+        all_grams = trigrams(query)
+        query_grams = [gram for gram in all_grams if gram in self._postings]
+        query_size = len(all_grams)
+        if not query_grams:
+            return []
+
+        # planes[i] holds bit i of each name's shared-trigram count.
+        planes: list[int] = []
+        for gram in query_grams:
+            carry = self._bitmap(gram)
+            for level, plane in enumerate(planes):
+                planes[level], carry = plane ^ carry, plane & carry
+                if not carry:
+                    break
+            if carry:
+                planes.append(carry)
+        everyone = (1 << len(self._names)) - 1
+        counts: dict[int, int] = {}
+
+        def names_sharing(count: int) -> int:
+            mask = counts.get(count)
+            if mask is None:
+                mask = everyone
+                for level, plane in enumerate(planes):
+                    mask &= plane if count >> level & 1 else ~plane
+                counts[count] = mask
+            return mask
+
+        def score(count: int, size: int) -> float:
+            return (count / query_size + count / (query_size + size - count)) / 2
+
+        # One best-first stream per shared count, walking sizes upwards.
+        heap: list[tuple[float, int, int]] = []
+        for count in range(1, len(query_grams) + 1):
+            index = bisect_left(self._sizes, count)
+            if index < len(self._sizes):
+                heap.append((-score(count, self._sizes[index]), count, index))
+        heapq.heapify(heap)
+
+        matches: list[NameMatch] = []
+        while heap and (limit is None or len(matches) < limit):
+            negative, count, index = heapq.heappop(heap)
+            if -negative < min_score:
+                break
+            if index + 1 < len(self._sizes):
+                next_size = self._sizes[index + 1]
+                heapq.heappush(heap, (-score(count, next_size), count, index + 1))
+            bucket = names_sharing(count) & self._size_masks[self._sizes[index]]
+            rounded = round(-negative, 4)
+            # Lowest bits first, i.e. alphabetical order within a bucket.
+            while bucket and (limit is None or len(matches) < limit):
+                lowest = bucket & -bucket
+                position = lowest.bit_length() - 1
+                matches.append(
+                    NameMatch(self._pks[position], self._names[position], rounded)
+                )
+                bucket ^= lowest
+        return matches
+
+    def _bitmap(self, gram: str) -> int:
+        bitmap = self._bitmaps.get(gram)
+        if bitmap is not None:
+            return bitmap
+        positions = self._postings[gram]
+        bitmap = self._to_bitmap(positions)
+        # Keep dense bitmaps; sparse ones are cheaper to rebuild than to hold.
+        if len(positions) * _DENSE_POSTINGS >= len(self._names):
+            self._bitmaps[gram] = bitmap
+        return bitmap
+
+    def _to_bitmap(self, positions: list[int]) -> int:
+        buffer = bytearray(len(self._names) // 8 + 1)
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, "little")
+
+
+name_index = ShortcutNameIndex()
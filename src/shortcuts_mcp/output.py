@@ -0,0 +1,207 @@
+"""Bounded capture of run output, with optional spooling of the full text.
+
+A shortcut can print far more than a tool result should carry. An
+``OutputCapture`` keeps the first ``limit`` bytes of a stream in memory. Once
+the stream outgrows that, everything is written to a spool file instead,
+including the part already kept. Each spool file gets an ID that
+``get_run_output`` reads in chunks. Only the most recent spool files are
+kept. Each server process spools into its own subdirectory, removed at
+shutdown, so servers sharing a cache directory never delete each other's
+files. Spool files are created, written and pruned in worker threads so a
+large output never blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from .config import get_cache_dir, get_output_spool_files
+
+
+@dataclass(frozen=True, slots=True)
+class OutputChunk:
+    output_id: str
+    offset: int
+    data: str
+    next_offset: int | None
+    total_bytes: int
+
+
+class OutputSpool:
+    """Registry of spooled outputs under the cache directory.
+
+    The file count follows the configuration unless given; 0 disables spooling.
+    """
+
+    def __init__(self, directory: Path | None = None, max_files: int | None = None):
+        self._directory = directory
+        self._max_files = max_files
+        self._files: OrderedDict[str, Path] = OrderedDict()
+        self._session: Path | None = None
+        # Creation runs in worker threads; this keeps _files consistent.
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory or get_cache_dir() / "run-output"
+
+    @property
+    def max_files(self) -> int:
+        if self._max_files is not None:
+            return self._max_files
+        return get_output_spool_files()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_files > 0
+
+    async def create(self) -> tuple[str, BinaryIO]:
+        """Open a new spool file; returns its ID and a handle to write to."""
+        return await asyncio.to_thread(self._create)
+
+    def _create(self) -> tuple[str, BinaryIO]:
+        with self._lock:
+            session = self._session_dir()
+            while self._files and len(self._files) >= self.max_files:
+                _, oldest = self._files.popitem(last=False)
+                oldest.unlink(missing_ok=True)
+            output_id = uuid.uuid4().hex
+            path = session / f"{output_id}.out"
+            handle = path.open("wb")
+            self._files[output_id] = path
+            return output_id, handle
+
+    def close(self) -> None:
+        """Remove this process's spool files; call at shutdown."""
+        if self._session is not None:
+            shutil.rmtree(self._session, ignore_errors=True)
+            self._session = None
+        self._files.clear()
+
+    def _session_dir(self) -> Path:
+        if self._session is None:
+            directory = self.directory
+            directory.mkdir(parents=True, exist_ok=True)
+            _sweep_orphans(directory)
+            session = directory / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            session.mkdir()
+            self._session = session
+        return self._session
+
+    def read(self, output_id: str, offset: int = 0, length: int = 65536) -> OutputChunk:
+        """Read up to ``length`` bytes at ``offset`` as text.
+
+        A character split by the end of the chunk is left for the next one, so
+        following ``next_offset`` never breaks UTF-8 sequences.
+        """
+        path = self._files.get(output_id)
+        if path is None or not path.exists():
+            raise ValueError(f"Unknown or expired output: {output_id}")
+        if offset < 0 or length < 1:
+            raise ValueError("offset must be >= 0 and length >= 1")
+        with path.open("rb") as handle:
+            total = handle.seek(0, 2)
+            handle.seek(offset)
+            raw = handle.read(length)
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        final = offset + len(raw) >= total
+        data = decoder.decode(raw, final=final)
+        consumed = len(raw) - len(decoder.getstate()[0])
+        next_offset = offset + consumed
+        return OutputChunk(
+            output_id=output_id,
+            offset=offset,
+            data=data,
+            next_offset=next_offset if next_offset < total else None,
+            total_bytes=total,
+        )
+
+
+def _sweep_orphans(directory: Path) -> None:
+    """Remove spool directories left behind by processes that have exited."""
+    for entry in directory.iterdir():
+        pid, _, _ = entry.name.partition("-")
+        if entry.is_dir() and pid.isdigit() and not _pid_alive(int(pid)):
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to someone else.
+        return True
+    except OverflowError:
+        return False
+    return True
+
+
+class OutputCapture:
+    """The first ``limit`` bytes of a stream, spooling all of it on overflow."""
+
+    def __init__(self, limit: int | None = None, spool: OutputSpool | None = None):
+        self.limit = limit
+        self.total = 0
+        self.output_id: str | None = None
+        self._head = bytearray()
+        self._spool = spool if spool is not None and spool.enabled else None
+        self._file: BinaryIO | None = None
+
+    @property
+    def truncated(self) -> bool:
+        return self.limit is not None and self.total > self.limit
+
+    @property
+    def text(self) -> str:
+        """The kept bytes as text, without a character cut off by the limit."""
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        return decoder.decode(bytes(self._head), final=not self.truncated)
+
+    async def feed(self, data: bytes) -> None:
+        if self.limit is None:
+            self._head += data
+            self.total += len(data)
+            return
+        room = self.limit - len(self._head)
+        pending = data
+        if len(data) > room and self._file is None and self._spool is not None:
+            # First overflow: everything so far is still in the head.
+            try:
+                self.output_id, self._file = await self._spool.create()
+            except OSError:
+                self._spool = None
+            else:
+                pending = bytes(self._head) + data
+        if self._file is not None:
+            await asyncio.to_thread(self._file.write, pending)
+        if room > 0:
+            self._head += data[:room]
+        self.total += len(data)
+
+    async def close(self) -> None:
+        if self._file is not None:
+            file, self._file = self._file, None
+            await asyncio.to_thread(file.close)
+
+    def summary(self) -> str:
+        """``text`` plus a note on what was cut, if anything."""
+        if not self.truncated:
+            return self.text
+        note = f"[output truncated: {self.limit} of {self.total} bytes shown"
+        if self.output_id is not None:
+            note += f"; fetch the rest with get_run_output({self.output_id!r})"
+        return f"{self.text}\n{note}]"
+
+
+output_spool = OutputSpool()
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import plistlib
+import threading
+from collections import OrderedDict
 from typing import cast
 
+from .config import get_parse_cache_bytes
+from .metrics import metrics
 from .models import ShortcutAction
 
+# Rough per-entry bookkeeping cost charged on top of the blob size.
+_CACHE_ENTRY_OVERHEAD = 256
+
+# Parsed actions and the bytes charged for them.
+_CacheEntry = tuple[list[ShortcutAction], int]
+
 
 def _string_key_dict(value: dict[object, object]) -> dict[str, object]:
     return {str(key): item for key, item in value.items()}
@@ -92,3 +102,133 @@ def action_search_blob(actions: list[ShortcutAction]) -> str:
         if action.parameters:
             parts.append(str(action.parameters))
     return " ".join(parts)
+
+
+def _string_values(value: object) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [
+            text
+            for item in cast(dict[object, object], value).values()
+            for text in _string_values(item)
+        ]
+    if isinstance(value, (list, tuple)):
+        return [
+            text for item in cast(list[object], value) for text in _string_values(item)
+        ]
+    return []
+
+
+def action_index_text(actions: list[ShortcutAction]) -> tuple[str, str]:
+    """Split actions into identifier text and flattened string parameter values."""
+    identifiers = " ".join(action.identifier for action in actions)
+    values = " ".join(
+        text for action in actions for text in _string_values(action.parameters)
+    )
+    return identifiers, values
+
+
+class ParsedActionsCache:
+    """LRU cache of parsed actions keyed by shortcut PK and modification date.
+
+    A shortcut's actions only change when its ZMODIFICATIONDATE does, so the
+    parsed list can be reused until then. Entries are charged the size of the
+    source blob plus a fixed overhead against ``max_bytes``. Cached lists are
+    shared between callers and must not be mutated.
+
+    The cache is thread-safe; parsing itself happens outside the lock so
+    worker threads can parse different blobs concurrently.
+    """
+
+    def __init__(self, max_bytes: int | None = None) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[int, str], _CacheEntry] = OrderedDict()
+        self._versions: dict[int, str] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return get_parse_cache_bytes()
+
+    def get_or_parse(
+        self, shortcut_pk: int, modified_at: str | None, data: bytes
+    ) -> list[ShortcutAction]:
+        if modified_at is None:
+            # Without a modification date there is no safe cache key.
+            with self._lock:
+                self.misses += 1
+            return parse_actions(data)
+
+        key = (shortcut_pk, modified_at)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        actions = parse_actions(data)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Another thread parsed the same blob first; share its result.
+                return entry[0]
+
+            # A newer modification date supersedes whatever was cached for the PK.
+            previous = self._versions.pop(shortcut_pk, None)
+            if previous is not None:
+                self._discard((shortcut_pk, previous))
+
+            cost = len(data) + _CACHE_ENTRY_OVERHEAD
+            budget = self.max_bytes
+            if cost > budget:
+                return actions
+
+            self._entries[key] = (actions, cost)
+            self._versions[shortcut_pk] = modified_at
+            self._bytes += cost
+            while self._bytes > budget:
+                (evicted_pk, _), (_, evicted_cost) = self._entries.popitem(last=False)
+                self._versions.pop(evicted_pk, None)
+                self._bytes -= evicted_cost
+                self.evictions += 1
+        return actions
+
+    def _discard(self, key: tuple[int, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+actions_cache = ParsedActionsCache()
+# Misses are blobs actually parsed; the cache already counts both under its lock.
+metrics.gauge("parser.blobs_parsed", lambda: actions_cache.misses)
+metrics.gauge("parser.cache_hits", lambda: actions_cache.hits)
+metrics.gauge("parser.cache_evictions", lambda: actions_cache.evictions)
+metrics.gauge("parser.cache_bytes", lambda: actions_cache.stats()["bytes"])
@@ -0,0 +1,133 @@
+"""Child process lifecycle for shortcut runs.
+
+Every child is started in its own session, so it leads a new process group
+and anything it spawns can be signalled together. When a run times out or is
+cancelled, the group gets SIGTERM, then SIGKILL if it is still alive after a
+grace period. A reaper task per child waits for its exit status, so children
+never linger as zombies, and ``live`` counts children not yet reaped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+
+from .config import get_terminate_grace_ms
+from .metrics import metrics
+from .output import OutputCapture
+
+_READ_CHUNK_BYTES = 64 * 1024
+
+
+async def _pump(stream: asyncio.StreamReader, capture: OutputCapture) -> None:
+    while chunk := await stream.read(_READ_CHUNK_BYTES):
+        await capture.feed(chunk)
+
+
+class ProcessManager:
+    def __init__(self, grace_seconds: float | None = None) -> None:
+        self._grace_seconds = grace_seconds
+        self._live: set[asyncio.subprocess.Process] = set()
+        self._reapers: set[asyncio.Task[None]] = set()
+
+    @property
+    def grace_seconds(self) -> float:
+        if self._grace_seconds is not None:
+            return self._grace_seconds
+        return get_terminate_grace_ms() / 1000
+
+    @property
+    def live(self) -> int:
+        """Children started and not yet reaped."""
+        return len(self._live)
+
+    async def spawn(
+        self,
+        program: str,
+        *args: str,
+        stdin: int | None = asyncio.subprocess.DEVNULL,
+        stdout: int | None = asyncio.subprocess.PIPE,
+        stderr: int | None = asyncio.subprocess.PIPE,
+        limit: int = _READ_CHUNK_BYTES,
+    ) -> asyncio.subprocess.Process:
+        """Start a child; ``limit`` bounds ``readline`` on its pipes."""
+        process = await asyncio.create_subprocess_exec(
+            program,
+            *args,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+            limit=limit,
+            start_new_session=True,
+        )
+        self._live.add(process)
+        reaper = asyncio.create_task(self._reap(process))
+        self._reapers.add(reaper)
+        reaper.add_done_callback(self._reapers.discard)
+        return process
+
+    async def run(
+        self,
+        program: str,
+        *args: str,
+        timeout: float | None = None,
+        stdout: OutputCapture | None = None,
+        stderr: OutputCapture | None = None,
+    ) -> tuple[OutputCapture, OutputCapture, int]:
+        """Run to completion; returns ``(stdout, stderr, returncode)``.
+
+        Output is read incrementally into the given captures (unbounded ones by
+        default). On timeout (``asyncio.TimeoutError``) or cancellation the
+        child's process group is terminated before the exception propagates.
+        """
+        stdout = stdout if stdout is not None else OutputCapture()
+        stderr = stderr if stderr is not None else OutputCapture()
+        process = await self.spawn(program, *args)
+        assert process.stdout is not None and process.stderr is not None
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _pump(process.stdout, stdout),
+                    _pump(process.stderr, stderr),
+                    process.wait(),
+                ),
+                timeout,
+            )
+        except BaseException:
+            # Shielded so a second cancellation cannot cut the cleanup short.
+            await asyncio.shield(self.terminate(process))
+            raise
+        finally:
+            await stdout.close()
+            await stderr.close()
+        returncode = process.returncode if process.returncode is not None else 1
+        return stdout, stderr, returncode
+
+    async def terminate(self, process: asyncio.subprocess.Process) -> int:
+        """SIGTERM the process group, then SIGKILL it after the grace period."""
+        if process.returncode is None:
+            self.signal(process, signal.SIGTERM)
+            try:
+                return await asyncio.wait_for(process.wait(), self.grace_seconds)
+            except asyncio.TimeoutError:
+                pass
+        # Also catches group members left behind by a leader that exited.
+        self.signal(process, signal.SIGKILL)
+        return await process.wait()
+
+    def signal(self, process: asyncio.subprocess.Process, sig: int) -> None:
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    async def _reap(self, process: asyncio.subprocess.Process) -> None:
+        try:
+            await process.wait()
+        finally:
+            self._live.discard(process)
+
+
+process_manager = ProcessManager()
+metrics.gauge("processes.live", lambda: process_manager.live)
@@ -0,0 +1,231 @@
+"""Opt-in profiling of slow tool calls.
+
+Tools named by ``SHORTCUTS_PROFILE`` (comma-separated ``fnmatch`` patterns,
+``*`` for all) are profiled on a ``SHORTCUTS_PROFILE_SAMPLE_RATE`` fraction of
+calls, with ``cProfile``, ``tracemalloc`` or both (``SHORTCUTS_PROFILE_MODE``).
+Sampled calls that take at least ``SHORTCUTS_PROFILE_THRESHOLD_MS`` are
+written to ``SHORTCUTS_PROFILE_DIR``; only the newest
+``SHORTCUTS_PROFILE_KEEP`` captures are kept. The ``configure_profiling`` tool
+overrides these settings at runtime.
+
+Calls that are not sampled pay only a settings lookup. Profilers are
+process-wide, so one call is profiled at a time and a sampled call captures
+whatever else the event loop runs meanwhile; calls arriving while another is
+being profiled run unprofiled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import pstats
+import random
+import re
+import time
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable, Coroutine
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar, cast, get_args
+
+from .config import (
+    get_profile_dir,
+    get_profile_keep,
+    get_profile_mode,
+    get_profile_sample_rate,
+    get_profile_threshold_ms,
+    get_profile_tools,
+)
+from .metrics import metrics
+from .models import ProfileMode, ProfileSettings
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Lines in the text summaries written next to each capture.
+_SUMMARY_LINES = 40
+
+# Files written for one capture: "<stamp>-<tool>-<ms>ms-<id>" plus a suffix.
+# Anything else in the directory is left alone.
+_CAPTURE_FILE = re.compile(r"^(\d{8}T\d{9}-[^.]+)\.(?:prof|cpu\.txt|memory\.txt)$")
+
+
+def parse_settings(
+    tools: str, mode: str, threshold_ms: int, sample_rate: float
+) -> ProfileSettings:
+    """Settings from their configuration strings; unknown modes mean ``cpu``."""
+    mode = mode.strip().lower()
+    return ProfileSettings(
+        tools=[item.strip() for item in tools.split(",") if item.strip()],
+        mode=cast(ProfileMode, mode if mode in get_args(ProfileMode) else "cpu"),
+        threshold_ms=threshold_ms,
+        sample_rate=sample_rate,
+    )
+
+
+class ToolProfiler:
+    """Samples and profiles tool calls; writes the slow ones to disk.
+
+    The directory and retention follow the configuration unless given.
+    """
+
+    def __init__(self, directory: Path | None = None, keep: int | None = None):
+        self._directory = directory
+        self._keep = keep
+        self._override: ProfileSettings | None = None
+        self._active = False
+        self._config_spec: tuple[str, str, int, float] | None = None
+        self._configured = parse_settings("", "", 0, 0.0)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory or get_profile_dir()
+
+    @property
+    def keep(self) -> int:
+        if self._keep is not None:
+            return self._keep
+        return get_profile_keep()
+
+    @property
+    def settings(self) -> ProfileSettings:
+        if self._override is not None:
+            return self._override
+        spec = (
+            get_profile_tools(),
+            get_profile_mode(),
+            get_profile_threshold_ms(),
+            get_profile_sample_rate(),
+        )
+        if spec != self._config_spec:
+            self._configured = parse_settings(*spec)
+            self._config_spec = spec
+        return self._configured
+
+    def configure(self, **changes: object) -> ProfileSettings:
+        """Override settings at runtime; unspecified ones keep their value."""
+        self._override = ProfileSettings.model_validate(
+            {**self.settings.model_dump(), **changes}
+        )
+        return self._override
+
+    def reset(self) -> ProfileSettings:
+        """Drop runtime overrides and follow the configuration again."""
+        self._override = None
+        return self.settings
+
+    def profile(
+        self, func: Callable[P, Awaitable[R]]
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
+        """Wrap an async tool so sampled calls are profiled."""
+        name = getattr(func, "__name__", "call")
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            settings = self.settings
+            if (
+                self._active
+                or not settings.tools
+                or random.random() >= settings.sample_rate
+                or not any(fnmatchcase(name, pattern) for pattern in settings.tools)
+            ):
+                return await func(*args, **kwargs)
+            return await self._capture(name, settings, func(*args, **kwargs))
+
+        return wrapper
+
+    def recent(self) -> list[str]:
+        """File names of kept captures, newest first."""
+        return sorted(
+            (path.name for paths in self._captures().values() for path in paths),
+            reverse=True,
+        )
+
+    async def _capture(
+        self, name: str, settings: ProfileSettings, call: Awaitable[R]
+    ) -> R:
+        profile = cProfile.Profile() if settings.mode != "memory" else None
+        # Leave tracemalloc alone if something else already started it.
+        trace = settings.mode != "cpu" and not tracemalloc.is_tracing()
+        self._active = True
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        if profile is not None:
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler (a debugger, coverage) owns the hook.
+                profile = None
+        try:
+            return await call
+        finally:
+            if profile is not None:
+                profile.disable()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            snapshot = None
+            peak = 0
+            if trace:
+                _, peak = tracemalloc.get_traced_memory()
+                if elapsed_ms >= settings.threshold_ms:
+                    snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+            self._active = False
+            if elapsed_ms >= settings.threshold_ms:
+                try:
+                    self._write(name, elapsed_ms, profile, snapshot, peak)
+                except OSError:
+                    pass
+
+    def _write(
+        self,
+        name: str,
+        elapsed_ms: float,
+        profile: cProfile.Profile | None,
+        snapshot: tracemalloc.Snapshot | None,
+        peak: int,
+    ) -> None:
+        directory = self.directory
+        directory.mkdir(parents=True, exist_ok=True)
+        # Timestamp first so names sort oldest to newest.
+        now = time.time()
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(now))
+        stamp += f"{int(now * 1000) % 1000:03d}"
+        base = f"{stamp}-{name}-{int(elapsed_ms)}ms-{uuid.uuid4().hex[:6]}"
+        if profile is not None:
+            profile.dump_stats(directory / f"{base}.prof")
+            summary = io.StringIO()
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats("cumulative").print_stats(_SUMMARY_LINES)
+            (directory / f"{base}.cpu.txt").write_text(summary.getvalue())
+        if snapshot is not None:
+            lines = [f"{name}: {elapsed_ms:.1f}ms, peak {peak / 1024:.1f} KiB traced"]
+            lines += [
+                str(stat) for stat in snapshot.statistics("lineno")[:_SUMMARY_LINES]
+            ]
+            (directory / f"{base}.memory.txt").write_text("\n".join(lines) + "\n")
+        metrics.increment("profiler.captures")
+        self._prune()
+
+    def _captures(self) -> dict[str, list[Path]]:
+        """This profiler's files in the directory, grouped by capture."""
+        directory = self.directory
+        if not directory.is_dir():
+            return {}
+        captures: dict[str, list[Path]] = {}
+        for path in directory.iterdir():
+            match = _CAPTURE_FILE.match(path.name)
+            if match is not None:
+                captures.setdefault(match.group(1), []).append(path)
+        return captures
+
+    def _prune(self) -> None:
+        captures = self._captures()
+        for base in sorted(captures)[: -self.keep]:
+            for path in captures[base]:
+                path.unlink(missing_ok=True)
+
+
+profiler = ToolProfiler()
@@ -0,0 +1,187 @@
+"""Opt-in memoization of idempotent shortcut runs.
+
+Shortcuts named by ``SHORTCUTS_RUN_CACHE`` (comma-separated ``fnmatch``
+patterns, matched case-insensitively, each optionally followed by
+``=<ttl seconds>``) have their successful results cached by name and the
+canonical JSON of their input. Entries expire after their TTL, and the least
+recently used ones are dropped beyond ``SHORTCUTS_RUN_CACHE_SIZE``. Identical
+runs in flight at the same time share one execution.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+from .config import get_run_cache_patterns, get_run_cache_size, get_run_cache_ttl
+from .metrics import metrics
+from .models import RunResult
+from .scheduler import RunTicket
+from .types import JsonValue
+
+RunKey = tuple[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    pattern: str
+    ttl_seconds: float
+
+    def matches(self, name: str) -> bool:
+        return fnmatchcase(name.lower(), self.pattern.lower())
+
+
+def parse_policies(spec: str, default_ttl: float) -> list[CachePolicy]:
+    """Parse ``"Convert *=600, Read Note"``; entries with a bad TTL are skipped."""
+    policies: list[CachePolicy] = []
+    for entry in spec.split(","):
+        pattern, _, ttl = entry.partition("=")
+        pattern = pattern.strip()
+        if not pattern:
+            continue
+        try:
+            ttl_seconds = float(ttl) if ttl.strip() else default_ttl
+        except ValueError:
+            continue
+        policies.append(CachePolicy(pattern, ttl_seconds))
+    return policies
+
+
+def run_key(name: str, input_value: JsonValue | None) -> RunKey | None:
+    """Cache key for a run, or None when the input has no JSON form."""
+    try:
+        canonical = json.dumps(
+            input_value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    except (TypeError, ValueError):
+        return None
+    return name, canonical
+
+
+@dataclass(slots=True)
+class _Flight:
+    task: asyncio.Task[RunResult]
+    ticket: RunTicket | None = None
+    waiters: int = 0
+
+
+class RunResultCache:
+    """TTL + LRU cache of run results with single-flight execution.
+
+    Settings left as None follow the configuration.
+    """
+
+    def __init__(
+        self,
+        policies: list[CachePolicy] | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self._policies = policies
+        self._max_entries = max_entries
+        self._entries: OrderedDict[RunKey, tuple[float, RunResult]] = OrderedDict()
+        self._inflight: dict[RunKey, _Flight] = {}
+        self._policy_spec: tuple[str, float] | None = None
+        self._configured: list[CachePolicy] = []
+
+    @property
+    def policies(self) -> list[CachePolicy]:
+        if self._policies is not None:
+            return self._policies
+        spec = (get_run_cache_patterns(), float(get_run_cache_ttl()))
+        if spec != self._policy_spec:
+            self._configured = parse_policies(*spec)
+            self._policy_spec = spec
+        return self._configured
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return get_run_cache_size()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def policy_for(self, name: str) -> CachePolicy | None:
+        for policy in self.policies:
+            if policy.matches(name):
+                return policy
+        return None
+
+    async def get_or_run(
+        self,
+        name: str,
+        input_value: JsonValue | None,
+        run: Callable[[], Coroutine[Any, Any, RunResult]],
+        ticket: RunTicket | None = None,
+    ) -> RunResult:
+        """Return a cached or shared result for this run, or ``run()`` it.
+
+        Results served from the cache or from another caller's execution are
+        marked ``cached``. Only successful results are stored. A ``ticket``
+        joining another caller's execution follows that caller's ticket, so it
+        reports queued or running as the shared run does.
+        """
+        policy = self.policy_for(name)
+        key = run_key(name, input_value)
+        if policy is None or key is None:
+            return await run()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                metrics.increment("run_cache.hits")
+                return result.model_copy(update={"cached": True})
+            del self._entries[key]
+
+        flight = self._inflight.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = _Flight(asyncio.create_task(run()), ticket)
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda task: self._landed(key, policy, task))
+        elif ticket is not None:
+            ticket.leader = flight.ticket
+        flight.waiters += 1
+        try:
+            # Shielded so one caller's cancellation does not cancel the others.
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if not flight.waiters:
+                flight.task.cancel()
+            raise
+        flight.waiters -= 1
+        metrics.increment("run_cache.misses" if leader else "run_cache.hits")
+        return result if leader else result.model_copy(update={"cached": True})
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _landed(
+        self, key: RunKey, policy: CachePolicy, task: asyncio.Task[RunResult]
+    ) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if not result.success or policy.ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + policy.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+run_cache = RunResultCache()
+metrics.gauge("run_cache.entries", lambda: len(run_cache))
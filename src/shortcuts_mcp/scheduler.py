@@ -0,0 +1,196 @@
+"""Admission control for shortcut runs.
+
+Every waited-for run is one ``osascript`` process talking to Shortcuts Events,
+and many of them at once mostly contend with each other. ``RunScheduler``
+bounds how many run at a time, optionally lets only one run per shortcut name
+proceed at once, and queues the rest by priority (first come, first served
+within a priority). The queue has a maximum depth; submissions beyond it are
+rejected immediately instead of piling up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import TracebackType
+
+from .config import get_max_concurrent_runs, get_max_queued_runs, get_serialize_runs
+from .metrics import metrics
+
+
+class RunQueueFullError(RuntimeError):
+    """Raised when a run is submitted while the queue is at its maximum depth."""
+
+
+@dataclass(order=True, slots=True)
+class _Waiter:
+    # (-priority, arrival) so higher priorities, then earlier arrivals, pop first.
+    key: tuple[int, int]
+    name: str = field(compare=False)
+    granted: asyncio.Future[None] = field(compare=False)
+
+
+class RunTicket:
+    """Holds one run slot for the duration of an ``async with`` block."""
+
+    def __init__(self, scheduler: RunScheduler, name: str, priority: int) -> None:
+        self._scheduler = scheduler
+        self.name = name
+        self.priority = priority
+        self._queue_wait_ms: int | None = None
+        # The ticket of another caller's identical run that this one shares.
+        self.leader: RunTicket | None = None
+
+    @property
+    def queue_wait_ms(self) -> int | None:
+        """Time spent waiting for a slot; None while still queued.
+
+        A ticket sharing another run never takes a slot itself, so it reports
+        its leader's wait.
+        """
+        if self.leader is not None:
+            return self.leader.queue_wait_ms
+        return self._queue_wait_ms
+
+    async def __aenter__(self) -> RunTicket:
+        start = time.perf_counter()
+        await self._scheduler.acquire(self.name, self.priority)
+        wait_ms = (time.perf_counter() - start) * 1000
+        metrics.observe("runs.queue_wait", wait_ms)
+        self._queue_wait_ms = int(wait_ms)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._scheduler.release(self.name)
+
+
+class RunScheduler:
+    """Bounded, prioritized admission of runs.
+
+    Limits left as None follow the configuration, so they can be changed
+    through the environment without restarting.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int | None = None,
+        max_queued: int | None = None,
+        serialize: bool | None = None,
+    ) -> None:
+        self._max_concurrent = max_concurrent
+        self._max_queued = max_queued
+        self._serialize = serialize
+        self._waiters: list[_Waiter] = []
+        self._arrivals = itertools.count()
+        self._active: Counter[str] = Counter()
+        self._running = 0
+        self._queued = 0
+
+    @property
+    def max_concurrent(self) -> int:
+        if self._max_concurrent is not None:
+            return self._max_concurrent
+        return get_max_concurrent_runs()
+
+    @property
+    def max_queued(self) -> int:
+        if self._max_queued is not None:
+            return self._max_queued
+        return get_max_queued_runs()
+
+    @property
+    def serialize(self) -> bool:
+        if self._serialize is not None:
+            return self._serialize
+        return get_serialize_runs()
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def ticket(self, name: str, priority: int = 0) -> RunTicket:
+        return RunTicket(self, name, priority)
+
+    async def acquire(self, name: str, priority: int = 0) -> None:
+        """Wait for a slot to run ``name``; pair with ``release``.
+
+        Raises ``RunQueueFullError`` without waiting when the run cannot start
+        now and the queue is full.
+        """
+        # Afterwards queued runs are only those that cannot start, so a run
+        # that can start now does not overtake anyone it should wait behind.
+        self._dispatch()
+        if self._can_start(name):
+            self._start(name)
+            return
+        if self._queued >= self.max_queued:
+            metrics.increment("runs.rejected")
+            raise RunQueueFullError(
+                f"Run queue is full ({self._queued} waiting, {self._running} running)"
+            )
+
+        granted: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, _Waiter((-priority, next(self._arrivals)), name, granted)
+        )
+        self._queued += 1
+        try:
+            await granted
+        except BaseException:
+            if granted.done() and not granted.cancelled():
+                # Granted just before the waiter was cancelled: hand it back.
+                self.release(name)
+            else:
+                granted.cancel()
+                self._queued -= 1
+            raise
+
+    def release(self, name: str) -> None:
+        self._running -= 1
+        self._active[name] -= 1
+        if not self._active[name]:
+            del self._active[name]
+        self._dispatch()
+
+    def _can_start(self, name: str) -> bool:
+        if self._running >= self.max_concurrent:
+            return False
+        return not self.serialize or name not in self._active
+
+    def _start(self, name: str) -> None:
+        self._running += 1
+        self._active[name] += 1
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the best queued runs that are allowed to start."""
+        blocked: list[_Waiter] = []
+        while self._waiters and self._running < self.max_concurrent:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.granted.done():
+                continue  # Cancelled while queued.
+            if not self._can_start(waiter.name):
+                blocked.append(waiter)
+                continue
+            self._queued -= 1
+            self._start(waiter.name)
+            waiter.granted.set_result(None)
+        for waiter in blocked:
+            heapq.heappush(self._waiters, waiter)
+
+
+run_scheduler = RunScheduler()
+metrics.gauge("runs.running", lambda: run_scheduler.running)
+metrics.gauge("runs.queued", lambda: run_scheduler.queued)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import aiosqlite
+
+from .config import get_cache_dir, get_db_path
+from .database import get_shortcut_versions, iter_actions_by_pks, library_changes
+from .parser import action_index_text, actions_cache
+
+SCHEMA_VERSION = "1"
+
+# The trigram tokenizer gives substring semantics, which matches the behavior of
+# the previous in-memory search. It needs at least three characters per query.
+_TRIGRAM_MIN_QUERY = 3
+
+_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    CREATE TABLE IF NOT EXISTS shortcut_versions (
+        pk INTEGER PRIMARY KEY,
+        modified_at TEXT
+    );
+"""
+
+_FTS_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS action_fts "
+    "USING fts5(identifiers, parameters, tokenize='{tokenizer}')"
+)
+
+_MATCH_SQL = """
+    SELECT rowid, bm25(action_fts) AS score
+    FROM action_fts
+    WHERE action_fts MATCH ?
+    ORDER BY rank
+    LIMIT ?
+"""
+
+_LIKE_SQL = """
+    SELECT rowid, 0.0 AS score
+    FROM action_fts
+    WHERE identifiers LIKE ? ESCAPE '\\' OR parameters LIKE ? ESCAPE '\\'
+    ORDER BY rowid
+    LIMIT ?
+"""
+
+
+def _sidecar_path(db_path: Path) -> Path:
+    digest = hashlib.sha1(str(db_path).encode("utf-8")).hexdigest()[:16]
+    return get_cache_dir() / f"action-index-{digest}.sqlite"
+
+
+def _fts_phrase(query: str) -> str:
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _like_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class ActionSearchIndex:
+    """Full-text index of action identifiers and string parameter values.
+
+    The index lives in a sidecar SQLite file under the cache directory, one per
+    Shortcuts database; the Shortcuts database itself is only ever read. Each
+    refresh compares ZMODIFICATIONDATE per shortcut against the versions stored
+    in the sidecar and re-indexes only shortcuts that were added or changed;
+    refreshes are skipped entirely until ``library_changes`` reports a change.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path
+        self._conn: aiosqlite.Connection | None = None
+        self._conn_path: Path | None = None
+        self._trigram = True
+        self._lock = asyncio.Lock()
+        # Whether the library may have changed since the last refresh.
+        self._stale = True
+        library_changes.subscribe(self._mark_stale)
+
+    def _mark_stale(self) -> None:
+        self._stale = True
+
+    async def _connection(self) -> aiosqlite.Connection:
+        path = self._path or _sidecar_path(get_db_path())
+        if self._conn is not None and self._conn_path == path:
+            return self._conn
+        await self.close()
+
+        try:
+            conn = await self._open(path)
+        except (OSError, sqlite3.DatabaseError):
+            # A corrupt or unwritable sidecar is only a cache; rebuild it, and
+            # fall back to memory if the cache directory is unusable.
+            try:
+                path.unlink(missing_ok=True)
+                conn = await self._open(path)
+            except (OSError, sqlite3.DatabaseError):
+                conn = await self._open(None)
+
+        self._conn = conn
+        self._conn_path = path
+        # A different sidecar may not have seen the latest library state.
+        self._stale = True
+        return conn
+
+    async def _open(self, path: Path | None) -> aiosqlite.Connection:
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        conn = await aiosqlite.connect(":memory:" if path is None else path)
+        try:
+            await conn.execute("PRAGMA journal_mode = WAL")
+            await conn.execute("PRAGMA synchronous = NORMAL")
+            await conn.executescript(_SCHEMA_SQL)
+            cursor = await conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+            if row is None or row[0] != SCHEMA_VERSION:
+                await conn.executescript(
+                    "DROP TABLE IF EXISTS action_fts; DELETE FROM shortcut_versions;"
+                )
+            try:
+                await conn.execute(_FTS_SQL.format(tokenizer="trigram"))
+            except sqlite3.OperationalError:
+                # SQLite older than 3.34 has no trigram tokenizer.
+                await conn.execute(_FTS_SQL.format(tokenizer="unicode61"))
+            cursor = await conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'action_fts'"
+            )
+            row = await cursor.fetchone()
+            await cursor.close()
+            self._trigram = row is not None and "trigram" in str(row[0])
+            await conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                [SCHEMA_VERSION],
+            )
+            await conn.commit()
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def refresh(self) -> int:
+        """Bring the index up to date; returns the number of shortcuts re-indexed."""
+        async with self._lock:
+            conn = await self._connection()
+            await library_changes.check()
+            if not self._stale:
+                return 0
+            self._stale = False
+            try:
+                return await self._reindex(conn)
+            except BaseException:
+                self._stale = True
+                # Undo the partial refresh so its deletes are never committed
+                # and the write lock is released; shielded from cancellation.
+                await asyncio.shield(conn.rollback())
+                raise
+
+    async def _reindex(self, conn: aiosqlite.Connection) -> int:
+        """Re-index shortcuts whose modification date differs from the sidecar."""
+        versions = await get_shortcut_versions()
+        cursor = await conn.execute("SELECT pk, modified_at FROM shortcut_versions")
+        known: dict[int, str | None] = {
+            row[0]: row[1] for row in await cursor.fetchall()
+        }
+        await cursor.close()
+
+        removed = [pk for pk in known if pk not in versions]
+        changed = [
+            pk
+            for pk, modified_at in versions.items()
+            if pk not in known or known[pk] != modified_at
+        ]
+        if not removed and not changed:
+            return 0
+
+        stale = [(pk,) for pk in removed + changed]
+        await conn.executemany("DELETE FROM action_fts WHERE rowid = ?", stale)
+        await conn.executemany("DELETE FROM shortcut_versions WHERE pk = ?", stale)
+
+        async for batch, blobs in iter_actions_by_pks(changed):
+            documents: list[tuple[int, str, str]] = []
+            for pk in batch:
+                data = blobs.get(pk)
+                if data is None:
+                    continue
+                actions = actions_cache.get_or_parse(pk, versions[pk], data)
+                identifiers, parameters = action_index_text(actions)
+                documents.append((pk, identifiers, parameters))
+            await conn.executemany(
+                "INSERT INTO action_fts (rowid, identifiers, parameters) "
+                "VALUES (?, ?, ?)",
+                documents,
+            )
+            await conn.executemany(
+                "INSERT INTO shortcut_versions VALUES (?, ?)",
+                [(pk, versions[pk]) for pk in batch],
+            )
+        await conn.commit()
+        return len(changed)
+
+    async def search(self, query: str, limit: int | None = None) -> list[int]:
+        """Return shortcut PKs whose actions match ``query``, best match first."""
+        if not query:
+            return []
+        conn = await self._connection()
+        row_limit = -1 if limit is None else limit
+        if self._trigram and len(query) < _TRIGRAM_MIN_QUERY:
+            pattern = _like_pattern(query)
+            cursor = await conn.execute(_LIKE_SQL, [pattern, pattern, row_limit])
+        else:
+            cursor = await conn.execute(_MATCH_SQL, [_fts_phrase(query), row_limit])
+        rows = await cursor.fetchall()
+        await cursor.close()
+        return [row[0] for row in rows]
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+        self._conn = None
+        self._conn_path = None
+
+
+action_index = ActionSearchIndex()
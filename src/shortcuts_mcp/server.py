@@ -1,64 +1,146 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Coroutine
+from dataclasses import asdict
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
 from .actions import catalog as action_catalog
 from .config import get_default_timeout
 from .database import (
-    get_all_shortcuts,
+    ShortcutRow,
+    close_pool,
     get_shortcut_actions,
     get_shortcut_by_name,
-    search_shortcuts_by_name,
+    get_shortcuts_by_pks,
+    get_shortcuts_page,
+    iter_actions_by_pks,
+    query_log,
 )
 from .database import get_folders as fetch_folders
-from .executor import run_via_applescript, run_via_url_scheme
+from .executor import Execution, run_via_applescript, run_via_url_scheme
+from .jobs import run_jobs
+from .metrics import metrics
 from .models import (
-    ActionInfo,
     ActionSource,
+    BatchRunItem,
+    BatchRunResult,
+    ProfileMode,
     RunResult,
     SearchIn,
     ShortcutDetail,
+    ShortcutField,
+    ShortcutMatch,
     ShortcutMetadata,
+    ShortcutSort,
 )
-from .parser import action_search_blob, action_types, parse_actions, parse_input_types
+from .name_index import name_index
+from .output import output_spool
+from .parser import (
+    action_types,
+    actions_cache,
+    parse_input_types,
+)
+from .profiling import profiler
+from .run_cache import run_cache
+from .scheduler import RunTicket, run_scheduler
+from .search_index import action_index
 from .types import JsonValue
+from .workers import worker_pool
 
 mcp = FastMCP(name="Shortcuts MCP")
 
+# ShortcutRow column behind each list_shortcuts field read from ZSHORTCUT.
+_FIELD_COLUMNS = {
+    "id": "workflow_id",
+    "action_count": "action_count",
+    "last_modified": "modified_at",
+}
+
+
+def _shortcut_match(row: ShortcutRow, score: float | None = None) -> ShortcutMatch:
+    return ShortcutMatch(
+        name=row.name,
+        id=row.workflow_id,
+        folder=row.folder,
+        action_count=row.action_count,
+        last_modified=row.modified_at,
+        score=score,
+    )
+
 
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def list_shortcuts(
-    folder: str | None = None, include_actions: bool = False
-) -> dict[str, list[dict[str, object]]]:
-    """List all available macOS shortcuts."""
-    rows = await get_all_shortcuts(folder=folder)
-    shortcuts: list[dict[str, object]] = []
+    folder: str | None = None,
+    include_actions: bool = False,
+    limit: int | None = None,
+    cursor: str | None = None,
+    sort: ShortcutSort = "name",
+    fields: list[ShortcutField] | None = None,
+) -> dict[str, object]:
+    """List available macOS shortcuts, optionally one page at a time.
 
-    for row in rows:
-        action_types_list: list[str] | None = None
-        if include_actions:
-            data = await get_shortcut_actions(row.pk)
-            if data:
-                actions = parse_actions(data)
-                action_types_list = action_types(actions)
-
-        shortcuts.append(
-            ShortcutMetadata(
-                name=row.name,
-                id=row.workflow_id,
-                folder=row.folder,
-                action_count=row.action_count,
-                last_modified=row.modified_at,
-                action_types=action_types_list,
-            ).model_dump()
-        )
+    Args:
+        folder: Folder filter (not supported by the current macOS schema)
+        include_actions: Include the action identifiers of each shortcut
+        limit: Maximum number of shortcuts to return (default: all)
+        cursor: next_cursor from a previous call, to fetch the following page
+        sort: "name" (A-Z), "modified" (newest first) or "action_count"
+            (most actions first)
+        fields: Fields to return per shortcut, e.g. ["name", "last_modified"]
+            (default: all)
 
-    return {"shortcuts": shortcuts}
+    Returns:
+        Dictionary with:
+        - shortcuts: List of shortcut metadata
+        - next_cursor: Cursor for the next page, or None on the last page
+    """
+    requested: list[str] = list(
+        ShortcutMetadata.model_fields if fields is None else dict.fromkeys(fields)
+    )
+    want_actions = include_actions or (fields is not None and "action_types" in fields)
+    if include_actions and "action_types" not in requested:
+        requested.append("action_types")
+    columns = {_FIELD_COLUMNS[name] for name in requested if name in _FIELD_COLUMNS}
+    if want_actions:
+        # The parse cache is keyed by modification date.
+        columns.add("modified_at")
+
+    page = await get_shortcuts_page(
+        sort=sort, limit=limit, cursor=cursor, columns=columns
+    )
+
+    types_by_pk: dict[int, list[str]] = {}
+    if want_actions:
+        rows = {row.pk: row for row in page.rows}
+        async for _, blobs in iter_actions_by_pks(list(rows)):
+            for pk, data in blobs.items():
+                if data:
+                    parsed = actions_cache.get_or_parse(pk, rows[pk].modified_at, data)
+                    types_by_pk[pk] = action_types(parsed)
+
+    shortcuts: list[dict[str, object]] = []
+    for row in page.rows:
+        values: dict[str, object] = {
+            "name": row.name,
+            "id": row.workflow_id,
+            "folder": row.folder,
+            "action_count": row.action_count,
+            "last_modified": row.modified_at,
+            "action_types": types_by_pk.get(row.pk),
+        }
+        shortcuts.append({name: values[name] for name in requested})
+    return {"shortcuts": shortcuts, "next_cursor": page.next_cursor}
 
 
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def get_shortcut(name: str, include_actions: bool = True) -> dict[str, object]:
     """Get detailed information about a specific shortcut."""
     row = await get_shortcut_by_name(name)
@@ -70,7 +152,7 @@ async def get_shortcut(name: str, include_actions: bool = True) -> dict[str, obj
     if include_actions:
         data = await get_shortcut_actions(row.pk)
         if data:
-            actions_list = parse_actions(data)
+            actions_list = actions_cache.get_or_parse(row.pk, row.modified_at, data)
             input_types = parse_input_types(data)
 
     detail = ShortcutDetail(
@@ -85,40 +167,108 @@ async def get_shortcut(name: str, include_actions: bool = True) -> dict[str, obj
     return detail.model_dump()
 
 
+async def _run_scheduled(
+    ticket: RunTicket, input_value: JsonValue, timeout: int
+) -> RunResult:
+    """Run through the scheduler; ``timeout`` covers time spent queued."""
+
+    async def scheduled_run() -> Execution:
+        async with ticket:
+            if worker_pool.enabled:
+                return await worker_pool.run(ticket.name, input_value)
+            return await run_via_applescript(ticket.name, input_value)
+
+    try:
+        execution = await asyncio.wait_for(scheduled_run(), timeout=timeout)
+        metrics.observe("runs.execution", execution.elapsed_ms)
+        if execution.returncode:
+            metrics.increment("runs.failed")
+        return RunResult(
+            success=execution.returncode == 0,
+            output=execution.output,
+            execution_time_ms=execution.elapsed_ms,
+            queue_wait_ms=ticket.queue_wait_ms,
+            output_bytes=execution.output_bytes,
+            output_truncated=execution.truncated,
+            output_id=execution.output_id,
+        )
+    except asyncio.TimeoutError:
+        metrics.increment("runs.timeouts")
+        if ticket.queue_wait_ms is None:
+            message = "Timeout waiting in run queue"
+        else:
+            message = "Timeout waiting for shortcut"
+        return RunResult(
+            success=False, output=message, queue_wait_ms=ticket.queue_wait_ms
+        )
+    except Exception as exc:  # noqa: BLE001
+        metrics.increment("runs.failed")
+        return RunResult(success=False, output=str(exc))
+
+
+async def _run_memoized(
+    ticket: RunTicket, input_value: JsonValue, timeout: int, bypass_cache: bool
+) -> RunResult:
+    """Scheduled run, served from ``run_cache`` when a cache policy matches."""
+
+    def run() -> Coroutine[Any, Any, RunResult]:
+        return _run_scheduled(ticket, input_value, timeout)
+
+    if bypass_cache:
+        return await run()
+    return await run_cache.get_or_run(ticket.name, input_value, run, ticket)
+
+
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def run_shortcut(
     name: str,
     input: object = None,
     wait_for_result: bool = True,
     timeout: int | None = None,
+    priority: int = 0,
+    background: bool = False,
+    bypass_cache: bool = False,
 ) -> dict[str, object]:
     """Execute a shortcut with optional input.
 
     The input parameter accepts any JSON-serializable value (str, int, float,
     bool, None, list, or dict). We use 'object' here because Pydantic's schema
     generation cannot handle the recursive JsonValue TypeAlias.
+
+    Runs that wait for their result share a limited number of slots; when all
+    are busy the run is queued, higher ``priority`` first, and the timeout
+    covers the time spent queued. A full queue fails the run immediately.
+
+    With ``background`` the run is started as a job and its status, including
+    ``job_id``, is returned at once; follow up with ``get_run_status``,
+    ``get_run_result`` or ``cancel_run``.
+
+    Inputs larger than ``SHORTCUTS_INPUT_FILE_THRESHOLD`` bytes are passed
+    through a temporary file. With ``wait_for_result=False`` the shortcut is
+    opened through the ``shortcuts://`` URL scheme, which cannot read a file,
+    so such inputs are rejected there; wait for the result or use
+    ``background`` instead.
+
+    Shortcuts configured as cacheable may return a recent result for the same
+    input (marked ``cached``); ``bypass_cache`` always runs the shortcut.
     """
     timeout_value = timeout if timeout is not None else get_default_timeout()
     # Cast to JsonValue for the executor functions
     input_value: JsonValue = input  # type: ignore[assignment]
 
+    if background:
+        ticket = run_scheduler.ticket(name, priority)
+        job = run_jobs.submit(
+            ticket,
+            lambda: _run_memoized(ticket, input_value, timeout_value, bypass_cache),
+        )
+        return job.info().model_dump()
+
     if wait_for_result:
-        try:
-            output, elapsed_ms, returncode = await asyncio.wait_for(
-                run_via_applescript(name, input_value), timeout=timeout_value
-            )
-            if returncode == 0:
-                result = RunResult(
-                    success=True, output=output, execution_time_ms=elapsed_ms
-                )
-            else:
-                result = RunResult(
-                    success=False, output=output, execution_time_ms=elapsed_ms
-                )
-        except asyncio.TimeoutError:
-            result = RunResult(success=False, output="Timeout waiting for shortcut")
-        except Exception as exc:  # noqa: BLE001
-            result = RunResult(success=False, output=str(exc))
+        ticket = run_scheduler.ticket(name, priority)
+        result = await _run_memoized(ticket, input_value, timeout_value, bypass_cache)
         return result.model_dump()
 
     try:
@@ -129,44 +279,169 @@ async def run_shortcut(
 
 
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def run_shortcuts_batch(
+    items: list[BatchRunItem],
+    concurrency: int | None = None,
+    timeout: int | None = None,
+    fail_fast: bool = False,
+    priority: int = 0,
+    bypass_cache: bool = False,
+) -> dict[str, object]:
+    """Run several shortcuts in parallel and wait for all of them.
+
+    Each item is a shortcut name with optional input and timeout. Results come
+    back in item order with their timing. Items also go through the shared run
+    scheduler, so its global limit still applies.
+
+    Args:
+        items: Shortcuts to run, as ``{"name", "input"?, "timeout"?}``
+        concurrency: Items running at once (default: the global run limit)
+        timeout: Seconds per item, including time queued (default: server default)
+        fail_fast: Cancel the remaining items after the first failure
+        priority: Queue priority of every item
+        bypass_cache: Run every item even if a cached result exists
+    """
+    limit = concurrency if concurrency is not None else run_scheduler.max_concurrent
+    if limit < 1:
+        raise ValueError("concurrency must be at least 1")
+    default_timeout = timeout if timeout is not None else get_default_timeout()
+    semaphore = asyncio.Semaphore(limit)
+    tasks: list[asyncio.Task[RunResult]] = []
+
+    async def run_item(item: BatchRunItem) -> RunResult:
+        async with semaphore:
+            ticket = run_scheduler.ticket(item.name, priority)
+            input_value: JsonValue = item.input  # type: ignore[assignment]
+            item_timeout = item.timeout if item.timeout is not None else default_timeout
+            result = await _run_memoized(
+                ticket, input_value, item_timeout, bypass_cache
+            )
+        if fail_fast and not result.success:
+            for task in tasks:
+                if task is not asyncio.current_task():
+                    task.cancel()
+        return result
+
+    start = time.perf_counter()
+    tasks.extend(asyncio.create_task(run_item(item)) for item in items)
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results: list[dict[str, object]] = []
+    for item, outcome in zip(items, outcomes):
+        if isinstance(outcome, RunResult):
+            result = outcome
+        elif isinstance(outcome, asyncio.CancelledError):
+            result = RunResult(
+                success=False, output="Cancelled after an earlier failure"
+            )
+        else:
+            result = RunResult(success=False, output=str(outcome))
+        results.append(
+            BatchRunResult(name=item.name, **result.model_dump()).model_dump()
+        )
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": int((time.perf_counter() - start) * 1000),
+    }
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def get_run_output(
+    output_id: str, offset: int = 0, length: int = 65536
+) -> dict[str, object]:
+    """Read the full output of a run whose result was truncated.
+
+    Args:
+        output_id: ``output_id`` from the truncated ``RunResult``
+        offset: Byte offset to read from; pass back ``next_offset`` to continue
+        length: Maximum number of bytes to read
+    """
+    chunk = await asyncio.to_thread(output_spool.read, output_id, offset, length)
+    return asdict(chunk)
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def get_run_status(job_id: str) -> dict[str, object]:
+    """Report whether a background run is queued, running or finished."""
+    return run_jobs.get(job_id).info(include_result=False).model_dump()
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def get_run_result(job_id: str, wait: int = 0) -> dict[str, object]:
+    """Return a background run's status and, once finished, its result.
+
+    Args:
+        job_id: ID returned by ``run_shortcut(background=True)``
+        wait: Seconds to wait for the run to finish before returning
+    """
+    job = await run_jobs.wait(job_id, timeout=max(wait, 0))
+    return job.info().model_dump()
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def cancel_run(job_id: str) -> dict[str, object]:
+    """Cancel a queued or running background run."""
+    job = await run_jobs.cancel(job_id)
+    return job.info().model_dump()
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def search_shortcuts(
-    query: str, search_in: SearchIn = "name"
+    query: str, search_in: SearchIn = "name", limit: int = 20
 ) -> dict[str, list[dict[str, object]]]:
-    """Search shortcuts by name or action content."""
-    matches: dict[str, ShortcutMetadata] = {}
+    """Search shortcuts by name or action content.
+
+    Name search is fuzzy: it tolerates typos and word order, and each match
+    carries a similarity score between 0 and 1. A blank query lists every
+    shortcut by name, up to ``limit``. Action matches are ranked by relevance
+    and have no score.
+
+    Args:
+        query: Text to look for
+        search_in: "name", "actions" or "both"
+        limit: Maximum number of matches per kind of search (default: 20)
+    """
+    matches: dict[str, ShortcutMatch] = {}
 
     if search_in in {"name", "both"}:
-        rows = await search_shortcuts_by_name(query)
-        for row in rows:
-            matches[row.name] = ShortcutMetadata(
-                name=row.name,
-                id=row.workflow_id,
-                folder=row.folder,
-                action_count=row.action_count,
-                last_modified=row.modified_at,
-            )
+        await name_index.refresh()
+        found = name_index.search(query, limit=limit)
+        rows_by_pk = await get_shortcuts_by_pks([match.pk for match in found])
+        for match in found:
+            row = rows_by_pk.get(match.pk)
+            if row is not None:
+                matches[row.name] = _shortcut_match(row, match.score)
 
     if search_in in {"actions", "both"}:
-        rows = await get_all_shortcuts()
-        for row in rows:
-            data = await get_shortcut_actions(row.pk)
-            if not data:
-                continue
-            actions = parse_actions(data)
-            blob = action_search_blob(actions).lower()
-            if query.lower() in blob:
-                matches[row.name] = ShortcutMetadata(
-                    name=row.name,
-                    id=row.workflow_id,
-                    folder=row.folder,
-                    action_count=row.action_count,
-                    last_modified=row.modified_at,
-                )
+        await action_index.refresh()
+        ranked = await action_index.search(query, limit=limit)
+        rows_by_pk = await get_shortcuts_by_pks(ranked)
+        for pk in ranked:
+            row = rows_by_pk.get(pk)
+            if row is not None and row.name not in matches:
+                matches[row.name] = _shortcut_match(row)
 
     return {"shortcuts": [item.model_dump() for item in matches.values()]}
 
 
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def get_available_actions(
     source: ActionSource | None = None,
     category: str | None = None,
@@ -174,6 +449,8 @@ async def get_available_actions(
     include_parameters: bool = True,
     include_examples: bool = False,
     force_refresh: bool = False,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> dict[str, object]:
     """Get all available Shortcuts actions from system and installed apps.
 
@@ -182,57 +459,131 @@ async def get_available_actions(
             "library" (from user's shortcuts), "curated" (classic is.workflow.actions.*)
         category: Filter by action category/prefix
             (e.g., "is.workflow.actions", "com.apple")
-        search: Search query to filter by identifier, title, or description
+        search: Search query matched word by word against identifier, title and
+            description; results are ranked best match first. Each word matches
+            the start of a word (camel-case parts count), and when nothing
+            matches that way the whole query is matched as a substring
         include_parameters: Include parameter definitions (default: True)
         include_examples: Include example parameters from user's library
             (default: False)
         force_refresh: Bypass cache and rescan all sources (default: False)
+        limit: Maximum number of actions to return, at least 1 (default: all)
+        offset: Number of matching actions to skip; pass the previous
+            response's next_offset to fetch the following page (default: 0)
 
     Returns:
         Dictionary with:
         - actions: List of ActionInfo objects
-        - categories: List of unique category prefixes found
-        - sources: Count of actions per source
+        - total: Number of actions matching the filters
+        - next_offset: Offset of the next page, or None on the last page
+        - categories: List of unique categories across all matching actions
+        - sources: Count of matching actions per source
         - cached: Whether results came from cache
     """
-    actions, cached = await action_catalog.get_all_actions(
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+    page, cached = await action_catalog.get_action_page(
         source=source,
         category=category,
         search=search,
+        offset=offset,
+        limit=limit,
+        include_parameters=include_parameters,
+        include_examples=include_examples,
         force_refresh=force_refresh,
     )
-
-    trimmed: list[ActionInfo] = []
-    for action in actions:
-        item = action.model_copy(deep=True)
-        if not include_parameters:
-            item.parameters = []
-        if not include_examples:
-            item.example_params = None
-        trimmed.append(item)
-
-    categories = sorted({item.category for item in trimmed})
-    sources: dict[str, int] = {"system": 0, "apps": 0, "library": 0, "curated": 0}
-    for item in trimmed:
-        sources[item.source] = sources.get(item.source, 0) + 1
-
     return {
-        "actions": [item.model_dump() for item in trimmed],
-        "categories": categories,
-        "sources": sources,
+        "actions": page.actions,
+        "total": page.total,
+        "next_offset": page.next_offset,
+        "categories": page.categories,
+        "sources": page.sources,
         "cached": cached,
     }
 
 
 @mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
 async def get_folders() -> dict[str, list[dict[str, str | int]]]:
     """List shortcut folders/collections."""
     folders = await fetch_folders()
     return {"folders": folders}
 
 
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def get_server_stats(reset: bool = False) -> dict[str, object]:
+    """Report call counts, errors, latency percentiles, cache and queue metrics.
+
+    ``queries`` lists the database statements with the most total time.
+    ``reset`` clears counters, latency histograms and query statistics after
+    reporting them.
+    """
+    stats = metrics.snapshot()
+    stats["queries"] = query_log.summary()
+    metrics.maybe_dump()
+    if reset:
+        metrics.reset()
+        query_log.clear()
+    return stats
+
+
+@mcp.tool()
+@metrics.instrument("tool")
+@profiler.profile
+async def configure_profiling(
+    tools: list[str] | None = None,
+    mode: ProfileMode | None = None,
+    threshold_ms: int | None = None,
+    sample_rate: float | None = None,
+    reset: bool = False,
+) -> dict[str, object]:
+    """Change which tool calls are profiled, and list the captured profiles.
+
+    Args:
+        tools: Tool name patterns to profile, e.g. ["*"]; [] turns profiling off
+        mode: "cpu" (cProfile), "memory" (tracemalloc) or "both"
+        threshold_ms: Only keep profiles of calls at least this slow
+        sample_rate: Fraction of matching calls to profile, 0 to 1
+        reset: Drop runtime changes and return to the environment settings
+
+    Returns:
+        Dictionary with the active settings, the profile directory and the
+        kept profile files, newest first
+    """
+    if reset:
+        profiler.reset()
+    changes = {
+        "tools": tools,
+        "mode": mode,
+        "threshold_ms": threshold_ms,
+        "sample_rate": sample_rate,
+    }
+    changes = {key: value for key, value in changes.items() if value is not None}
+    if sample_rate is not None and not 0 <= sample_rate <= 1:
+        raise ValueError("sample_rate must be between 0 and 1")
+    settings = profiler.configure(**changes) if changes else profiler.settings
+    return {
+        "settings": settings.model_dump(),
+        "directory": str(profiler.directory),
+        "profiles": profiler.recent(),
+    }
+
+
 def main() -> None:
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        # Open aiosqlite connections own non-daemon worker threads.
+        asyncio.run(_close_connections())
+        output_spool.close()
+
+
+async def _close_connections() -> None:
+    await action_index.close()
+    await close_pool()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,292 @@
+"""Long-lived ``osascript`` workers for running shortcuts.
+
+``run_via_applescript`` starts a new ``osascript`` and compiles a new script
+for every run. In worker mode, a few ``osascript -l JavaScript`` processes stay
+up instead. Each one holds a reference to Shortcuts Events and serves
+requests over stdin/stdout, one JSON object per line:
+
+- request ``{"id": 1, "op": "run", "name": "...", "input": "..." | null}``,
+  answered by ``{"id": 1, "ok": true, "output": "..."}`` or
+  ``{"id": 1, "ok": false, "error": "..."}``;
+- request ``{"id": 2, "op": "ping"}``, answered by ``{"id": 2, "ok": true}``.
+
+Requests carry their input on stdin, so input size is not limited by argv.
+A worker that exits, answers out of turn or is interrupted mid-request is
+killed and replaced by a fresh one on next use. Workers idle for a while are
+pinged before being handed out. Workers exit on their own once their stdin
+closes, including when the server exits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import signal
+import time
+from collections import deque
+from typing import cast
+
+from .config import get_run_workers
+from .executor import Execution, output_capture, stringify_input
+from .metrics import metrics
+from .processes import process_manager
+from .types import JsonValue
+
+logger = logging.getLogger(__name__)
+
+# Workers idle longer than this are pinged before reuse.
+_HEALTH_CHECK_IDLE_SECONDS = 30.0
+_PING_TIMEOUT_SECONDS = 5.0
+# Replies are single lines; a longer one is a protocol error.
+_MAX_REPLY_BYTES = 64 * 1024 * 1024
+
+WORKER_SCRIPT = r"""
+ObjC.import("Foundation");
+const input = $.NSFileHandle.fileHandleWithStandardInput;
+const output = $.NSFileHandle.fileHandleWithStandardOutput;
+const events = Application("Shortcuts Events");
+let buffer = "";
+
+function readLine() {
+    while (buffer.indexOf("\n") < 0) {
+        const data = input.availableData;
+        if (data.length === 0) return null;
+        buffer += $.NSString.alloc.initWithDataEncoding(
+            data, $.NSUTF8StringEncoding).js;
+    }
+    const end = buffer.indexOf("\n");
+    const line = buffer.slice(0, end);
+    buffer = buffer.slice(end + 1);
+    return line;
+}
+
+function reply(message) {
+    output.writeData($(JSON.stringify(message) + "\n").dataUsingEncoding(
+        $.NSUTF8StringEncoding));
+}
+
+function text(value) {
+    if (value === null || value === undefined) return "";
+    if (Array.isArray(value)) return value.map(text).join(", ");
+    return String(value);
+}
+
+function run() {
+    for (let line = readLine(); line !== null; line = readLine()) {
+        const request = JSON.parse(line);
+        if (request.op === "ping") {
+            reply({id: request.id, ok: true});
+            continue;
+        }
+        try {
+            const shortcut = events.shortcuts.byName(request.name);
+            const result = request.input === null
+                ? shortcut.run()
+                : shortcut.run({withInput: request.input});
+            reply({id: request.id, ok: true, output: text(result)});
+        } catch (error) {
+            reply({id: request.id, ok: false, error: String(error)});
+        }
+    }
+}
+"""
+
+
+class WorkerError(RuntimeError):
+    """A worker exited or broke the protocol."""
+
+
+class OsascriptWorker:
+    """One ``osascript`` process serving run requests one at a time."""
+
+    def __init__(self) -> None:
+        self._process: asyncio.subprocess.Process | None = None
+        self._next_id = 0
+        self.last_used = 0.0
+        self.spawned = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        self.kill()
+        self._process = await process_manager.spawn(
+            "osascript",
+            "-l",
+            "JavaScript",
+            "-e",
+            WORKER_SCRIPT,
+            stdin=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_MAX_REPLY_BYTES,
+        )
+        self.spawned += 1
+        self.last_used = time.monotonic()
+
+    async def request(self, message: dict[str, object]) -> dict[str, object]:
+        """Send one request and read its reply.
+
+        Any failure or interruption kills the process, since its position in
+        the conversation is unknown afterwards.
+        """
+        process = self._process
+        if process is None or process.stdin is None or process.stdout is None:
+            raise WorkerError("Worker is not running")
+        self._next_id += 1
+        request_id = self._next_id
+        try:
+            line = json.dumps({"id": request_id, **message}) + "\n"
+            process.stdin.write(line.encode())
+            await process.stdin.drain()
+            reply_line = await process.stdout.readline()
+            if not reply_line:
+                raise WorkerError(f"Worker exited with {await process.wait()}")
+            reply: object = json.loads(reply_line)
+            if not isinstance(reply, dict):
+                raise WorkerError("Worker sent a malformed reply")
+            reply = cast(dict[str, object], reply)
+            if reply.get("id") != request_id:
+                raise WorkerError("Worker replied out of turn")
+        except BaseException:
+            self.kill()
+            raise
+        finally:
+            self.last_used = time.monotonic()
+        return reply
+
+    async def ping(self, timeout: float = _PING_TIMEOUT_SECONDS) -> bool:
+        try:
+            reply = await asyncio.wait_for(self.request({"op": "ping"}), timeout)
+        except (WorkerError, OSError, ValueError, asyncio.TimeoutError):
+            return False
+        return reply.get("ok") is True
+
+    async def run(self, name: str, input_value: JsonValue | None = None) -> Execution:
+        """Same result as ``run_via_applescript``, output bounded the same way."""
+        start = time.perf_counter()
+        reply = await self.request(
+            {
+                "op": "run",
+                "name": name,
+                "input": (
+                    None if input_value is None else stringify_input(input_value)
+                ),
+            }
+        )
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        if reply.get("ok") is not True:
+            error = str(reply.get("error") or "Shortcut failed")
+            return Execution(error, elapsed_ms, 1)
+        capture = output_capture()
+        try:
+            await capture.feed(str(reply.get("output") or "").encode())
+        finally:
+            await capture.close()
+        return Execution(
+            output=capture.summary(),
+            elapsed_ms=elapsed_ms,
+            returncode=0,
+            output_bytes=capture.total,
+            truncated=capture.truncated,
+            output_id=capture.output_id,
+        )
+
+    def kill(self) -> None:
+        """Kill the process group; the process manager reaps it."""
+        if self.alive and self._process is not None:
+            process_manager.signal(self._process, signal.SIGKILL)
+        self._process = None
+
+    async def stop(self, timeout: float = _PING_TIMEOUT_SECONDS) -> None:
+        """Close stdin so the worker exits, killing it if it does not."""
+        process = self._process
+        self._process = None
+        if process is None or process.returncode is not None:
+            return
+        if process.stdin is not None:
+            process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            await process_manager.terminate(process)
+
+
+class OsascriptWorkerPool:
+    """Up to ``size`` workers, started on demand and reused across runs.
+
+    The size follows the configuration unless given; 0 disables the pool.
+    """
+
+    def __init__(self, size: int | None = None) -> None:
+        self._size = size
+        self._workers: list[OsascriptWorker] = []
+        self._idle: list[OsascriptWorker] = []
+        self._waiters: deque[asyncio.Future[OsascriptWorker]] = deque()
+
+    @property
+    def size(self) -> int:
+        return self._size if self._size is not None else get_run_workers()
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+
+    @property
+    def spawned(self) -> int:
+        """Processes started so far, including respawns."""
+        return sum(worker.spawned for worker in self._workers)
+
+    async def run(self, name: str, input_value: JsonValue | None = None) -> Execution:
+        worker = await self._acquire()
+        try:
+            await self._ensure_healthy(worker)
+            return await worker.run(name, input_value)
+        finally:
+            self._release(worker)
+
+    async def _acquire(self) -> OsascriptWorker:
+        if self._idle:
+            return self._idle.pop()
+        if len(self._workers) < self.size:
+            worker = OsascriptWorker()
+            self._workers.append(worker)
+            return worker
+        waiter: asyncio.Future[OsascriptWorker] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        try:
+            return await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self._release(waiter.result())
+            raise
+
+    def _release(self, worker: OsascriptWorker) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(worker)
+                return
+        self._idle.append(worker)
+
+    async def _ensure_healthy(self, worker: OsascriptWorker) -> None:
+        if worker.alive:
+            idle = time.monotonic() - worker.last_used
+            if idle < _HEALTH_CHECK_IDLE_SECONDS or await worker.ping():
+                return
+            logger.warning("Restarting unresponsive osascript worker")
+        await worker.start()
+
+    async def close(self) -> None:
+        workers = self._workers
+        self._workers = []
+        self._idle.clear()
+        for worker in workers:
+            await worker.stop()
+
+
+worker_pool = OsascriptWorkerPool()
+metrics.gauge("workers.spawned", lambda: worker_pool.spawned)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import os
+import plistlib
+import sqlite3
+import sys
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from shortcuts_mcp import database
+from shortcuts_mcp.search_index import action_index
+
+SCHEMA = """
+    CREATE TABLE ZSHORTCUT (
+        Z_PK INTEGER PRIMARY KEY,
+        ZNAME VARCHAR,
+        ZACTIONCOUNT INTEGER,
+        ZMODIFICATIONDATE TIMESTAMP,
+        ZWORKFLOWID BLOB
+    );
+    CREATE TABLE ZSHORTCUTACTIONS (
+        Z_PK INTEGER PRIMARY KEY,
+        ZSHORTCUT INTEGER,
+        ZDATA BLOB
+    );
+    CREATE INDEX ZSHORTCUTACTIONS_ZSHORTCUT_INDEX ON ZSHORTCUTACTIONS (ZSHORTCUT);
+    CREATE TABLE ZCOLLECTION (
+        Z_PK INTEGER PRIMARY KEY,
+        ZIDENTIFIER VARCHAR,
+        ZTEMPORARYSYNCFOLDERNAME VARCHAR
+    );
+"""
+
+DEFAULT_SHORTCUTS: list[tuple[str, list[tuple[str, dict[str, object]]]]] = [
+    (
+        "Morning Routine",
+        [
+            ("is.workflow.actions.gettext", {"WFTextActionText": "Good morning"}),
+            ("is.workflow.actions.delay", {"WFDelayTime": 5}),
+        ],
+    ),
+    (
+        "Send Email",
+        [("is.workflow.actions.sendemail", {"WFSendEmailActionSubject": "Hi"})],
+    ),
+    ("Empty", []),
+]
+
+
+def actions_blob(actions: Sequence[tuple[str, dict[str, object]]]) -> bytes:
+    return plistlib.dumps(
+        [
+            {
+                "WFWorkflowActionIdentifier": identifier,
+                "WFWorkflowActionParameters": parameters,
+            }
+            for identifier, parameters in actions
+        ],
+        fmt=plistlib.FMT_BINARY,
+    )
+
+
+def write_shortcut(
+    conn: sqlite3.Connection,
+    pk: int,
+    name: str,
+    actions: Sequence[tuple[str, dict[str, object]]],
+    modified: float = 700_000_000.0,
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO ZSHORTCUT VALUES (?, ?, ?, ?, ?)",
+        (pk, name, len(actions), modified, f"uuid-{pk}"),
+    )
+    conn.execute("DELETE FROM ZSHORTCUTACTIONS WHERE ZSHORTCUT = ?", (pk,))
+    if actions:
+        conn.execute(
+            "INSERT INTO ZSHORTCUTACTIONS (ZSHORTCUT, ZDATA) VALUES (?, ?)",
+            (pk, actions_blob(actions)),
+        )
+
+
+def create_shortcuts_db(
+    path: Path,
+    shortcuts: Sequence[
+        tuple[str, Sequence[tuple[str, dict[str, object]]]]
+    ] = DEFAULT_SHORTCUTS,
+) -> Path:
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA)
+        for pk, (name, actions) in enumerate(shortcuts, start=1):
+            write_shortcut(conn, pk, name, actions)
+        conn.execute(
+            "INSERT INTO ZCOLLECTION (ZIDENTIFIER, ZTEMPORARYSYNCFOLDERNAME) "
+            "VALUES ('Root', NULL), ('Work', 'Work Stuff')"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+async def shortcuts_db(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[Path]:
+    path = create_shortcuts_db(tmp_path / "Shortcuts.sqlite")
+    monkeypatch.setenv("SHORTCUTS_DB_PATH", str(path))
+    monkeypatch.setenv("SHORTCUTS_CACHE_DIR", str(tmp_path / "cache"))
+    yield path
+    await action_index.close()
+    await database.close_pool()
+
+
+# Stands in for osascript: logs when each run of a shortcut starts and ends,
+# sleeps for FAKE_OSASCRIPT_DELAY seconds (or N seconds for a shortcut named
+# "Sleep N") and prints the shortcut name. "Echo" prints how its input arrived
+# and the input itself, "Print N" prints N x's. Started
+# with "-l JavaScript" it acts as a worker, serving JSON line requests.
+FAKE_OSASCRIPT = """\
+import json, os, re, sys, time
+
+log = os.environ["FAKE_OSASCRIPT_LOG"]
+delay = float(os.environ.get("FAKE_OSASCRIPT_DELAY", "0"))
+exit_code = int(os.environ.get("FAKE_OSASCRIPT_EXIT", "0"))
+
+
+def record(kind, name):
+    with open(log, "a") as handle:
+        handle.write(f"{kind}\\t{name}\\t{time.time()}\\n")
+
+
+def run(name, source, shortcut_input):
+    record("start", name)
+    time.sleep(float(name[6:]) if name.startswith("Sleep ") else delay)
+    record("end", name)
+    if name == "Echo":
+        return f"{source}:{shortcut_input}"
+    if name.startswith("Print "):
+        return "x" * int(name[6:])
+    return name
+
+
+if sys.argv[1:3] == ["-l", "JavaScript"]:
+    record("spawn", "-")
+    for line in sys.stdin:
+        request = json.loads(line)
+        reply = {"id": request["id"], "ok": True}
+        if request["op"] == "run":
+            if request["name"] == "Crash":
+                sys.exit(1)
+            output = run(request["name"], "stdin", request["input"])
+            if exit_code:
+                reply = {"id": request["id"], "ok": False, "error": "failed"}
+            else:
+                reply["output"] = output
+        print(json.dumps(reply), flush=True)
+else:
+    script = sys.argv[-1]
+    name = re.search(r'shortcut named "([^"]*)"', script).group(1)
+    path = re.search(r'POSIX file "([^"]*)"', script)
+    literal = re.search(r'with input ("(?:[^"\\\\]|\\\\.)*")', script)
+    if path:
+        source, shortcut_input = "file", open(path.group(1), encoding="utf-8").read()
+    elif literal:
+        source, shortcut_input = "argv", json.loads(literal.group(1))
+    else:
+        source, shortcut_input = "none", None
+    print(run(name, source, shortcut_input))
+    sys.exit(exit_code)
+"""
+
+
+@dataclass
+class FakeOsascript:
+    log: Path
+
+    def events(self) -> list[tuple[str, str, float]]:
+        """``(kind, name, time)`` for each spawn, start and end, in time order."""
+        if not self.log.exists():
+            return []
+        events: list[tuple[str, str, float]] = []
+        for line in self.log.read_text().splitlines():
+            kind, name, stamp = line.split("\t")
+            events.append((kind, name, float(stamp)))
+        # At equal times an end is counted before a start.
+        return sorted(events, key=lambda event: (event[2], event[0] == "start"))
+
+    def max_concurrent(self, name: str | None = None) -> int:
+        running = peak = 0
+        for kind, event_name, _ in self.events():
+            if kind == "spawn" or (name is not None and event_name != name):
+                continue
+            running += 1 if kind == "start" else -1
+            peak = max(peak, running)
+        return peak
+
+
+@pytest.fixture
+def fake_osascript(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeOsascript:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "osascript"
+    script.write_text(f"#!{sys.executable}\n{FAKE_OSASCRIPT}")
+    script.chmod(0o755)
+    log = tmp_path / "osascript.log"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv("FAKE_OSASCRIPT_LOG", str(log))
+    return FakeOsascript(log)
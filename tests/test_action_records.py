@@ -0,0 +1,76 @@
+import json
+
+from shortcuts_mcp.action_records import (
+    ActionRecord,
+    RecordDecoder,
+    RecordEncoder,
+    action_record,
+    parameter_record,
+)
+from shortcuts_mcp.models import ActionInfo, ActionParameter
+
+
+def _info(identifier: str) -> ActionInfo:
+    return ActionInfo(
+        identifier=identifier,
+        source="apps",
+        title="Open",
+        description="Opens something",
+        category="third-party",
+        parameters=[ActionParameter(name="target", value_type="string")],
+        platform_availability={"LNPlatformNameMACOS": "14.0"},
+        usage_count=2,
+        example_params={"target": "x"},
+    )
+
+
+def test_records_share_repeated_parts():
+    first = ActionRecord.from_model(_info("com.vendor.A.Open"))
+    second = ActionRecord.from_model(_info("com.vendor.B.Open"))
+    assert first.parameters is second.parameters
+    assert first.platform_availability is second.platform_availability
+    assert first.category is second.category
+    assert (
+        parameter_record("target", None, "string", False, None) is (first.parameters[0])
+    )
+
+
+def test_record_round_trips_to_model():
+    info = _info("com.vendor.A.Open")
+    record = ActionRecord.from_model(info)
+    assert record.to_model() == info
+    assert record.to_dict() == info.model_dump()
+
+
+def test_record_dict_can_be_trimmed():
+    record = action_record(
+        identifier="com.vendor.A.Run",
+        source="system",
+        title=None,
+        description=None,
+        category="third-party",
+        parameters=[parameter_record("x", None, "int", True, None)],
+        example_params={"x": 1},
+    )
+    data = record.to_dict(include_parameters=False, include_examples=False)
+    assert data["parameters"] == []
+    assert data["example_params"] is None
+    assert record.to_dict()["example_params"] == {"x": 1}
+
+
+def test_records_round_trip_through_encoded_rows():
+    records = [
+        ActionRecord.from_model(_info("com.vendor.A.Open")),
+        ActionRecord.from_model(_info("com.vendor.B.Open")),
+        action_record("com.vendor.C.Run", "system", None, None, "third-party"),
+    ]
+    encoder = RecordEncoder()
+    rows = [encoder.row(record) for record in records]
+    tables = encoder.tables()
+    assert len(tables["parameter_lists"]) == 2
+
+    data = json.loads(json.dumps({"rows": rows, **tables}))
+    decoder = RecordDecoder(data)
+    decoded = [decoder.record(row) for row in data["rows"]]
+    assert decoded == records
+    assert decoded[0].parameters is records[0].parameters
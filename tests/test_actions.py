@@ -1,4 +1,38 @@
-from shortcuts_mcp.actions import parse_actionsdata_payload, parse_curated_payload
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from conftest import write_shortcut
+
+from shortcuts_mcp import actions as actions_module
+from shortcuts_mcp.action_records import ActionRecord
+from shortcuts_mcp.actions import (
+    ActionCatalog,
+    parse_actionsdata_payload,
+    parse_curated_payload,
+)
+from shortcuts_mcp.models import ActionSource
+
+
+def _write_actionsdata(path: Path, identifier: str, title: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"actions": {identifier: {"identifier": identifier, "title": title}}}
+    path.write_text(json.dumps(payload))
+
+
+@pytest.fixture
+def action_roots(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    system_root = tmp_path / "PrivateFrameworks"
+    apps_root = tmp_path / "Applications"
+    system_root.mkdir()
+    apps_root.mkdir()
+    monkeypatch.setenv("SHORTCUTS_SYSTEM_ACTION_ROOTS", str(system_root))
+    monkeypatch.setenv("SHORTCUTS_APP_ACTION_ROOTS", str(apps_root))
+    return system_root, apps_root
 
 
 def testparse_actionsdata_payload():
@@ -59,3 +93,178 @@ def testparse_curated_payload_top_level():
     assert action.source == "curated"
     assert action.category == "workflow"
     assert action.parameters[0].name == "WFTextActionText"
+
+
+async def test_catalog_refresh_is_incremental(
+    shortcuts_db: Path, action_roots: tuple[Path, Path]
+):
+    system_root, apps_root = action_roots
+    system_file = system_root / "Notes.framework/Metadata.appintents"
+    system_file = system_file / "extract.actionsdata"
+    app_file = apps_root / "Foo.app/Contents/Resources/Metadata.appintents"
+    app_file = app_file / "extract.actionsdata"
+    _write_actionsdata(system_file, "com.apple.Notes.Create", "Create Note")
+    _write_actionsdata(app_file, "com.foo.Run", "Run Foo")
+
+    catalog = ActionCatalog()
+    actions, _ = await catalog.get_all_actions()
+    identifiers = {action.identifier for action in actions}
+    assert {"com.apple.Notes.Create", "com.foo.Run"} <= identifiers
+    assert catalog.refresh_stats["files_parsed"] == 2
+    assert catalog.refresh_stats["shortcuts_parsed"] == 3
+
+    await catalog.get_all_actions(force_refresh=True)
+    assert catalog.refresh_stats["files_parsed"] == 0
+    assert catalog.refresh_stats["files_reused"] == 2
+    assert catalog.refresh_stats["shortcuts_parsed"] == 0
+
+    _write_actionsdata(system_file, "com.apple.Notes.Create", "Make Note")
+    stat = system_file.stat()
+    os.utime(system_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    app_file.unlink()
+    conn = sqlite3.connect(shortcuts_db)
+    write_shortcut(
+        conn,
+        3,
+        "Empty",
+        [("is.workflow.actions.showresult", {})],
+        modified=700_000_500.0,
+    )
+    conn.commit()
+    conn.close()
+
+    actions, _ = await catalog.get_all_actions(force_refresh=True)
+    by_id = {action.identifier: action for action in actions}
+    assert catalog.refresh_stats["files_parsed"] == 1
+    assert catalog.refresh_stats["files_removed"] == 1
+    assert catalog.refresh_stats["shortcuts_parsed"] == 1
+    assert by_id["com.apple.Notes.Create"].title == "Make Note"
+    assert "com.foo.Run" not in by_id
+    assert by_id["is.workflow.actions.showresult"].usage_count == 1
+
+
+async def test_catalog_cold_start_uses_snapshot(
+    shortcuts_db: Path, action_roots: tuple[Path, Path]
+):
+    system_root, _ = action_roots
+    system_file = system_root / "Notes.framework/Metadata.appintents"
+    system_file = system_file / "extract.actionsdata"
+    _write_actionsdata(system_file, "com.apple.Notes.Create", "Create Note")
+
+    first = ActionCatalog()
+    await first.get_all_actions()
+    assert first.refresh_stats["files_parsed"] == 1
+
+    restarted = ActionCatalog()
+    actions, _ = await restarted.get_all_actions()
+    assert "com.apple.Notes.Create" in {action.identifier for action in actions}
+    assert restarted.refresh_stats["roots_listed"] == 0
+    assert restarted.refresh_stats["files_parsed"] == 0
+    assert restarted.refresh_stats["shortcuts_parsed"] == 0
+
+    _write_actionsdata(system_file, "com.apple.Notes.Create", "Make Note")
+    stat = system_file.stat()
+    os.utime(system_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = ActionCatalog()
+    actions, _ = await changed.get_all_actions()
+    by_id = {action.identifier: action for action in actions}
+    assert changed.refresh_stats["files_parsed"] == 1
+    assert by_id["com.apple.Notes.Create"].title == "Make Note"
+
+
+async def test_catalog_ignores_malformed_snapshot(
+    shortcuts_db: Path, action_roots: tuple[Path, Path]
+):
+    await ActionCatalog().get_all_actions()
+    path = actions_module._snapshot_path()  # pyright: ignore[reportPrivateUsage]
+    data = json.loads(path.read_text())
+    data["files"] = [{"path": "x", "source": "system"}]
+    data["library"] = [["not", "a", "shortcut"]]
+    path.write_text(json.dumps(data))
+
+    restarted = ActionCatalog()
+    await restarted.get_all_actions()
+    assert restarted.refresh_stats["shortcuts_parsed"] == 3
+
+
+async def test_catalog_snapshot_can_be_disabled(
+    shortcuts_db: Path, action_roots: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_CATALOG_SNAPSHOT", "0")
+    await ActionCatalog().get_all_actions()
+    restarted = ActionCatalog()
+    await restarted.get_all_actions()
+    assert restarted.refresh_stats["shortcuts_parsed"] == 3
+
+
+async def test_catalog_refresh_does_not_block_event_loop(
+    shortcuts_db: Path,
+    action_roots: tuple[Path, Path],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    system_root, _ = action_roots
+    for n in range(8):
+        path = system_root / f"F{n}.framework/Metadata.appintents/extract.actionsdata"
+        _write_actionsdata(path, f"com.apple.F{n}.Run", "Run")
+
+    original = actions_module._scan_actionsdata_paths  # pyright: ignore[reportPrivateUsage]
+
+    def slow_scan(paths: list[Path], source: ActionSource) -> list[ActionRecord]:
+        time.sleep(0.05)
+        return original(paths, source)
+
+    monkeypatch.setattr(actions_module, "_scan_actionsdata_paths", slow_scan)
+
+    ticks = 0
+    stop = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while not stop.is_set():
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker_task = asyncio.create_task(ticker())
+    catalog = ActionCatalog()
+    results = await asyncio.gather(catalog.get_all_actions(), catalog.get_all_actions())
+    stop.set()
+    await ticker_task
+
+    assert ticks >= 5
+    assert catalog.refresh_stats["files_parsed"] == 8
+    assert [cached for _, cached in results].count(False) == 1
+
+
+async def test_catalog_search_is_ranked_and_limited(
+    shortcuts_db: Path, action_roots: tuple[Path, Path]
+):
+    system_root, _ = action_roots
+    notes = system_root / "Notes.framework/Metadata.appintents/extract.actionsdata"
+    _write_actionsdata(notes, "com.apple.Notes.CreateNote", "Create Note")
+
+    catalog = ActionCatalog()
+    actions, _ = await catalog.get_all_actions(search="note", source="system")
+    assert [action.identifier for action in actions] == ["com.apple.Notes.CreateNote"]
+
+    limited, _ = await catalog.get_all_actions(limit=1)
+    assert len(limited) == 1
+
+    ranked = await catalog.search("create note")
+    assert ranked[0][0].identifier == "com.apple.Notes.CreateNote"
+    assert ranked[0][1] > 0
+
+
+async def test_catalog_follows_library_changes(
+    shortcuts_db: Path, action_roots: tuple[Path, Path]
+):
+    catalog = ActionCatalog()
+    await catalog.get_all_actions()
+    _, cached = await catalog.get_all_actions()
+    assert cached
+
+    with sqlite3.connect(shortcuts_db) as conn:
+        write_shortcut(conn, 10, "Notify", [("com.example.Notify", {})])
+    actions, cached = await catalog.get_all_actions(source="library")
+    assert not cached
+    assert "com.example.Notify" in {a.identifier for a in actions}
+    assert catalog.refresh_stats["shortcuts_parsed"] == 1
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from shortcuts_mcp.actions import parse_actionsdata_payload
+from shortcuts_mcp.actionsdata import iter_action_entries, read_actionsdata_text
+
+PAYLOAD = {
+    "version": 1,
+    "entities": {"Note": {"properties": [{"name": "body {not a brace}"}]}},
+    "actions": {
+        "CreateNote": {
+            "identifier": "com.apple.Notes.CreateNote",
+            "title": {"key": 'Create "Note"'},
+            "parameters": [{"name": "body", "valueType": {"primitiveType": "String"}}],
+            "outputType": {"unused": [1, 2, 3]},
+            "typeSpecificMetadata": ["a", "b"],
+        },
+        "NotAnEntry": 3,
+        "Empty": {},
+    },
+    "queries": {},
+    "enums": [{"identifier": "Color", "cases": ["red", "]"]}, "x"],
+    "emptyList": [],
+}
+
+
+def test_iter_action_entries_keeps_only_catalog_fields():
+    entries = dict(iter_action_entries(json.dumps(PAYLOAD, indent=2)))
+    assert list(entries) == ["CreateNote", "Empty"]
+    assert set(entries["CreateNote"]) == {"identifier", "title", "parameters"}
+
+
+def test_streaming_matches_full_parse(tmp_path: Path):
+    path = tmp_path / "extract.actionsdata"
+    path.write_text(json.dumps(PAYLOAD))
+    text = read_actionsdata_text(path)
+    streamed = parse_actionsdata_payload(
+        {"actions": dict(iter_action_entries(text))}, source="system"
+    )
+    full = parse_actionsdata_payload(json.loads(text), source="system")
+    assert streamed == full
+
+
+@pytest.mark.parametrize("text", ["", "[]", '{"actions": {"a": {}', '{"a" 1}'])
+def test_iter_action_entries_rejects_malformed(text: str):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_action_entries(text))
+
+
+def test_iter_action_entries_without_actions():
+    assert list(iter_action_entries('{"version": 1, "actions": {}}')) == []
+    assert list(iter_action_entries("{}")) == []
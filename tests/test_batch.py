@@ -0,0 +1,48 @@
+from typing import cast
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.models import BatchRunItem
+
+
+async def test_batch_runs_items_in_parallel_and_keeps_order(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.1")
+    items = [BatchRunItem(name=f"Item {index}", input=index) for index in range(6)]
+    batch = await server.run_shortcuts_batch(items, concurrency=3)
+
+    results = cast(list[dict[str, object]], batch["results"])
+    assert [result["name"] for result in results] == [item.name for item in items]
+    assert [result["output"] for result in results] == [item.name for item in items]
+    assert all(result["execution_time_ms"] is not None for result in results)
+    assert (batch["succeeded"], batch["failed"]) == (6, 0)
+    assert fake_osascript.max_concurrent() == 3
+
+
+async def test_batch_fail_fast_cancels_the_rest(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_EXIT", "1")
+    items = [BatchRunItem(name=f"Item {index}") for index in range(4)]
+    batch = await server.run_shortcuts_batch(items, concurrency=1, fail_fast=True)
+
+    results = cast(list[dict[str, object]], batch["results"])
+    assert results[0]["output"] == "Item 0"
+    assert [result["output"] for result in results[1:]] == [
+        "Cancelled after an earlier failure"
+    ] * 3
+    assert batch["failed"] == 4
+    assert len(fake_osascript.events()) == 2
+
+
+async def test_batch_continues_on_error_by_default(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_EXIT", "1")
+    items = [BatchRunItem(name=f"Item {index}") for index in range(3)]
+    batch = await server.run_shortcuts_batch(items, concurrency=1)
+    assert batch["failed"] == 3
+    assert len(fake_osascript.events()) == 6
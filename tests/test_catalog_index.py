@@ -0,0 +1,121 @@
+from shortcuts_mcp.action_records import ActionRecord, action_record
+from shortcuts_mcp.catalog_index import CatalogIndex, tokenize
+from shortcuts_mcp.models import ActionSource
+
+
+def _action(
+    identifier: str,
+    title: str | None = None,
+    description: str | None = None,
+    source: ActionSource = "system",
+    category: str = "apple.system",
+) -> ActionRecord:
+    return action_record(
+        identifier=identifier,
+        source=source,
+        title=title,
+        description=description,
+        category=category,
+    )
+
+
+ACTIONS = [
+    _action("com.apple.Notes.CreateNoteAction", "Create Note", "Creates a note"),
+    _action("com.apple.Notes.AppendNoteAction", "Append to Note"),
+    _action("com.apple.Reminders.CreateReminder", "Add Reminder", "Mentions note"),
+    _action(
+        "is.workflow.actions.gettext", "Text", source="curated", category="workflow"
+    ),
+    _action("com.vendor.Notebook.Open", "Open Notebook", source="apps"),
+]
+
+
+def test_tokenize_splits_camel_case():
+    assert tokenize("com.apple.CreateNoteAction") == [
+        "com",
+        "apple",
+        "createnoteaction",
+        "create",
+        "note",
+        "action",
+    ]
+
+
+def test_filter_masks_match_linear_filters():
+    index = CatalogIndex(ACTIONS)
+    assert index.select(index.filter_mask(source="curated")) == [ACTIONS[3]]
+    assert index.select(index.filter_mask(category="com.apple.notes")) == ACTIONS[:2]
+    assert index.select(index.filter_mask(category="WORKFLOW")) == [ACTIONS[3]]
+    assert index.select(index.filter_mask(source="apps", category="com.apple")) == []
+    assert index.select(index.all_mask) == ACTIONS
+
+
+def test_search_ranks_and_limits():
+    index = CatalogIndex(ACTIONS)
+    ranked = [action.identifier for action, _ in index.search("note")]
+    assert ranked[0] in {ACTIONS[0].identifier, ACTIONS[1].identifier}
+    assert ranked[-1] == ACTIONS[2].identifier
+    assert ACTIONS[4].identifier in ranked  # "note" is a prefix of "notebook"
+    assert len(index.search("note", limit=2)) == 2
+
+
+def test_search_requires_every_word_and_respects_mask():
+    index = CatalogIndex(ACTIONS)
+    # CreateReminder matches through its description ("Mentions note").
+    assert [a for a, _ in index.search("create note")] == [ACTIONS[0], ACTIONS[2]]
+    assert index.search("create missing") == []
+    mask = index.filter_mask(source="apps")
+    assert [a for a, _ in index.search("note", mask=mask)] == [ACTIONS[4]]
+
+
+def test_search_falls_back_to_substrings():
+    index = CatalogIndex(ACTIONS)
+    # No token starts with these, but they occur inside identifiers and titles.
+    assert [a for a, _ in index.search("ettex")] == [ACTIONS[3]]
+    assert [a for a, _ in index.search("minder")] == [ACTIONS[2]]
+    # Substring matches come back in catalog order.
+    assert [a for a, _ in index.search("s.creat")] == [ACTIONS[0], ACTIONS[2]]
+    mask = index.filter_mask(source="apps")
+    assert index.search("ettex", mask=mask) == []
+    page = index.page(index.all_mask, search="ebook")
+    assert [item["identifier"] for item in page.actions] == [ACTIONS[4].identifier]
+
+
+def test_search_puts_exact_identifier_first():
+    index = CatalogIndex(ACTIONS)
+    best, _ = index.search("com.apple.Notes.AppendNoteAction")[0]
+    assert best is ACTIONS[1]
+
+
+def test_page_slices_cached_projections():
+    index = CatalogIndex(ACTIONS)
+    first = index.page(index.all_mask, limit=2, include_parameters=False)
+    assert [item["identifier"] for item in first.actions] == [
+        action.identifier for action in ACTIONS[:2]
+    ]
+    assert first.actions[0]["parameters"] == []
+    assert first.actions[0]["example_params"] is None
+    assert first.total == len(ACTIONS)
+    assert first.next_offset == 2
+    assert first.sources == {"system": 3, "apps": 1, "library": 0, "curated": 1}
+
+    again = index.page(index.all_mask, limit=2, include_parameters=False)
+    assert again.actions[0] is first.actions[0]
+
+    last = index.page(index.all_mask, offset=4, limit=2)
+    assert [item["identifier"] for item in last.actions] == [ACTIONS[4].identifier]
+    assert last.next_offset is None
+
+    empty = index.page(index.all_mask, offset=1, limit=0)
+    assert empty.actions == [] and empty.total == len(ACTIONS)
+    assert empty.next_offset is None
+
+
+def test_page_with_search_pages_through_ranking():
+    index = CatalogIndex(ACTIONS)
+    ranked = [action.identifier for action, _ in index.search("note")]
+    first = index.page(index.all_mask, search="note", limit=2)
+    rest = index.page(index.all_mask, search="note", offset=2)
+    assert first.total == len(ranked)
+    assert [item["identifier"] for item in first.actions + rest.actions] == ranked
+    assert "workflow" not in first.categories
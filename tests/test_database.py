@@ -0,0 +1,216 @@
+import asyncio
+import os
+import sqlite3
+from pathlib import Path
+from typing import cast
+
+import aiosqlite
+import pytest
+from conftest import create_shortcuts_db, write_shortcut
+
+from shortcuts_mcp import database
+
+
+async def test_queries_read_synthetic_library(shortcuts_db: Path):
+    rows = await database.get_all_shortcuts()
+    assert [row.name for row in rows] == ["Empty", "Morning Routine", "Send Email"]
+    assert rows[1].modified_at is not None
+
+    row = await database.get_shortcut_by_name("Send Email")
+    assert row is not None
+    assert await database.get_shortcut_actions(row.pk) is not None
+
+    matches = await database.search_shortcuts_by_name("mail")
+    assert [item.name for item in matches] == ["Send Email"]
+
+    folders = await database.get_folders()
+    assert [folder["name"] for folder in folders] == ["Root", "Work Stuff"]
+
+
+async def test_pool_reuses_connections(shortcuts_db: Path):
+    async with database.pool.acquire() as first:
+        pass
+    async with database.pool.acquire() as second:
+        pass
+    assert first is second
+    assert database.pool.open_connections == 1
+
+
+async def test_pool_respects_size(shortcuts_db: Path):
+    pool = database.ConnectionPool(size=2)
+    peak = 0
+
+    async def use() -> None:
+        nonlocal peak
+        async with pool.acquire():
+            peak = max(peak, pool.open_connections)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(use() for _ in range(6)))
+    assert peak == 2
+    await pool.close()
+
+
+async def test_pool_reopens_when_file_replaced(shortcuts_db: Path, tmp_path: Path):
+    assert await database.get_shortcut_by_name("Empty") is not None
+    async with database.pool.acquire() as before:
+        pass
+
+    replacement = create_shortcuts_db(
+        tmp_path / "replacement.sqlite", [("Replaced", [])]
+    )
+    os.replace(replacement, shortcuts_db)
+
+    async with database.pool.acquire() as after:
+        pass
+    assert after is not before
+    assert await database.get_shortcut_by_name("Empty") is None
+    assert await database.get_shortcut_by_name("Replaced") is not None
+
+
+async def test_iter_actions_by_pks_reads_in_batches(shortcuts_db: Path):
+    pks = list(await database.get_shortcut_versions())
+    batches = [
+        (batch, blobs)
+        async for batch, blobs in database.iter_actions_by_pks(pks, batch_size=2)
+    ]
+    assert [batch for batch, _ in batches] == [pks[:2], pks[2:]]
+    found = {pk for _, blobs in batches for pk in blobs}
+    # "Empty" sorts first and has no actions row.
+    assert found == set(pks[1:])
+
+
+async def test_shortcuts_page_walks_with_cursor(shortcuts_db: Path):
+    with sqlite3.connect(shortcuts_db) as conn:
+        write_shortcut(conn, 10, "alpha", [], modified=800_000_000.0)
+        write_shortcut(conn, 11, "Alpha", [], modified=800_000_000.0)
+
+    names: list[str] = []
+    cursor: str | None = None
+    while True:
+        page = await database.get_shortcuts_page(limit=2, cursor=cursor)
+        names += [row.name for row in page.rows]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert names == ["alpha", "Alpha", "Empty", "Morning Routine", "Send Email"]
+
+    newest = await database.get_shortcuts_page(sort="modified", limit=2)
+    assert [row.pk for row in newest.rows] == [10, 11]
+    rest = await database.get_shortcuts_page(sort="modified", cursor=newest.next_cursor)
+    assert len(rest.rows) == 3
+    assert rest.next_cursor is None
+
+    largest = await database.get_shortcuts_page(sort="action_count", limit=1)
+    assert largest.rows[0].name == "Morning Routine"
+
+
+async def test_shortcuts_page_projects_columns(shortcuts_db: Path):
+    page = await database.get_shortcuts_page(columns=["action_count"])
+    assert page.rows[1].action_count == 2
+    assert page.rows[1].modified_at is None
+    assert page.rows[1].workflow_id is None
+
+
+async def test_shortcuts_page_rejects_foreign_cursor(shortcuts_db: Path):
+    page = await database.get_shortcuts_page(limit=1)
+    assert page.next_cursor is not None
+    with pytest.raises(ValueError):
+        await database.get_shortcuts_page(sort="modified", cursor=page.next_cursor)
+    with pytest.raises(ValueError):
+        await database.get_shortcuts_page(cursor="not a cursor")
+
+
+async def test_change_detector_sees_writes_from_other_connections(
+    shortcuts_db: Path,
+):
+    detector = database.LibraryChangeDetector()
+    calls: list[int] = []
+    detector.subscribe(lambda: calls.append(detector.generation))
+    try:
+        assert not await detector.check()
+        assert not await detector.check()
+
+        writer = sqlite3.connect(shortcuts_db)
+        try:
+            writer.execute("PRAGMA journal_mode = WAL")
+            # Committed to the WAL only; the main file is left untouched.
+            write_shortcut(writer, 10, "Water Plants", [])
+            writer.commit()
+            assert await detector.check()
+            assert calls == [1]
+
+            # Commits that leave ZSHORTCUT alone are not library changes.
+            writer.execute("INSERT INTO ZCOLLECTION (ZIDENTIFIER) VALUES ('New')")
+            writer.commit()
+            assert not await detector.check()
+
+            writer.execute("DELETE FROM ZSHORTCUT WHERE Z_PK = 10")
+            writer.commit()
+            assert await detector.check()
+            assert calls == [1, 2]
+        finally:
+            writer.close()
+    finally:
+        await detector.close()
+
+
+async def test_shortcut_versions_are_cached_until_change(shortcuts_db: Path):
+    versions = await database.get_shortcut_versions()
+    assert len(versions) == 3
+    assert "versions" in database._library_cache  # pyright: ignore[reportPrivateUsage]
+
+    with sqlite3.connect(shortcuts_db) as conn:
+        write_shortcut(conn, 10, "Water Plants", [])
+    assert 10 in await database.get_shortcut_versions()
+
+
+async def test_slow_queries_are_logged_with_their_plan_once(
+    shortcuts_db: Path,
+    caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    explained: list[str] = []
+    explain = database._explain  # pyright: ignore[reportPrivateUsage]
+
+    async def counting_explain(
+        conn: aiosqlite.Connection, sql: str, parameters: tuple[object, ...]
+    ) -> list[str]:
+        explained.append(sql)
+        return await explain(conn, sql, parameters)
+
+    monkeypatch.setattr(database, "_explain", counting_explain)
+    log = database.QueryLog(threshold_ms=10)
+    like = "SELECT ZNAME FROM ZSHORTCUT\n  WHERE ZNAME LIKE ?"
+    by_pk = "SELECT ZDATA FROM ZSHORTCUTACTIONS WHERE ZSHORTCUT = ?"
+    async with database.pool.acquire() as conn:
+        await log.record(conn, like, ("%mail%",), 1, 5.0)
+        assert not caplog.records
+        for elapsed_ms in (50.0, 80.0):
+            await log.record(conn, like, ("%mail%",), 1, elapsed_ms)
+        await log.record(conn, by_pk, (1,), 1, 20.0)
+
+    assert explained == [like, by_pk]
+    entries = [cast(dict[str, object], getattr(r, "query")) for r in caplog.records]
+    assert [entry["elapsed_ms"] for entry in entries] == [50.0, 80.0, 20.0]
+    assert entries[0]["statement"] == "SELECT ZNAME FROM ZSHORTCUT WHERE ZNAME LIKE ?"
+    assert entries[0]["full_scan"] is True
+    assert entries[2]["full_scan"] is False
+    assert "%mail%" not in caplog.text
+
+    top = log.summary(limit=1)[0]
+    assert (top["calls"], top["slow"], top["max_ms"]) == (3, 2, 80.0)
+
+
+async def test_query_log_times_every_statement(shortcuts_db: Path):
+    database.query_log.clear()
+    await database.search_shortcuts_by_name("mail")
+    async for _ in database.iter_actions_by_pks([1, 2, 3]):
+        pass
+
+    statements = {
+        cast(str, item["statement"]): item for item in database.query_log.summary()
+    }
+    assert any("LIKE ?" in statement for statement in statements)
+    batched = next(item for s, item in statements.items() if "json_each" in s)
+    assert batched["rows"] == 2
@@ -0,0 +1,115 @@
+import asyncio
+from typing import cast
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.jobs import RunJobStore
+from shortcuts_mcp.models import RunResult
+from shortcuts_mcp.scheduler import RunScheduler
+
+
+async def test_background_run_reports_status_and_result(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.2")
+    started = await server.run_shortcut("Slow", background=True)
+    assert started["status"] == "queued"
+    assert started["result"] is None
+    job_id = str(started["job_id"])
+
+    pending = await server.get_run_result(job_id)
+    assert pending["status"] in {"queued", "running"}
+
+    finished = await server.get_run_result(job_id, wait=5)
+    assert finished["status"] == "succeeded"
+    assert finished["finished_at"] is not None
+    result = finished["result"]
+    assert isinstance(result, dict)
+    assert result["output"] == "Slow"
+
+    status = await server.get_run_status(job_id)
+    assert status["status"] == "succeeded"
+    assert status["result"] is None
+
+
+async def test_job_sharing_a_cached_run_follows_the_leader(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.3")
+    monkeypatch.setenv("SHORTCUTS_RUN_CACHE", "lookup *")
+    monkeypatch.setenv("SHORTCUTS_MAX_CONCURRENT_RUNS", "1")
+
+    async def submit(name: str) -> str:
+        return str((await server.run_shortcut(name, background=True))["job_id"])
+
+    async def status(job_id: str) -> object:
+        return (await server.get_run_status(job_id))["status"]
+
+    try:
+        blocker = await submit("Other")
+        leader = await submit("Lookup Rate")
+        follower = await submit("Lookup Rate")
+        await asyncio.sleep(0.05)
+        # The leader waits behind the blocker, and so does its follower.
+        assert await status(blocker) == "running"
+        assert await status(leader) == "queued"
+        assert await status(follower) == "queued"
+
+        await server.get_run_result(blocker, wait=5)
+        for _ in range(100):
+            if await status(leader) == "running":
+                break
+            await asyncio.sleep(0.01)
+        assert await status(leader) == "running"
+        assert await status(follower) == "running"
+
+        led = await server.get_run_result(leader, wait=5)
+        followed = await server.get_run_result(follower, wait=5)
+    finally:
+        server.run_cache.clear()
+    assert isinstance(led["result"], dict) and isinstance(followed["result"], dict)
+    assert followed["result"]["cached"] is True
+    assert cast(int, led["result"]["queue_wait_ms"]) > 0
+    assert followed["result"]["queue_wait_ms"] == led["result"]["queue_wait_ms"]
+    starts = [event for event in fake_osascript.events() if event[0] == "start"]
+    assert len(starts) == 2
+
+
+async def test_cancel_run_stops_a_running_job(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "2")
+    started = await server.run_shortcut("Long", background=True)
+    job_id = str(started["job_id"])
+    await server.get_run_result(job_id, wait=1)
+
+    cancelled = await server.cancel_run(job_id)
+    assert cancelled["status"] == "cancelled"
+    assert cancelled["result"] is None
+
+
+async def test_unknown_job_is_rejected():
+    with pytest.raises(ValueError):
+        await server.get_run_status("missing")
+
+
+async def test_store_is_bounded_and_expires_finished_jobs():
+    store = RunJobStore(max_jobs=1, ttl_seconds=0)
+    release = asyncio.Event()
+
+    async def run() -> RunResult:
+        await release.wait()
+        return RunResult(success=True)
+
+    job = store.submit(RunScheduler().ticket("Job"), run)
+    with pytest.raises(RuntimeError):
+        store.submit(RunScheduler().ticket("Other"), run)
+
+    release.set()
+    await store.wait(job.job_id)
+    assert job.status == "succeeded"
+    assert len(store) == 0
+    with pytest.raises(ValueError):
+        store.get(job.job_id)
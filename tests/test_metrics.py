@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from shortcuts_mcp import server
+from shortcuts_mcp.metrics import Histogram, MetricsRegistry, metrics
+
+
+def test_histogram_quantiles_stay_within_their_bucket():
+    histogram = Histogram(bounds=(1, 10, 100))
+    for value in [0.5] * 90 + [50] * 9 + [500]:
+        histogram.observe(value)
+
+    p50 = histogram.quantile(0.5)
+    p95 = histogram.quantile(0.95)
+    assert p50 is not None and 0 < p50 <= 1
+    assert p95 is not None and 10 < p95 <= 100
+    assert histogram.quantile(1.0) == 500
+    assert Histogram().quantile(0.5) is None
+
+
+async def test_instrument_counts_calls_errors_and_latency():
+    registry = MetricsRegistry()
+
+    @registry.instrument("tool")
+    async def flaky(fail: bool) -> str:
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    assert await flaky(False) == "ok"
+    with pytest.raises(ValueError):
+        await flaky(True)
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {"tool.flaky.calls": 2, "tool.flaky.errors": 1}
+    latency = cast(dict[str, dict[str, object]], snapshot["latency"])
+    assert latency["tool.flaky"]["count"] == 2
+    assert flaky.__name__ == "flaky"
+
+
+def test_prometheus_dump_is_written_atomically(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    registry = MetricsRegistry()
+    registry.increment("db.rows", 3)
+    registry.observe("db.query", 2.0)
+    registry.gauge("runs.queued", lambda: 1)
+
+    target = tmp_path / "metrics" / "shortcuts.prom"
+    monkeypatch.setenv("SHORTCUTS_METRICS_FILE", str(target))
+    registry.maybe_dump()
+
+    text = target.read_text()
+    assert "shortcuts_mcp_db_rows_total 3" in text
+    assert 'shortcuts_mcp_db_query_ms_bucket{le="2.5"} 1' in text
+    assert "shortcuts_mcp_db_query_ms_count 1" in text
+    assert "shortcuts_mcp_runs_queued 1" in text
+    assert [path.name for path in target.parent.iterdir()] == ["shortcuts.prom"]
+
+
+async def test_server_stats_cover_tools_database_and_parser(shortcuts_db: Path):
+    metrics.reset()
+    await server.list_shortcuts(include_actions=True)
+    await server.list_shortcuts(include_actions=True)
+    with pytest.raises(ValueError):
+        await server.get_shortcut("Missing")
+
+    stats = await server.get_server_stats(reset=True)
+    counters = cast(dict[str, int], stats["counters"])
+    gauges = cast(dict[str, object], stats["gauges"])
+    latency = cast(dict[str, dict[str, object]], stats["latency"])
+    assert counters["tool.list_shortcuts.calls"] == 2
+    assert counters["tool.get_shortcut.errors"] == 1
+    assert counters["db.rows"] > 0
+    assert cast(int, latency["db.query"]["count"]) >= 3
+    assert latency["tool.list_shortcuts"]["p99_ms"] is not None
+    assert {"runs.queued", "runs.running", "parser.cache_hits"} <= set(gauges)
+    queries = cast(list[dict[str, object]], stats["queries"])
+    assert all(cast(int, item["calls"]) > 0 for item in queries) and queries
+
+    assert "tool.list_shortcuts.calls" not in metrics.counters
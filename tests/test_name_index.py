@@ -0,0 +1,59 @@
+import sqlite3
+from pathlib import Path
+
+from conftest import write_shortcut
+
+from shortcuts_mcp.name_index import ShortcutNameIndex, trigrams
+
+NAMES = [
+    (1, "Morning Routine"),
+    (2, "Send Email"),
+    (3, "Email Summary to Team"),
+    (4, "Resize Images"),
+]
+
+
+def _index() -> ShortcutNameIndex:
+    index = ShortcutNameIndex()
+    index.build(NAMES)
+    return index
+
+
+def test_trigrams_are_padded_per_word():
+    assert trigrams("Hi Yo") == {"  h", " hi", "hi ", "  y", " yo", "yo "}
+
+
+def test_search_tolerates_typos_and_word_order():
+    index = _index()
+    assert index.search("mornign routine")[0].pk == 1
+    assert index.search("routine morning")[0].score == 1.0
+    assert index.search("xyzzy") == []
+
+
+def test_search_ranks_by_similarity_with_limit():
+    index = _index()
+    matches = index.search("email")
+    assert [match.pk for match in matches] == [2, 3]
+    assert matches[0].score > matches[1].score >= 0.5
+    assert len(index.search("email", limit=1)) == 1
+
+
+def test_blank_query_lists_every_name():
+    index = _index()
+    assert [match.name for match in index.search("")] == sorted(
+        name for _, name in NAMES
+    )
+    assert [match.pk for match in index.search("  ", limit=2)] == [3, 1]
+    assert {match.score for match in index.search("")} == {1.0}
+
+
+async def test_refresh_follows_library_changes(shortcuts_db: Path):
+    index = ShortcutNameIndex()
+    assert await index.refresh()
+    assert not await index.refresh()
+    assert index.search("send emial")[0].name == "Send Email"
+
+    with sqlite3.connect(shortcuts_db) as conn:
+        write_shortcut(conn, 10, "Water Plants", [])
+    assert await index.refresh()
+    assert index.search("plants water")[0].pk == 10
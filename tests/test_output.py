@@ -0,0 +1,137 @@
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.executor import run_via_url_scheme
+from shortcuts_mcp.output import OutputCapture, OutputSpool
+
+
+def _read_all(spool: OutputSpool, output_id: str, length: int) -> str:
+    parts: list[str] = []
+    offset: int | None = 0
+    while offset is not None:
+        chunk = spool.read(output_id, offset, length)
+        parts.append(chunk.data)
+        offset = chunk.next_offset
+    return "".join(parts)
+
+
+async def test_capture_keeps_a_head_and_spools_everything(tmp_path: Path):
+    spool = OutputSpool(tmp_path, max_files=4)
+    text = "héllo wörld " * 10
+    capture = OutputCapture(limit=8, spool=spool)
+    for start in range(0, len(text.encode()), 5):
+        await capture.feed(text.encode()[start : start + 5])
+    await capture.close()
+
+    assert capture.truncated
+    assert capture.total == len(text.encode())
+    # "héllo w" is 8 bytes; nothing is cut mid-character.
+    assert capture.text == "héllo w"
+    assert capture.output_id is not None
+    assert "get_run_output" in capture.summary()
+    assert _read_all(spool, capture.output_id, 3) == text
+
+
+async def test_capture_within_limit_does_not_spool(tmp_path: Path):
+    spool = OutputSpool(tmp_path, max_files=4)
+    capture = OutputCapture(limit=100, spool=spool)
+    await capture.feed(b"short")
+    await capture.close()
+    assert (capture.text, capture.truncated, capture.output_id) == (
+        "short",
+        False,
+        None,
+    )
+    assert not list(tmp_path.iterdir())
+
+
+async def test_spool_keeps_only_recent_files(tmp_path: Path):
+    spool = OutputSpool(tmp_path, max_files=1)
+    first = OutputCapture(limit=1, spool=spool)
+    await first.feed(b"abc")
+    await first.close()
+    second = OutputCapture(limit=1, spool=spool)
+    await second.feed(b"def")
+    await second.close()
+    assert second.output_id is not None
+    assert spool.read(second.output_id).data == "def"
+    with pytest.raises(ValueError):
+        spool.read(str(first.output_id))
+
+
+async def test_large_input_is_passed_through_a_file(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_INPUT_FILE_THRESHOLD", "16")
+    small = await server.run_shortcut("Echo", "short")
+    large = await server.run_shortcut("Echo", {"text": "y" * 100})
+    assert small["output"] == "argv:short"
+    assert large["output"] == 'file:{"text": "' + "y" * 100 + '"}'
+
+    with pytest.raises(RuntimeError, match="too large for the URL scheme"):
+        await run_via_url_scheme("Echo", "y" * 100)
+
+
+async def test_long_output_is_truncated_and_readable_in_chunks(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    monkeypatch.setenv("SHORTCUTS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SHORTCUTS_MAX_OUTPUT_BYTES", "100")
+    result = await server.run_shortcut("Print 1000")
+    assert result["success"]
+    assert result["output_truncated"]
+    assert result["output_bytes"] == 1001
+    assert str(result["output"]).startswith("x" * 100 + "\n[output truncated")
+
+    output_id = str(result["output_id"])
+    parts: list[object] = []
+    offset: object = 0
+    while isinstance(offset, int):
+        chunk = await server.get_run_output(output_id, offset, 300)
+        parts.append(chunk["data"])
+        offset = chunk["next_offset"]
+    assert "".join(map(str, parts)) == "x" * 1000 + "\n"
+
+
+async def test_spools_sharing_a_directory_keep_each_others_files(tmp_path: Path):
+    orphan = tmp_path / "999999999-deadbeef"
+    orphan.mkdir()
+    (orphan / "old.out").write_bytes(b"old")
+
+    first = OutputSpool(tmp_path, max_files=4)
+    capture = OutputCapture(limit=1, spool=first)
+    await capture.feed(b"first")
+    await capture.close()
+    assert capture.output_id is not None
+
+    second = OutputSpool(tmp_path, max_files=4)
+    other = OutputCapture(limit=1, spool=second)
+    await other.feed(b"second")
+    await other.close()
+
+    assert first.read(capture.output_id).data == "first"
+    # Spool directories of exited processes are swept.
+    assert not orphan.exists()
+
+    first.close()
+    assert second.read(str(other.output_id)).data == "second"
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+async def test_spool_files_are_created_off_the_event_loop(tmp_path: Path):
+    threads: set[int] = set()
+
+    class RecordingSpool(OutputSpool):
+        def _create(self) -> tuple[str, BinaryIO]:
+            threads.add(threading.get_ident())
+            return super()._create()
+
+    capture = OutputCapture(limit=1, spool=RecordingSpool(tmp_path, max_files=4))
+    await capture.feed(b"spooled")
+    await capture.close()
+    assert threads and threading.get_ident() not in threads
@@ -1,6 +1,11 @@
 import plistlib
 
-from shortcuts_mcp.parser import action_types, parse_actions, parse_input_types
+from shortcuts_mcp.parser import (
+    ParsedActionsCache,
+    action_types,
+    parse_actions,
+    parse_input_types,
+)
 
 
 def _sample_plist() -> bytes:
@@ -50,3 +55,36 @@ def test_parse_actions_invalid_plist():
 def test_parse_input_types_invalid_plist():
     input_types = parse_input_types(b"not a plist")
     assert input_types is None
+
+
+def test_actions_cache_reuses_unchanged_shortcut():
+    cache = ParsedActionsCache(max_bytes=1_000_000)
+    data = _sample_plist()
+    first = cache.get_or_parse(1, "2024-01-01T00:00:00+00:00", data)
+    second = cache.get_or_parse(1, "2024-01-01T00:00:00+00:00", data)
+    assert first is second
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_actions_cache_replaces_modified_shortcut():
+    cache = ParsedActionsCache(max_bytes=1_000_000)
+    data = _sample_plist()
+    first = cache.get_or_parse(1, "2024-01-01T00:00:00+00:00", data)
+    second = cache.get_or_parse(1, "2024-02-01T00:00:00+00:00", data)
+    assert first is not second
+    assert cache.stats()["entries"] == 1
+
+
+def test_actions_cache_evicts_least_recently_used():
+    data = _sample_plist()
+    cache = ParsedActionsCache(max_bytes=(len(data) + 256) * 2)
+    cache.get_or_parse(1, "a", data)
+    cache.get_or_parse(2, "a", data)
+    cache.get_or_parse(1, "a", data)
+    cache.get_or_parse(3, "a", data)
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    cache.get_or_parse(1, "a", data)
+    assert cache.stats()["hits"] == 2
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.executor import run_via_url_scheme
+from shortcuts_mcp.processes import ProcessManager, process_manager
+
+# Starts a grandchild, ignores SIGTERM and prints its pid, then hangs.
+STUBBORN = """\
+import signal, subprocess, sys, time
+signal.signal(signal.SIGTERM, signal.SIG_IGN)
+child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+print(child.pid, flush=True)
+time.sleep(60)
+"""
+
+
+def _running(pid: int) -> bool:
+    """Whether ``pid`` exists and is not a zombie waiting for its parent."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    state = subprocess.run(
+        ["ps", "-o", "stat=", "-p", str(pid)], capture_output=True, text=True
+    ).stdout.strip()
+    return bool(state) and not state.startswith("Z")
+
+
+async def test_terminate_escalates_and_kills_the_whole_group():
+    manager = ProcessManager(grace_seconds=0.2)
+    process = await manager.spawn(sys.executable, "-c", STUBBORN)
+    assert process.stdout is not None
+    grandchild = int(await process.stdout.readline())
+    assert manager.live == 1
+
+    assert await manager.terminate(process) == -signal.SIGKILL
+    await asyncio.sleep(0.1)
+    assert not _running(grandchild)
+    assert manager.live == 0
+
+
+async def test_run_timeout_terminates_the_child():
+    manager = ProcessManager(grace_seconds=1)
+    with pytest.raises(asyncio.TimeoutError):
+        await manager.run(
+            sys.executable, "-c", "import time; time.sleep(60)", timeout=0.2
+        )
+    await asyncio.sleep(0)
+    assert manager.live == 0
+
+
+async def test_run_shortcut_timeout_leaves_no_children(fake_osascript: FakeOsascript):
+    result = await server.run_shortcut("Sleep 60", timeout=1)
+    assert result["output"] == "Timeout waiting for shortcut"
+    await asyncio.sleep(0)
+    assert process_manager.live == 0
+    assert [kind for kind, _, _ in fake_osascript.events()] == ["start"]
+
+
+async def test_url_scheme_runs_open_without_blocking(
+    fake_osascript: FakeOsascript, tmp_path: Path
+):
+    opener = tmp_path / "bin" / "open"
+    opener.write_text('#!/bin/sh\necho "cannot open $1" >&2\nexit 1\n')
+    opener.chmod(0o755)
+    with pytest.raises(RuntimeError, match="cannot open shortcuts://run-shortcut"):
+        await run_via_url_scheme("Test", {"a": 1}, timeout=5)
@@ -0,0 +1,105 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from shortcuts_mcp import server
+from shortcuts_mcp.profiling import ToolProfiler, profiler
+
+
+def _profiled(tool_profiler: ToolProfiler):
+    @tool_profiler.profile
+    async def slow_tool(delay: float = 0) -> int:
+        await asyncio.sleep(delay)
+        return sum(range(1000))
+
+    @tool_profiler.profile
+    async def other_tool() -> int:
+        return 1
+
+    return slow_tool, other_tool
+
+
+async def test_slow_calls_are_written_with_cpu_and_memory_profiles(tmp_path: Path):
+    tool_profiler = ToolProfiler(tmp_path, keep=10)
+    slow_tool, other_tool = _profiled(tool_profiler)
+    tool_profiler.configure(tools=["slow*"], mode="both", threshold_ms=0)
+
+    assert await slow_tool() == 499500
+    assert await other_tool() == 1
+
+    suffixes = sorted(name.split(".", 1)[1] for name in tool_profiler.recent())
+    assert suffixes == ["cpu.txt", "memory.txt", "prof"]
+    assert all("-slow_tool-" in name for name in tool_profiler.recent())
+
+
+async def test_threshold_and_sample_rate_skip_calls(tmp_path: Path):
+    tool_profiler = ToolProfiler(tmp_path, keep=10)
+    slow_tool, _ = _profiled(tool_profiler)
+
+    tool_profiler.configure(tools=["*"], threshold_ms=60_000)
+    await slow_tool()
+    tool_profiler.configure(threshold_ms=0, sample_rate=0)
+    await slow_tool()
+    assert tool_profiler.recent() == []
+
+    tool_profiler.configure(sample_rate=1, tools=[])
+    await slow_tool()
+    assert tool_profiler.recent() == []
+
+
+async def test_only_the_newest_captures_are_kept(tmp_path: Path):
+    tool_profiler = ToolProfiler(tmp_path, keep=2)
+    slow_tool, _ = _profiled(tool_profiler)
+    tool_profiler.configure(tools=["*"], mode="cpu", threshold_ms=0)
+    for delay in (0.001, 0.002, 0.003, 0.004):
+        await slow_tool(delay)
+
+    bases = {name.split(".", 1)[0] for name in tool_profiler.recent()}
+    assert len(bases) == 2
+
+
+async def test_pruning_leaves_unrelated_files_alone(tmp_path: Path):
+    # Sorts after every capture, so it would look like the newest one.
+    unrelated = tmp_path / "zz-notes.txt"
+    unrelated.write_text("keep me")
+    tool_profiler = ToolProfiler(tmp_path, keep=1)
+    slow_tool, _ = _profiled(tool_profiler)
+    tool_profiler.configure(tools=["*"], mode="cpu", threshold_ms=0)
+    await slow_tool()
+    await slow_tool(0.001)
+
+    assert unrelated.read_text() == "keep me"
+    recent = tool_profiler.recent()
+    assert "zz-notes.txt" not in recent
+    assert sorted(name.split(".", 1)[1] for name in recent) == ["cpu.txt", "prof"]
+
+
+async def test_configure_profiling_tool_overrides_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("SHORTCUTS_PROFILE", "get_*")
+    monkeypatch.setenv("SHORTCUTS_PROFILE_MODE", "bogus")
+    try:
+        result = await server.configure_profiling()
+        assert result["settings"] == {
+            "tools": ["get_*"],
+            "mode": "cpu",
+            "threshold_ms": 1000,
+            "sample_rate": 1.0,
+        }
+
+        result = await server.configure_profiling(
+            tools=["get_folders"], mode="memory", threshold_ms=0
+        )
+        assert result["directory"] == str(tmp_path)
+        await server.get_server_stats()
+        assert (await server.configure_profiling())["profiles"] == []
+        with pytest.raises(ValueError):
+            await server.configure_profiling(sample_rate=2)
+
+        result = await server.configure_profiling(reset=True)
+        assert result["settings"]["tools"] == ["get_*"]
+    finally:
+        profiler.reset()
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.models import RunResult
+from shortcuts_mcp.run_cache import CachePolicy, RunResultCache, parse_policies
+
+
+class Counter:
+    def __init__(self, success: bool = True) -> None:
+        self.calls = 0
+        self.success = success
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> RunResult:
+        self.calls += 1
+        await self.release.wait()
+        return RunResult(success=self.success, output=f"run {self.calls}")
+
+
+def test_parse_policies():
+    assert parse_policies("Convert *=600, Read Note,,Bad=x", 300) == [
+        CachePolicy("Convert *", 600),
+        CachePolicy("Read Note", 300),
+    ]
+
+
+async def test_caches_successes_by_name_and_canonical_input():
+    cache = RunResultCache([CachePolicy("convert *", 60)], max_entries=8)
+    run = Counter()
+    first = await cache.get_or_run("Convert Units", {"a": 1, "b": 2}, run)
+    second = await cache.get_or_run("Convert Units", {"b": 2, "a": 1}, run)
+    assert (first.output, first.cached) == ("run 1", False)
+    assert (second.output, second.cached) == ("run 1", True)
+
+    await cache.get_or_run("Convert Units", {"a": 2}, run)
+    await cache.get_or_run("Other", {"a": 1, "b": 2}, run)
+    await cache.get_or_run("Other", {"a": 1, "b": 2}, run)
+    assert run.calls == 4
+
+    failing = Counter(success=False)
+    await cache.get_or_run("Convert Fail", None, failing)
+    await cache.get_or_run("Convert Fail", None, failing)
+    assert failing.calls == 2
+
+
+async def test_entries_expire_and_are_bounded():
+    cache = RunResultCache([CachePolicy("*", 0.05)], max_entries=1)
+    run = Counter()
+    await cache.get_or_run("A", None, run)
+    await cache.get_or_run("B", None, run)
+    assert len(cache) == 1
+    await cache.get_or_run("A", None, run)
+    assert run.calls == 3
+
+    await asyncio.sleep(0.06)
+    await cache.get_or_run("A", None, run)
+    assert run.calls == 4
+
+
+async def test_concurrent_identical_runs_share_one_execution():
+    cache = RunResultCache([CachePolicy("*", 60)])
+    run = Counter()
+    run.release.clear()
+    callers = [asyncio.create_task(cache.get_or_run("A", 1, run)) for _ in range(3)]
+    await asyncio.sleep(0)
+    callers[0].cancel()
+    run.release.set()
+
+    results = await asyncio.gather(*callers[1:])
+    assert run.calls == 1
+    assert [result.output for result in results] == ["run 1", "run 1"]
+    with pytest.raises(asyncio.CancelledError):
+        await callers[0]
+
+
+async def test_run_shortcut_uses_the_cache_unless_bypassed(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_RUN_CACHE", "lookup *")
+    try:
+        results = [
+            await server.run_shortcut("Lookup Rate", "EUR"),
+            await server.run_shortcut("Lookup Rate", "EUR"),
+            await server.run_shortcut("Lookup Rate", "EUR", bypass_cache=True),
+        ]
+    finally:
+        server.run_cache.clear()
+    assert [result["cached"] for result in results] == [False, True, False]
+    starts = [event for event in fake_osascript.events() if event[0] == "start"]
+    assert len(starts) == 2
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.scheduler import RunQueueFullError, RunScheduler
+
+
+async def test_priority_then_arrival_order():
+    scheduler = RunScheduler(max_concurrent=1, max_queued=8)
+    await scheduler.acquire("first")
+    order: list[str] = []
+
+    async def run(name: str, priority: int) -> None:
+        await scheduler.acquire(name, priority)
+        order.append(name)
+        scheduler.release(name)
+
+    tasks = [
+        asyncio.create_task(run("low", 0)),
+        asyncio.create_task(run("high", 5)),
+        asyncio.create_task(run("low-2", 0)),
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 3
+    scheduler.release("first")
+    await asyncio.gather(*tasks)
+    assert order == ["high", "low", "low-2"]
+    assert (scheduler.running, scheduler.queued) == (0, 0)
+
+
+async def test_full_queue_rejects_and_cancelled_waiters_leave():
+    scheduler = RunScheduler(max_concurrent=1, max_queued=1)
+    await scheduler.acquire("a")
+    waiter = asyncio.create_task(scheduler.acquire("b"))
+    await asyncio.sleep(0)
+    with pytest.raises(RunQueueFullError):
+        await scheduler.acquire("c")
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert scheduler.queued == 0
+    scheduler.release("a")
+    await scheduler.acquire("c")
+    assert scheduler.running == 1
+
+
+async def test_run_shortcut_limits_concurrency(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_MAX_CONCURRENT_RUNS", "2")
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.2")
+    results = await asyncio.gather(
+        *(server.run_shortcut(f"Run {index}") for index in range(5))
+    )
+    assert [result["output"] for result in results] == [
+        f"Run {index}" for index in range(5)
+    ]
+    assert all(result["success"] for result in results)
+    assert fake_osascript.max_concurrent() == 2
+    waits: list[int] = []
+    for result in results:
+        wait = result["queue_wait_ms"]
+        assert isinstance(wait, int)
+        waits.append(wait)
+    waits.sort()
+    assert waits[:2] == [0, 0]
+    assert waits[-1] >= 200
+
+
+async def test_run_shortcut_serializes_same_name(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_SERIALIZE_RUNS", "1")
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.1")
+    results = await asyncio.gather(
+        *(server.run_shortcut(name) for name in ["Same", "Same", "Other"])
+    )
+    assert all(result["success"] for result in results)
+    assert fake_osascript.max_concurrent("Same") == 1
+    assert fake_osascript.max_concurrent() == 2
+
+
+async def test_run_shortcut_rejects_when_queue_is_full(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_MAX_CONCURRENT_RUNS", "1")
+    monkeypatch.setenv("SHORTCUTS_MAX_QUEUED_RUNS", "1")
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.2")
+    results = await asyncio.gather(
+        *(server.run_shortcut(f"Run {index}") for index in range(3))
+    )
+    assert [result["success"] for result in results] == [True, True, False]
+    assert str(results[2]["output"]).startswith("Run queue is full")
+    assert len(fake_osascript.events()) == 4
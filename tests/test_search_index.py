@@ -0,0 +1,82 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from conftest import write_shortcut
+
+from shortcuts_mcp import search_index
+from shortcuts_mcp.search_index import ActionSearchIndex
+
+
+async def test_index_refreshes_incrementally(shortcuts_db: Path, tmp_path: Path):
+    index = ActionSearchIndex(tmp_path / "index.sqlite")
+    assert await index.refresh() == 3
+    assert await index.refresh() == 0
+    assert await index.search("good morn") == [1]
+
+    conn = sqlite3.connect(shortcuts_db)
+    write_shortcut(
+        conn,
+        2,
+        "Send Email",
+        [("is.workflow.actions.sendemail", {"WFSendEmailActionSubject": "Morning"})],
+        modified=700_000_100.0,
+    )
+    conn.execute("DELETE FROM ZSHORTCUT WHERE Z_PK = 1")
+    conn.commit()
+    conn.close()
+
+    assert await index.refresh() == 1
+    assert await index.search("morning") == [2]
+    await index.close()
+
+
+async def test_failed_refresh_is_rolled_back(
+    shortcuts_db: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    index = ActionSearchIndex(tmp_path / "index.sqlite")
+    assert await index.refresh() == 3
+
+    conn = sqlite3.connect(shortcuts_db)
+    write_shortcut(
+        conn,
+        2,
+        "Send Email",
+        [("is.workflow.actions.comment", {"WFCommentActionText": "Later"})],
+        modified=700_000_100.0,
+    )
+    conn.commit()
+    conn.close()
+
+    def fail(*_: object) -> tuple[str, str]:
+        raise RuntimeError("parse failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(search_index, "action_index_text", fail)
+        with pytest.raises(RuntimeError):
+            await index.refresh()
+    # The stale row's delete was rolled back, not left pending.
+    assert await index.search("sendemail") == [2]
+
+    assert await index.refresh() == 1
+    assert await index.search("sendemail") == []
+    assert await index.search("later") == [2]
+    await index.close()
+
+
+async def test_index_ranks_and_matches_identifiers(shortcuts_db: Path):
+    index = ActionSearchIndex()
+    await index.refresh()
+    assert await index.search("sendemail") == [2]
+    assert await index.search("is.workflow", limit=1) != []
+    assert await index.search("Hi") == [2]
+    assert await index.search("no such text") == []
+    await index.close()
+
+
+async def test_index_rebuilds_corrupt_sidecar(shortcuts_db: Path, tmp_path: Path):
+    path = tmp_path / "index.sqlite"
+    path.write_bytes(b"not a database" * 100)
+    index = ActionSearchIndex(path)
+    assert await index.refresh() == 3
+    await index.close()
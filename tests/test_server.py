@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+
+from shortcuts_mcp import server
+
+
+async def test_list_shortcuts_with_actions(shortcuts_db: Path):
+    result = await server.list_shortcuts(include_actions=True)
+    by_name = {item["name"]: item for item in result["shortcuts"]}
+    assert by_name["Morning Routine"]["action_types"] == [
+        "is.workflow.actions.gettext",
+        "is.workflow.actions.delay",
+    ]
+    assert by_name["Empty"]["action_types"] is None
+
+
+async def test_search_shortcuts_in_actions(shortcuts_db: Path):
+    result = await server.search_shortcuts("good morning", search_in="actions")
+    assert [item["name"] for item in result["shortcuts"]] == ["Morning Routine"]
+
+
+async def test_list_shortcuts_pages_and_projects_fields(shortcuts_db: Path):
+    first = await server.list_shortcuts(limit=2, fields=["name"])
+    assert first["shortcuts"] == [{"name": "Empty"}, {"name": "Morning Routine"}]
+    cursor = first["next_cursor"]
+    assert isinstance(cursor, str)
+
+    rest = await server.list_shortcuts(cursor=cursor, fields=["name", "action_types"])
+    assert rest["shortcuts"] == [
+        {"name": "Send Email", "action_types": ["is.workflow.actions.sendemail"]}
+    ]
+    assert rest["next_cursor"] is None
+
+
+async def test_search_shortcuts_by_name_is_fuzzy(shortcuts_db: Path):
+    result = await server.search_shortcuts("routine mornin")
+    assert [item["name"] for item in result["shortcuts"]] == ["Morning Routine"]
+    assert 0 < result["shortcuts"][0]["score"] <= 1
+
+
+async def test_search_shortcuts_with_blank_query_lists_all(shortcuts_db: Path):
+    result = await server.search_shortcuts("")
+    assert [item["name"] for item in result["shortcuts"]] == [
+        "Empty",
+        "Morning Routine",
+        "Send Email",
+    ]
+
+
+async def test_get_available_actions_rejects_empty_pages():
+    with pytest.raises(ValueError):
+        await server.get_available_actions(limit=0)
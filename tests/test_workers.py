@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from conftest import FakeOsascript
+
+from shortcuts_mcp import server
+from shortcuts_mcp.workers import OsascriptWorker, OsascriptWorkerPool, WorkerError
+
+
+def _spawns(fake_osascript: FakeOsascript) -> int:
+    return sum(1 for kind, _, _ in fake_osascript.events() if kind == "spawn")
+
+
+async def test_pool_reuses_workers(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("FAKE_OSASCRIPT_DELAY", "0.1")
+    pool = OsascriptWorkerPool(size=2)
+    try:
+        sequential = [await pool.run(f"Run {index}", index) for index in range(3)]
+        assert _spawns(fake_osascript) == 1
+        parallel = await asyncio.gather(
+            *(pool.run(f"Par {index}") for index in range(4))
+        )
+    finally:
+        await pool.close()
+    assert [run.output for run in sequential] == ["Run 0", "Run 1", "Run 2"]
+    assert [run.output for run in parallel] == [f"Par {i}" for i in range(4)]
+    assert all(run.returncode == 0 for run in sequential + parallel)
+    assert _spawns(fake_osascript) == 2
+    assert fake_osascript.max_concurrent() == 2
+
+
+async def test_pool_replaces_crashed_and_interrupted_workers(
+    fake_osascript: FakeOsascript,
+):
+    pool = OsascriptWorkerPool(size=1)
+    try:
+        with pytest.raises(WorkerError):
+            await pool.run("Crash")
+        after_crash = await pool.run("After crash")
+        assert (after_crash.output, after_crash.returncode) == ("After crash", 0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.run("Sleep 5"), 0.1)
+        after_timeout = await pool.run("After timeout")
+        assert after_timeout.output == "After timeout"
+        assert pool.spawned == 3
+    finally:
+        await pool.close()
+
+
+async def test_worker_ping(fake_osascript: FakeOsascript):
+    worker = OsascriptWorker()
+    await worker.start()
+    assert await worker.ping()
+    await worker.stop()
+    assert not await worker.ping()
+
+
+async def test_run_shortcut_uses_workers_when_enabled(
+    fake_osascript: FakeOsascript, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("SHORTCUTS_RUN_WORKERS", "1")
+    monkeypatch.setenv("FAKE_OSASCRIPT_EXIT", "1")
+    try:
+        results = [await server.run_shortcut(name) for name in ["One", "Two"]]
+    finally:
+        await server.worker_pool.close()
+    assert [result["success"] for result in results] == [False, False]
+    assert [result["output"] for result in results] == ["failed", "failed"]
+    assert _spawns(fake_osascript) == 1